@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for StructuredLogger.
+
+Measures the cost seen by agent code (log() call latency and throughput)
+and the end-to-end cost including batch writes, for sync and async modes.
+
+Usage:
+    python -m rkl_logging.bench_logging [--records N] [--batch-size N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from rkl_logging.structured_logger import StructuredLogger
+from rkl_logging.utils.hashing import sha256_text
+
+
+def make_record(i: int) -> dict:
+    """Typical execution_context record (as emitted by OllamaClient.generate)."""
+    return {
+        "session_id": f"bench-{i // 100}",
+        "turn_id": i,
+        "agent_id": "summarizer",
+        "model_id": "llama3.2:8b",
+        "model_rev": "8b",
+        "quant": "q4",
+        "temp": 0.3,
+        "top_p": 0.95,
+        "ctx_tokens_used": 2000 + i % 500,
+        "gen_tokens": 150 + i % 50,
+        "tool_lat_ms": 1200 + i % 300,
+        "prompt_id_hash": sha256_text(f"prompt {i % 10}"),
+        "token_estimation": "api",
+        "artifact_id": sha256_text(f"article {i // 3}"),
+    }
+
+
+def bench(label: str, records: list, batch_size: int, **logger_kwargs) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=batch_size,
+            auto_manifest=False,
+            **logger_kwargs
+        )
+        start = time.perf_counter()
+        for record in records:
+            logger.log("execution_context", record)
+        log_s = time.perf_counter() - start
+        logger.close()
+        total_s = time.perf_counter() - start
+
+        latency = logger.get_latency_stats()
+        print(
+            f"{label:<16} log() p50 {latency['p50_us']:6.2f}us  p99 {latency['p99_us']:7.2f}us  "
+            f"{len(records) / log_s:9.0f} rec/s in log()  "
+            f"{len(records) / total_s:9.0f} rec/s incl. writes"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StructuredLogger microbenchmarks")
+    parser.add_argument("--records", type=int, default=50000, help="Records per run (default: 50000)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Logger batch size (default: 100)")
+    args = parser.parse_args()
+
+    records = [make_record(i) for i in range(args.records)]
+    print(f"{args.records} execution_context records, batch_size={args.batch_size}")
+    bench("warm-up", records[:1000], args.batch_size)
+    bench("sync", records, args.batch_size, validate_schema=False)
+    bench("sync+validate", records, args.batch_size, validate_schema=True)
+    bench("async", records, args.batch_size, validate_schema=False,
+          async_mode=True, queue_size=args.records)
+
+
+if __name__ == "__main__":
+    main()
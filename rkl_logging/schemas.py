@@ -0,0 +1,458 @@
+"""
+Schema registry for RKL telemetry artifacts.
+
+Every artifact the pipeline emits has an entry in SCHEMAS with:
+- version: Schema version ("v1.0", ...)
+- artifact_type: Directory name the artifact is written under
+- required_fields: Fields that must be present and non-null in every record
+- field_types: Logical type per known field (see FIELD_TYPES)
+
+Logical types map to Arrow types, so the logger writes every file of an
+artifact with the same column types. Nested fields ("any") are not pinned
+here; their Arrow type is inferred from the first batch that contains them.
+
+Validation is compiled once per artifact (get_validator) and runs per batch:
+- validate_batch: Columnar check of an Arrow table (or list of records),
+  used by StructuredLogger at flush time
+- validate_record: Single-record check (tests, ad-hoc use)
+
+The Phase 0 design names (agent_graph, boundary_events) are kept alongside
+the names the pipeline emits (reasoning_graph_edge, boundary_event).
+
+Type III Note: Schemas describe structural telemetry; raw text only appears
+in the explicitly named preview/rationale fields, which privacy helpers
+hash or drop before publication.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Logical type -> accepted Python types (for record validation)
+FIELD_TYPES = {
+    "string": (str,),
+    "int": (int,),
+    "float": (int, float),
+    "bool": (bool,),
+    "list<string>": (list, tuple),
+    "any": (object,),
+}
+
+if ARROW_AVAILABLE:
+    ARROW_TYPES = {
+        "string": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "list<string>": pa.list_(pa.string()),
+    }
+else:
+    ARROW_TYPES = {}
+
+# Added to every record by StructuredLogger
+COMMON_FIELD_TYPES = {
+    "rkl_version": "string",
+    "timestamp": "string",
+    "type3_compliant": "bool",
+}
+
+_EDGE_FIELDS = {
+    "edge_id": "string",
+    "session_id": "string",
+    "timestamp": "string",
+    "t": "int",
+    "from_agent": "string",
+    "to_agent": "string",
+    "msg_type": "string",
+    "intent_tag": "string",
+    "content_hash": "string",
+    "decision_rationale": "string",
+    "payload_summary": "string",
+    "artifact_id": "string",
+    "parent_edge_id": "string",
+    "role_tags": "list<string>",
+    "latency_ms": "int",
+    "retry_count": "int",
+}
+
+_BOUNDARY_FIELDS = {
+    "event_id": "string",
+    "timestamp": "string",
+    "t": "int",
+    "session_id": "string",
+    "agent_id": "string",
+    "rule_id": "string",
+    "trigger_tag": "string",
+    "context_tag": "string",
+    "action": "string",
+    "reviewer": "string",
+    "severity": "string",
+}
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "execution_context": {
+        "version": "v1.2",
+        "artifact_type": "execution_context",
+        "description": "One model call: model, sampling settings, token counts, latency",
+        "required_fields": ["session_id", "turn_id", "agent_id", "model_id", "timestamp"],
+        "field_types": {
+            "timestamp": "string",
+            "session_id": "string",
+            "turn_id": "int",
+            "agent_id": "string",
+            "model_id": "string",
+            "model_rev": "string",
+            "quant": "string",
+            "temp": "float",
+            "top_p": "float",
+            "seed": "int",
+            "ctx_tokens_used": "int",
+            "gen_tokens": "int",
+            "tool_lat_ms": "int",
+            "cache_hit": "bool",
+            "prompt_id_hash": "string",
+            "system_prompt_hash": "string",
+            "token_estimation": "string",
+            "prompt_preview": "string",
+            "response_preview": "string",
+            "artifact_id": "string",
+            "rate_limit_wait_ms": "int",
+            "prefix_cache_mode": "string",
+            "prefix_tokens_saved": "int",
+            "pipeline_phase": "string",
+            "care_metadata": "any",
+        },
+    },
+    "agent_graph": {
+        "version": "v1.0",
+        "artifact_type": "agent_graph",
+        "description": "Phase 0 design name for agent-to-agent message edges",
+        "required_fields": ["edge_id", "session_id", "from_agent", "to_agent", "msg_type"],
+        "field_types": dict(_EDGE_FIELDS),
+    },
+    "reasoning_graph_edge": {
+        "version": "v1.1",
+        "artifact_type": "reasoning_graph_edge",
+        "description": "Agent-to-agent message edge (routing, hand-offs)",
+        "required_fields": ["edge_id", "session_id", "from_agent", "to_agent", "msg_type", "t"],
+        "field_types": dict(_EDGE_FIELDS),
+    },
+    "boundary_events": {
+        "version": "v1.0",
+        "artifact_type": "boundary_events",
+        "description": "Phase 0 design name for Type III boundary checks",
+        "required_fields": ["event_id", "rule_id", "action"],
+        "field_types": dict(_BOUNDARY_FIELDS),
+    },
+    "boundary_event": {
+        "version": "v1.1",
+        "artifact_type": "boundary_event",
+        "description": "Type III boundary check (local processing, external API, publication)",
+        "required_fields": ["event_id", "t", "session_id", "rule_id", "action"],
+        "field_types": dict(_BOUNDARY_FIELDS),
+    },
+    "governance_ledger": {
+        "version": "v1.1",
+        "artifact_type": "governance_ledger",
+        "description": "Publication record: what was released, by which agents, with what checks",
+        "required_fields": ["publish_id", "artifact_ids", "type3_verified"],
+        "field_types": {
+            "timestamp": "string",
+            "publish_id": "string",
+            "artifact_ids": "list<string>",
+            "contributing_agent_ids": "list<string>",
+            "verification_hashes": "list<string>",
+            "type3_verified": "bool",
+            "raw_data_exposed": "bool",
+            "derived_insights_only": "bool",
+            "raw_data_handling": "any",
+            "human_signoff_id": "string",
+            "release_commit_sha": "string",
+            "quality_score": "float",
+            "care_compliance_verified": "bool",
+            "schema_version": "int",
+        },
+    },
+    "secure_reasoning_trace": {
+        "version": "v1.0",
+        "artifact_type": "secure_reasoning_trace",
+        "description": "Per-article reasoning steps (act/verify) with input/output hashes",
+        "required_fields": ["session_id", "task_id", "steps"],
+        "field_types": {
+            "session_id": "string",
+            "task_id": "string",
+            "turn_id": "int",
+            "steps": "any",
+        },
+    },
+    "quality_trajectories": {
+        "version": "v1.1",
+        "artifact_type": "quality_trajectories",
+        "description": "Quality scores per artifact version",
+        "required_fields": ["session_id", "artifact_id", "score_name", "score"],
+        "field_types": {
+            "session_id": "string",
+            "artifact_id": "string",
+            "version": "int",
+            "score_name": "string",
+            "score": "float",
+            "evaluator_id": "string",
+            "reason_tag": "string",
+            "time_to_next_version": "int",
+            "quality_dimensions": "any",
+            "metrics": "any",
+        },
+    },
+    "hallucination_matrix": {
+        "version": "v1.3",
+        "artifact_type": "hallucination_matrix",
+        "description": "QA verdict per article (Gemini, local pre-screen or relevance gate)",
+        "required_fields": ["session_id", "artifact_id", "verdict", "method"],
+        "field_types": {
+            "session_id": "string",
+            "artifact_id": "string",
+            "verdict": "string",
+            "method": "string",
+            "confidence": "float",
+            "error_type": "string",
+            "notes": "string",
+            "theme_score": "float",
+            "theme_verdict": "string",
+            "theme_threshold": "float",
+            "relevance_pred": "float",
+            "relevance_gate": "string",
+            "qa_batch_size": "int",
+            "cache_hit": "bool",
+            "qa_model": "string",
+            "parse_ok": "bool",
+            "qa_tier": "string",
+            "prescreen_confidence": "float",
+            "prescreen_relevance": "float",
+        },
+    },
+    "retrieval_provenance": {
+        "version": "v1.0",
+        "artifact_type": "retrieval_provenance",
+        "description": "Per-feed candidate and selected article hashes",
+        "required_fields": ["session_id", "feed_name"],
+        "field_types": {
+            "session_id": "string",
+            "feed_name": "string",
+            "feed_url_hash": "string",
+            "candidate_count": "int",
+            "selected_count": "int",
+            "candidate_hashes": "list<string>",
+            "selected_hashes": "list<string>",
+            "cutoff_date": "string",
+            "category": "string",
+        },
+    },
+    "hedge_events": {
+        "version": "v1.0",
+        "artifact_type": "hedge_events",
+        "description": "Hedged Gemini/Ollama request outcome",
+        "required_fields": ["event_id", "t", "session_id", "winner"],
+        "field_types": {
+            "event_id": "string",
+            "timestamp": "string",
+            "t": "int",
+            "session_id": "string",
+            "agent_id": "string",
+            "task_type": "string",
+            "primary": "string",
+            "secondary": "string",
+            "hedge_delay_ms": "int",
+            "hedged": "bool",
+            "winner": "string",
+            "latency_ms": "int",
+            "primary_latency_ms": "int",
+            "primary_ok": "bool",
+            "saved_ms": "int",
+        },
+    },
+    "human_interventions": {
+        "version": "v1.0",
+        "artifact_type": "human_interventions",
+        "description": "Operator actions during reruns and approvals",
+        "required_fields": ["session_id", "event_id", "t", "intervention_type"],
+        "field_types": {
+            "session_id": "string",
+            "event_id": "string",
+            "t": "int",
+            "human_role": "string",
+            "intervention_type": "string",
+            "target_turn_id": "int",
+            "delta_metrics": "any",
+            "rationale_tag": "string",
+        },
+    },
+    "system_state": {
+        "version": "v1.1",
+        "artifact_type": "system_state",
+        "description": "Host metrics snapshot per pipeline stage",
+        "required_fields": ["session_id", "stage"],
+        "field_types": {
+            "session_id": "string",
+            "stage": "string",
+            "host": "string",
+            "platform": "string",
+            "cpu_percent": "float",
+            "load1": "float",
+            "load5": "float",
+            "load15": "float",
+            "mem_total_bytes": "int",
+            "mem_used_bytes": "int",
+            "mem_free_bytes": "int",
+            "mem_percent": "float",
+            "pipeline_status": "string",
+            "current_phase": "string",
+            "gpus": "any",
+            "gpu_count": "int",
+            "driver_version": "string",
+            "disk_io": "any",
+            "net_io": "any",
+            "proc_cpu_percent": "float",
+            "proc_mem_bytes": "any",
+        },
+    },
+    "failure_snapshots": {
+        "version": "v1.0",
+        "artifact_type": "failure_snapshots",
+        "description": "Pipeline abort record (e.g., empty summaries)",
+        "required_fields": ["session_id", "reason"],
+        "field_types": {
+            "session_id": "string",
+            "reason": "string",
+            "failed_count": "int",
+            "failed_titles": "list<string>",
+        },
+    },
+}
+
+
+class CompiledSchema:
+    """
+    Validator for one artifact, built once from its SCHEMAS entry.
+
+    Attributes:
+        artifact_type (str): Artifact name
+        required (Tuple[str, ...]): Required field names
+        logical_types (Dict[str, str]): Logical type per known field (incl. common fields)
+        arrow_types (Dict[str, pa.DataType]): Pinned Arrow type per typed field
+    """
+
+    def __init__(self, artifact_type: str, spec: Dict[str, Any]):
+        self.artifact_type = artifact_type
+        self.required = tuple(spec["required_fields"])
+        self.logical_types = {**COMMON_FIELD_TYPES, **spec["field_types"]}
+        self.arrow_types = {
+            name: ARROW_TYPES[logical]
+            for name, logical in self.logical_types.items()
+            if logical in ARROW_TYPES
+        }
+        self._python_types = {
+            name: FIELD_TYPES[logical]
+            for name, logical in self.logical_types.items()
+            if logical != "any"
+        }
+
+    def validate_record(self, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        errors = [f"missing required field: {name}" for name in self.required if record.get(name) is None]
+        for name, value in record.items():
+            expected = self._python_types.get(name)
+            if expected is None or value is None:
+                continue
+            # bool is an int subclass; only accept it where a bool is expected
+            if not isinstance(value, expected) or (isinstance(value, bool) and bool not in expected):
+                errors.append(
+                    f"{name}: expected {self.logical_types[name]}, got {type(value).__name__}"
+                )
+        return not errors, errors
+
+    def validate_table(self, table: "pa.Table") -> Tuple[bool, List[str]]:
+        """Columnar check: required columns present and non-null, typed columns match."""
+        errors = []
+        names = set(table.column_names)
+        for name in self.required:
+            if name not in names:
+                errors.append(f"missing required field: {name} ({table.num_rows} rows)")
+            elif table.column(name).null_count:
+                errors.append(f"missing required field: {name} ({table.column(name).null_count} rows)")
+        for field in table.schema:
+            expected = self.arrow_types.get(field.name)
+            if expected is not None and not arrow_type_matches(field.type, expected):
+                errors.append(f"{field.name}: expected {self.logical_types[field.name]}, got {field.type}")
+        return not errors, errors
+
+
+def arrow_type_matches(actual: "pa.DataType", expected: "pa.DataType") -> bool:
+    """Whether a column of `actual` type holds valid values for a pinned type (as FIELD_TYPES: int is a float)."""
+    if actual.equals(expected) or pa.types.is_null(actual):
+        return True
+    if pa.types.is_floating(expected) and pa.types.is_integer(actual):
+        return True
+    if pa.types.is_list(expected) and pa.types.is_list(actual):
+        return arrow_type_matches(actual.value_type, expected.value_type)
+    return False
+
+
+@lru_cache(maxsize=None)
+def get_validator(artifact_type: str) -> Optional[CompiledSchema]:
+    """Return the compiled validator for an artifact (None if unregistered)."""
+    spec = SCHEMAS.get(artifact_type)
+    return CompiledSchema(artifact_type, spec) if spec else None
+
+
+def arrow_field_types(artifact_type: str) -> Dict[str, Any]:
+    """Pinned Arrow types for an artifact's typed fields (common fields for unregistered ones)."""
+    validator = get_validator(artifact_type)
+    if validator is not None:
+        return validator.arrow_types
+    return {name: ARROW_TYPES[logical] for name, logical in COMMON_FIELD_TYPES.items() if logical in ARROW_TYPES}
+
+
+def validate_record(artifact_type: str, record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Validate one record against its artifact schema.
+
+    Args:
+        artifact_type: Artifact name (e.g., "execution_context")
+        record: Record dictionary
+
+    Returns:
+        (is_valid, errors). Unregistered artifacts are always valid.
+    """
+    validator = get_validator(artifact_type)
+    if validator is None:
+        return True, []
+    return validator.validate_record(record)
+
+
+def validate_batch(artifact_type: str, batch: Any) -> Tuple[bool, List[str]]:
+    """
+    Validate a whole batch at once.
+
+    Args:
+        artifact_type: Artifact name
+        batch: pyarrow Table (checked column-wise) or list of record dicts
+
+    Returns:
+        (is_valid, errors) with one error per failing field, not per row
+    """
+    validator = get_validator(artifact_type)
+    if validator is None:
+        return True, []
+    if ARROW_AVAILABLE and isinstance(batch, pa.Table):
+        return validator.validate_table(batch)
+
+    errors: List[str] = []
+    for record in batch:
+        for error in validator.validate_record(record)[1]:
+            if error not in errors:
+                errors.append(error)
+    return not errors, errors
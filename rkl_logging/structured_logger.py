@@ -3,29 +3,133 @@ Core StructuredLogger implementation.
 
 Lightweight structured logger with:
 - Batched writes to Parquet or NDJSON
+- Optional background writer thread (async mode)
 - Date/artifact partitioning
 - Automatic manifest generation
 - Schema validation
 - Sampling support
+- Lazy record factories and a process-wide off switch
 """
 
+import hashlib
 import json
 import os
-import hashlib
-from datetime import datetime
+import random
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from collections import defaultdict
+from typing import Callable, Dict, Any, Iterable, Optional, List, Sequence, Union
+from collections import defaultdict, deque
+from functools import lru_cache
+import itertools
 import threading
 import atexit
 
-# Try to import Parquet support
+from .schemas import arrow_field_types, arrow_type_matches, validate_batch
+
+# Try to import Parquet support (pyarrow only; pandas is not needed to write)
 try:
-    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
     PARQUET_AVAILABLE = True
 except ImportError:
     PARQUET_AVAILABLE = False
 
+# Cross-process lock for manifest merges (POSIX only)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Process-wide telemetry switch (RKL_TELEMETRY=0/false/no/off disables it);
+# when off, log() returns before doing any work
+TELEMETRY_ENABLED = os.getenv("RKL_TELEMETRY", "true").lower() not in ("0", "false", "no", "off")
+
+# Record fields used as the sampling key, first present wins
+SAMPLE_KEY_FIELDS = ("session_id", "artifact_id")
+
+# What log() does when the async queue is full
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_new")
+
+# Suffix of files still being written; readers and compaction skip them
+OPEN_SUFFIX = ".open"
+
+# Process-wide file sequence: with the pid it makes output names unique even
+# across several loggers writing the same base_dir
+_file_seq = itertools.count(1)
+
+# Format of the "timestamp" field added to records that do not carry one
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def set_telemetry_enabled(enabled: bool) -> None:
+    """Turn telemetry on or off for every StructuredLogger in the process."""
+    global TELEMETRY_ENABLED
+    TELEMETRY_ENABLED = bool(enabled)
+
+
+def telemetry_enabled() -> bool:
+    """Whether telemetry is on process-wide."""
+    return TELEMETRY_ENABLED
+
+
+@lru_cache(maxsize=65536)
+def _sample_point(key: str) -> float:
+    """Deterministic point in [0, 1) for a sampling key (same in every process)."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2.0 ** 64
+
+
+def _record_size(record: Dict[str, Any]) -> int:
+    """Cheap estimate of a record's buffered size in bytes (strings by length, other values 8)."""
+    size = 0
+    for key, value in record.items():
+        size += len(key) + (len(value) if isinstance(value, str) else 8)
+    return size
+
+
+def _format_timestamps(epochs: List[int]) -> "pa.Array":
+    """Format epoch microseconds as TIMESTAMP_FORMAT strings, column-wise."""
+    # Cast gives "YYYY-MM-DD HH:MM:SS.ffffff"; much cheaper than pc.strftime
+    text = pa.array(epochs, type=pa.timestamp("us")).cast(pa.string())
+    text = pc.utf8_replace_slice(text, 10, 11, "T")
+    return pc.binary_join_element_wise(text, pa.scalar("Z"), pa.scalar(""))
+
+
+class _RollingFile:
+    """
+    One output file that batches are appended to until it is rotated.
+
+    Parquet files keep a ParquetWriter open (one row group per batch); NDJSON
+    files keep a text handle open. Both are written as `{name}.open` and
+    renamed to `{name}` on close, because a Parquet file is unreadable until
+    its footer is written.
+    """
+
+    def __init__(self, path: Path, day: str, schema: Optional["pa.Schema"]):
+        self.path = path
+        self.open_path = path.with_name(path.name + OPEN_SUFFIX)
+        self.day = day
+        self.schema = schema
+        self.opened_at = time.time()
+        self.written_at = self.opened_at
+        if schema is not None:
+            self.handle = pq.ParquetWriter(str(self.open_path), schema)
+        else:
+            self.handle = open(self.open_path, "w")
+
+    def size(self) -> int:
+        try:
+            return self.open_path.stat().st_size
+        except OSError:
+            return 0
+
+    def close(self) -> None:
+        self.handle.close()
+        os.replace(self.open_path, self.path)
+
 
 class StructuredLogger:
     """
@@ -33,11 +137,58 @@ class StructuredLogger:
 
     Features:
     - Batched writes (configurable batch size)
-    - Parquet (preferred) or NDJSON (fallback)
+    - Parquet via pyarrow (preferred) or NDJSON (fallback)
+    - Stable column types: registry-typed columns (schemas.SCHEMAS) always
+      use that type; other columns keep their type across batches and are
+      widened, never truncated, when a batch needs more (new struct fields,
+      int -> float, a first all-null batch); widening rotates the file
     - Date/artifact partitioning
-    - Schema validation (optional)
-    - Sampling support
+    - Schema validation (optional): compiled per artifact and run once per
+      batch at write time, never per record in log()
+    - Session-coherent sampling (see below)
     - Automatic manifest generation
+    - Async mode: log() only enqueues; a writer thread does all disk I/O
+
+    Async mode:
+    - Records go into a bounded queue (queue_size) drained by one writer
+      thread, so agent threads never wait on Parquet encoding or the disk
+    - When the queue is full, backpressure decides: "block" (wait for room),
+      "drop_oldest" (evict the oldest queued record) or "drop_new" (discard
+      the incoming record); drops are counted per artifact in get_stats()
+    - flush() and close() first wait for everything enqueued before the call
+      to reach the buffers, so they still write every accepted record
+
+    Sampling:
+    - Keyed on the record's session_id (else artifact_id; see
+      sample_key_fields): a key is kept for an artifact when a hash of the
+      key, mapped to [0, 1), is below the artifact's rate
+    - Every record of a kept session is kept, across artifacts, processes
+      and runs, so joins (e.g. execution_context to reasoning_graph_edge)
+      survive; lower-rate artifacts keep a subset of the sessions kept at
+      higher rates
+    - Records without a key are sampled independently at random
+
+    Output files:
+    - Each artifact has one open file per process; every batch is appended
+      to it (a Parquet row group or a run of NDJSON lines)
+    - Files are named {artifact}_{HHMMSS}_{pid}_{seq}.{parquet|ndjson}, so
+      concurrent processes and quick successive rotations never collide
+    - While open the file carries a ".open" suffix; it is renamed when
+      rotated (rotate_bytes reached, rotate_interval_s elapsed, UTC day or
+      column set changed) or when the logger is closed
+    - A process killed before close() leaves its ".open" file behind;
+      Parquet files in that state have no footer and cannot be read
+
+    Flush triggers (per artifact; scalar or {artifact: value} dict):
+    - batch_size records buffered
+    - max_buffer_bytes of buffered records (estimated from field sizes)
+    - flush_interval_s since the oldest buffered record
+    A timer thread enforces flush_interval_s and finalizes the file it wrote
+    to, so a timed flush is readable on disk even if the process is killed
+    before close(); at most flush_interval_s of a quiet artifact is at risk.
+    Files that took full batches and then went idle for flush_interval_s are
+    finalized the same way. The timer also finalizes files older than
+    rotate_interval_s.
 
     Example:
         logger = StructuredLogger(
@@ -63,7 +214,15 @@ class StructuredLogger:
         batch_size: int = 100,
         sampling: Optional[Dict[str, float]] = None,
         auto_manifest: bool = True,
-        validate_schema: bool = True
+        validate_schema: bool = True,
+        async_mode: bool = False,
+        queue_size: int = 10000,
+        backpressure: str = "block",
+        rotate_bytes: int = 64 * 1024 * 1024,
+        rotate_interval_s: float = 3600.0,
+        flush_interval_s: Optional[Union[float, Dict[str, float]]] = None,
+        max_buffer_bytes: Optional[Union[int, Dict[str, int]]] = None,
+        sample_key_fields: Iterable[str] = SAMPLE_KEY_FIELDS
     ):
         """
         Initialize StructuredLogger.
@@ -75,44 +234,130 @@ class StructuredLogger:
             batch_size: Records to buffer before writing
             sampling: Sampling rates per artifact (default: 1.0 for all)
             auto_manifest: Auto-generate daily manifests
-            validate_schema: Enable schema validation
+            validate_schema: Validate each written batch (warnings only)
+            async_mode: Write from a background thread instead of the caller
+            queue_size: Max records waiting for the writer thread (async mode)
+            backpressure: Full-queue policy: "block", "drop_oldest" or "drop_new"
+            rotate_bytes: Finalize an output file once it reaches this size
+            rotate_interval_s: Finalize an output file once it is this old
+            flush_interval_s: Max seconds a record waits before it is written
+                to a finalized (crash-safe) file
+            max_buffer_bytes: Flush an artifact once its buffer reaches this size
+            sample_key_fields: Record fields that key sampling, first present wins
         """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"backpressure must be one of {BACKPRESSURE_POLICIES}, got {backpressure!r}")
+
         self.base_dir = Path(base_dir)
         self.rkl_version = rkl_version
         self.type3_enforcement = type3_enforcement
         self.batch_size = batch_size
         self.sampling = sampling or {}
+        self.sample_key_fields = tuple(sample_key_fields)
         self.auto_manifest = auto_manifest
         self.validate_schema = validate_schema
+        self.async_mode = async_mode
+        self.queue_size = max(1, queue_size)
+        self.backpressure = backpressure
+        self.rotate_bytes = rotate_bytes
+        self.rotate_interval_s = rotate_interval_s
+        self.flush_interval_s = flush_interval_s
+        self.max_buffer_bytes = max_buffer_bytes
 
         # Buffers for batching
         self._buffers: Dict[str, List[Dict]] = defaultdict(list)
+        self._buffer_epochs: Dict[str, List[int]] = defaultdict(list)  # log() time per record, epoch us
         self._lock = threading.Lock()
+        self._buffer_bytes: Dict[str, int] = defaultdict(int)
+        self._buffer_since: Dict[str, float] = {}  # monotonic time of oldest buffered record
 
         # Track statistics for manifest
         self._stats: Dict[str, Dict[str, int]] = defaultdict(
-            lambda: {"rows": 0, "writes": 0}
+            lambda: {"rows": 0, "writes": 0, "coerced_nulls": 0}
         )
 
+        # Counts already merged into the daily manifest by this logger
+        self._manifest_reported: Dict[str, Dict[str, int]] = {}
+
+        # Current Arrow schema per artifact (see _to_arrow)
+        self._arrow_schemas: Dict[str, Any] = {}
+
+        # Open output file per artifact
+        self._files: Dict[str, _RollingFile] = {}
+
+        # log() latency samples (seconds) for get_latency_stats()
+        self._latencies = deque(maxlen=10000)
+
+        # Async mode: bounded queue drained by a writer thread. _enqueued and
+        # _drained are sequence counters that let flush() wait for the writer.
+        self._queue = deque()
+        self._queue_cond = threading.Condition()
+        self._enqueued = 0
+        self._drained = 0
+        self._dropped: Dict[str, int] = defaultdict(int)
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+
+        # Timer thread for flush_interval_s / rotate_interval_s
+        self._timer_stop = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.async_mode:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="rkl-log-writer", daemon=True
+            )
+            self._writer.start()
+
+        if flush_interval_s or rotate_interval_s:
+            self._timer = threading.Thread(
+                target=self._timer_loop, name="rkl-log-timer", daemon=True
+            )
+            self._timer.start()
+
         # Register cleanup
         atexit.register(self.close)
 
+    def enabled(self, artifact_type: str, sample_key: Optional[str] = None) -> bool:
+        """
+        Fast check whether records of this artifact can be kept.
+
+        False when telemetry is off process-wide or the artifact's sampling
+        rate is 0. With a sample_key (e.g. the session id) the answer is the
+        exact sampling decision for that key; without one, partial sampling
+        rates return True.
+        """
+        if not TELEMETRY_ENABLED:
+            return False
+        if sample_key is None:
+            return self.sampling.get(artifact_type, 1.0) > 0.0
+        return self._should_sample(artifact_type, sample_key)
+
     def log(
         self,
         artifact_type: str,
-        record: Dict[str, Any],
-        force_write: bool = False
+        record: Union[Dict[str, Any], Callable[[], Optional[Dict[str, Any]]]],
+        force_write: bool = False,
+        sample_key: Optional[str] = None
     ) -> None:
         """
         Log a structured record.
 
+        The record is buffered as-is (not copied); RKL metadata (rkl_version,
+        timestamp, type3_compliant) is attached when the batch is written.
+        Do not modify the dict after passing it in.
+
         Args:
             artifact_type: Type of artifact (e.g., "execution_context")
-            record: Record dictionary
+            record: Record dictionary, or a zero-arg callable returning one
+                (called only if telemetry is on and the record is sampled
+                in; returning None skips the record)
             force_write: Skip batching, write immediately
+            sample_key: Sampling key (default: the record's session_id or
+                artifact_id). Pass it with a factory so partially sampled
+                artifacts decide before the record is built.
 
         Example:
             logger.log("execution_context", {
@@ -121,28 +366,165 @@ class StructuredLogger:
                 "model_id": "llama3.2:8b",
                 ...
             })
+
+            # Hashing only happens for sampled-in records
+            logger.log("retrieval_provenance", lambda: {
+                "candidate_hashes": [sha256_text(link) for link in links],
+                ...
+            }, sample_key=session_id)
         """
-        # Apply sampling
-        if not self._should_sample(artifact_type):
+        if not TELEMETRY_ENABLED:
             return
 
-        # Add RKL metadata
-        enriched_record = self._enrich_record(record)
-
-        # Validate schema (optional)
-        if self.validate_schema:
-            self._validate_record(artifact_type, enriched_record)
-
-        with self._lock:
-            self._buffers[artifact_type].append(enriched_record)
-            self._stats[artifact_type]["rows"] += 1
+        start = time.perf_counter()
+        try:
+            # Apply sampling (a keyless factory is built first to find its key)
+            if sample_key is None and 0.0 < self.sampling.get(artifact_type, 1.0) < 1.0:
+                if callable(record):
+                    record = record()
+                    if record is None:
+                        return
+                sample_key = self._sample_key(record)
+            if not self._should_sample(artifact_type, sample_key):
+                return
+
+            if callable(record):
+                record = record()
+                if record is None:
+                    return
+
+            # Log time; formatted into "timestamp" at write time
+            epoch_us = time.time_ns() // 1000
+
+            # The unlocked _stopping read is only a fast path; _enqueue re-checks
+            # it under _queue_cond and refuses records once close() has begun
+            if (self._writer is None or self._stopping
+                    or not self._enqueue(artifact_type, record, epoch_us, force_write)):
+                with self._lock:
+                    self._buffer_record(artifact_type, record, epoch_us, force_write)
+        finally:
+            self._latencies.append(time.perf_counter() - start)
+
+    def _buffer_record(self, artifact_type: str, record: Dict[str, Any], epoch_us: int,
+                       force_write: bool) -> None:
+        """Append one record to its buffer, writing the batch if full (caller holds _lock)."""
+        buffer = self._buffers[artifact_type]
+        if not buffer:
+            self._buffer_since[artifact_type] = time.monotonic()
+        buffer.append(record)
+        self._buffer_epochs[artifact_type].append(epoch_us)
+        self._stats[artifact_type]["rows"] += 1
+        self._buffer_bytes[artifact_type] += _record_size(record)
+
+        # Write batch if full (by count or size) or forced
+        max_bytes = self._policy(self.max_buffer_bytes, artifact_type)
+        if (force_write
+                or len(buffer) >= self.batch_size
+                or (max_bytes and self._buffer_bytes[artifact_type] >= max_bytes)):
+            self._write_batch(artifact_type)
+
+    @staticmethod
+    def _policy(setting: Union[None, float, Dict[str, float]], artifact_type: str) -> Optional[float]:
+        """Resolve a scalar-or-per-artifact setting for one artifact."""
+        if isinstance(setting, dict):
+            return setting.get(artifact_type)
+        return setting
+
+    def _timer_loop(self) -> None:
+        """Timer thread: flush and finalize buffers past flush_interval_s, finalize files past rotate_interval_s."""
+        intervals = [self.rotate_interval_s]
+        if isinstance(self.flush_interval_s, dict):
+            intervals.extend(self.flush_interval_s.values())
+        elif self.flush_interval_s:
+            intervals.append(self.flush_interval_s)
+        tick = max(min(i for i in intervals if i) / 4.0, 0.05)
+
+        while not self._timer_stop.wait(tick):
+            now = time.monotonic()
+            try:
+                with self._lock:
+                    for artifact_type, since in list(self._buffer_since.items()):
+                        interval = self._policy(self.flush_interval_s, artifact_type)
+                        if interval and now - since >= interval:
+                            self._write_batch(artifact_type)
+                            # A Parquet file is unreadable until its footer is written
+                            self._finalize(artifact_type)
+                    for artifact_type, current in list(self._files.items()):
+                        interval = self._policy(self.flush_interval_s, artifact_type)
+                        if (time.time() - current.opened_at >= self.rotate_interval_s
+                                or (interval and time.time() - current.written_at >= interval)):
+                            self._finalize(artifact_type)
+            except Exception as e:
+                print(f"WARNING: Timed flush failed: {e}")
+
+    def _enqueue(self, artifact_type: str, record: Dict[str, Any], epoch_us: int,
+                 force_write: bool) -> bool:
+        """
+        Hand a record to the writer thread, applying the backpressure policy.
 
-            # Write batch if full or forced
-            if force_write or len(self._buffers[artifact_type]) >= self.batch_size:
-                self._write_batch(artifact_type)
+        Returns False, without taking the record, once close() has stopped
+        the writer; the caller then buffers it inline.
+        """
+        with self._queue_cond:
+            while len(self._queue) >= self.queue_size and not self._stopping:
+                if self.backpressure == "drop_new":
+                    self._dropped[artifact_type] += 1
+                    return True
+                if self.backpressure == "drop_oldest":
+                    evicted = self._queue.popleft()
+                    self._dropped[evicted[0]] += 1
+                    self._drained += 1  # Counts as handled, so flush() does not wait for it
+                    break
+                self._queue_cond.wait()
+            if self._stopping:
+                return False
+            self._queue.append((artifact_type, record, epoch_us, force_write))
+            self._enqueued += 1
+            self._queue_cond.notify_all()
+            return True
 
-    def _should_sample(self, artifact_type: str) -> bool:
-        """Check if record should be sampled based on sampling rate."""
+    def _writer_loop(self) -> None:
+        """Writer thread: move queued records into buffers and write full batches."""
+        while True:
+            with self._queue_cond:
+                while not self._queue and not self._stopping:
+                    self._queue_cond.wait()
+                if not self._queue:
+                    return
+                items = list(self._queue)
+                self._queue.clear()
+                self._queue_cond.notify_all()  # Room for blocked producers
+
+            with self._lock:
+                for artifact_type, record, epoch_us, force_write in items:
+                    try:
+                        self._buffer_record(artifact_type, record, epoch_us, force_write)
+                    except Exception as e:
+                        print(f"WARNING: Background write failed for {artifact_type}: {e}")
+
+            with self._queue_cond:
+                self._drained += len(items)
+                self._queue_cond.notify_all()
+
+    def _drain_queue(self) -> None:
+        """Wait until every record enqueued so far has reached the buffers."""
+        if self._writer is None:
+            return
+        with self._queue_cond:
+            target = self._enqueued
+            while self._drained < target and self._writer.is_alive():
+                self._queue_cond.wait(timeout=0.1)
+
+    def _sample_key(self, record: Dict[str, Any]) -> Optional[str]:
+        """The record's sampling key: its first non-empty sample_key_fields value."""
+        for field in self.sample_key_fields:
+            value = record.get(field)
+            if value:
+                return str(value)
+        return None
+
+    def _should_sample(self, artifact_type: str, sample_key: Optional[str] = None) -> bool:
+        """Check if record should be sampled based on sampling rate and key."""
         rate = self.sampling.get(artifact_type, 1.0)  # Default 100%
 
         if rate >= 1.0:
@@ -150,83 +532,245 @@ class StructuredLogger:
         if rate <= 0.0:
             return False
 
-        import random
-        return random.random() < rate
-
-    def _enrich_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """Add RKL-specific metadata to record."""
-        enriched = record.copy()
-
-        # Add RKL context if not present
-        if "rkl_version" not in enriched:
-            enriched["rkl_version"] = self.rkl_version
-
-        if "timestamp" not in enriched:
-            enriched["timestamp"] = datetime.utcnow().isoformat() + "Z"
-
-        if self.type3_enforcement and "type3_compliant" not in enriched:
-            enriched["type3_compliant"] = True  # Assume compliant unless stated
-
+        if sample_key is None:
+            return random.random() < rate
+        return _sample_point(sample_key) < rate
+
+    def _metadata_defaults(self) -> Dict[str, Any]:
+        """RKL metadata constants attached to records that do not set them."""
+        defaults = {"rkl_version": self.rkl_version}
+        if self.type3_enforcement:
+            defaults["type3_compliant"] = True  # Assume compliant unless stated
+        return defaults
+
+    def _enrich_records(self, records: List[Dict], epochs: List[int]) -> List[Dict]:
+        """Copy records with RKL metadata added (NDJSON path; Parquet uses _to_arrow)."""
+        defaults = self._metadata_defaults()
+        enriched = []
+        for record, epoch_us in zip(records, epochs):
+            out = dict(record)
+            for key, value in defaults.items():
+                out.setdefault(key, value)
+            if "timestamp" not in out:
+                seconds, micros = divmod(epoch_us, 1_000_000)
+                when = datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=micros)
+                out["timestamp"] = when.strftime(TIMESTAMP_FORMAT)
+            enriched.append(out)
         return enriched
 
-    def _validate_record(self, artifact_type: str, record: Dict[str, Any]) -> None:
-        """Validate record against schema."""
-        from .schemas import validate_record
-
-        valid, errors = validate_record(artifact_type, record)
-        if not valid:
+    def _validate_batch(self, artifact_type: str, batch: Any, errors: Sequence[str] = ()) -> None:
+        """Validate a batch (Arrow table or records) against its schema, plus errors found upstream."""
+        valid, found = validate_batch(artifact_type, batch)
+        errors = list(errors) + found
+        if errors:
             print(f"WARNING: Schema validation failed for {artifact_type}: {errors}")
             # Don't block logging, just warn
 
     def _write_batch(self, artifact_type: str) -> None:
-        """Write buffered records to disk."""
+        """Append buffered records to the artifact's open file, rotating as needed."""
         if not self._buffers[artifact_type]:
             return
 
         records = self._buffers[artifact_type]
+        epochs = self._buffer_epochs[artifact_type]
         self._buffers[artifact_type] = []  # Clear buffer
+        self._buffer_epochs[artifact_type] = []
+        self._buffer_bytes[artifact_type] = 0
+        self._buffer_since.pop(artifact_type, None)
 
-        # Determine output path with date partitioning
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        year, month, day = today.split("-")
-
-        output_dir = self.base_dir / artifact_type / year / month / day
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write to Parquet or NDJSON
-        timestamp = datetime.utcnow().strftime("%H%M%S")
+        # Date partition of the file these records go to
+        day = datetime.utcnow().strftime("%Y-%m-%d")
 
         if PARQUET_AVAILABLE:
-            output_file = output_dir / f"{artifact_type}_{timestamp}.parquet"
-            self._write_parquet(output_file, records)
+            table = self._to_arrow(artifact_type, records, epochs)  # Validates as logged
+            output = self._open_file(artifact_type, day, table.schema)
+            output.handle.write_table(table)
         else:
-            output_file = output_dir / f"{artifact_type}_{timestamp}.ndjson"
-            self._write_ndjson(output_file, records)
+            records = self._enrich_records(records, epochs)
+            if self.validate_schema:
+                self._validate_batch(artifact_type, records)
+            output = self._open_file(artifact_type, day, None)
+            output.handle.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+            output.handle.flush()
 
         self._stats[artifact_type]["writes"] += 1
+        output.written_at = time.time()
+
+        if output.size() >= self.rotate_bytes:
+            self._finalize(artifact_type)
+
+    def _open_file(self, artifact_type: str, day: str, schema: Optional["pa.Schema"]) -> "_RollingFile":
+        """Return the artifact's current file, rotating on day, age or schema change."""
+        current = self._files.get(artifact_type)
+        if current is not None and (
+            current.day != day
+            or time.time() - current.opened_at >= self.rotate_interval_s
+            or (schema is not None and not current.schema.equals(schema))
+        ):
+            self._finalize(artifact_type)
+            current = None
+
+        if current is None:
+            year, month, dd = day.split("-")
+            output_dir = self.base_dir / artifact_type / year / month / dd
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            timestamp = datetime.utcnow().strftime("%H%M%S")
+            suffix = "parquet" if schema is not None else "ndjson"
+            path = output_dir / f"{artifact_type}_{timestamp}_{os.getpid()}_{next(_file_seq):04d}.{suffix}"
+            current = _RollingFile(path, day, schema)
+            self._files[artifact_type] = current
+        return current
+
+    def _finalize(self, artifact_type: str) -> None:
+        """Close the artifact's open file and publish it under its final name."""
+        current = self._files.pop(artifact_type, None)
+        if current is not None:
+            current.close()
+
+    def _to_arrow(self, artifact_type: str, records: List[Dict], epochs: List[int]) -> "pa.Table":
+        """
+        Build an Arrow table for a batch and update the artifact's schema.
+
+        Column order follows first appearance, then the metadata columns.
+        Columns typed in the schema registry are conformed to that type. Other
+        columns keep the type of earlier batches when the batch fits it, and
+        are widened otherwise (null -> any type, int -> float, struct fields
+        and list item types merged); values that cannot share a type fall back
+        to string. A widened schema rotates the output file (_open_file), so
+        no batch is cast into a narrower type.
+
+        RKL metadata is filled in column-wise: constants as a broadcast scalar
+        and timestamps formatted from the log-time epochs, both only where a
+        record does not set the field itself.
+
+        With validate_schema, the batch is validated with registry-typed
+        columns as they were logged (before conforming), so a value of the
+        wrong type is reported rather than silently cast or nulled.
+        """
+        metadata: Dict[str, Any] = {
+            name: pa.scalar(value) for name, value in self._metadata_defaults().items()
+        }
+        metadata["timestamp"] = _format_timestamps(epochs)
+
+        current = self._arrow_schemas.get(artifact_type)
+        names = list(current.names) if current is not None else []
+        seen = set(names)
+        for record in itertools.chain(records, [metadata]):
+            for name in record:
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+
+        registry_types = arrow_field_types(artifact_type)
+        fields = []
+        columns = []
+        as_logged: Dict[str, "pa.Array"] = {}  # Registry-typed columns whose logged type differs
+        type_errors: List[str] = []
+        for name in names:
+            values = [r.get(name) for r in records]
+            arrow_type = registry_types.get(name)
+            if arrow_type is None:
+                known = current.field(name).type if current is not None and name in current.names else None
+                column, arrow_type = self._infer_column(values, known)
+            elif self.validate_schema:
+                try:
+                    column = pa.array(values)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                    column = None
+                    found = sorted({type(v).__name__ for v in values if v is not None})
+                    type_errors.append(f"{name}: expected {arrow_type}, got mixed {'/'.join(found)}")
+                if column is not None and not arrow_type_matches(column.type, arrow_type):
+                    as_logged[name] = column
+            else:
+                column = None
+            field = pa.field(name, arrow_type)
+            if column is None or not column.type.equals(arrow_type):
+                try:
+                    column = pa.array(values, type=arrow_type)
+                except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                    column = self._coerce_column(artifact_type, field, values)
+            default = metadata.get(name)
+            if default is not None and column.null_count:
+                try:
+                    column = pc.coalesce(column, default.cast(arrow_type))
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    pass  # Column type cannot hold the default; leave nulls
+            fields.append(field)
+            columns.append(column)
+
+        schema = pa.schema(fields)
+        self._arrow_schemas[artifact_type] = schema
+        table = pa.Table.from_arrays(columns, schema=schema)
+        if self.validate_schema:
+            logged = table
+            for name, column in as_logged.items():
+                logged = logged.set_column(schema.get_field_index(name), name, column)
+            self._validate_batch(artifact_type, logged, type_errors)
+        return table
+
+    @staticmethod
+    def _infer_column(values: List[Any], known: Optional["pa.DataType"]) -> tuple:
+        """
+        Infer a batch column and the type to write it as.
 
-    def _write_parquet(self, file_path: Path, records: List[Dict]) -> None:
-        """Write records to Parquet file."""
-        df = pd.DataFrame(records)
+        Returns (array or None, type): the type is `known` widened to hold
+        the batch; the array is None when the values have no common type
+        (they are then written as string).
+        """
+        try:
+            column = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            return None, pa.string()
+        inferred = column.type
+        if known is None or pa.types.is_null(inferred) or known.equals(inferred):
+            return column, known if known is not None else inferred
+        if pa.types.is_null(known):
+            return column, inferred
         try:
-            df.to_parquet(file_path, index=False, engine="pyarrow")
-        except ImportError:
-            # Fallback to default engine if pyarrow not available
-            df.to_parquet(file_path, index=False)
+            widened = pa.unify_schemas(
+                [pa.schema([("c", known)]), pa.schema([("c", inferred)])],
+                promote_options="permissive"
+            ).field("c").type
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            widened = pa.string()
+        return column, widened
+
+    def _coerce_column(self, artifact_type: str, field: "pa.Field", values: List[Any]) -> "pa.Array":
+        """
+        Convert values that do not match the pinned type.
 
-    def _write_ndjson(self, file_path: Path, records: List[Dict]) -> None:
-        """Write records to NDJSON file."""
-        with open(file_path, "w") as f:
-            for record in records:
-                f.write(json.dumps(record) + "\n")
+        Unconvertible values become null and are counted in get_stats()
+        (coerced_nulls).
+        """
+        if pa.types.is_string(field.type):
+            return pa.array(
+                [v if v is None or isinstance(v, str) else json.dumps(v, default=str) for v in values],
+                type=field.type
+            )
+
+        coerced = []
+        nulled = 0
+        for value in values:
+            try:
+                coerced.append(pa.array([value]).cast(field.type)[0].as_py())
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, OverflowError):
+                coerced.append(None)
+                nulled += 1
+        self._stats[artifact_type]["coerced_nulls"] += nulled
+        return pa.array(coerced, type=field.type)
 
     def flush(self, artifact_type: Optional[str] = None) -> None:
         """
         Flush buffered records to disk.
 
+        Records are appended to each artifact's open file; readers see them
+        once that file is finalized (rotation or close()).
+
         Args:
             artifact_type: Specific artifact to flush, or None for all
         """
+        self._drain_queue()
         with self._lock:
             if artifact_type:
                 self._write_batch(artifact_type)
@@ -236,11 +780,26 @@ class StructuredLogger:
 
     def close(self) -> None:
         """
-        Close logger and flush all remaining records.
+        Close logger, flush all remaining records and finalize open files.
 
-        Also generates manifest if auto_manifest is True.
+        Also generates manifest if auto_manifest is True. In async mode the
+        writer thread is drained and stopped first; later log() calls write
+        inline (to new files, finalized by the next close()).
         """
+        if self._writer is not None:
+            with self._queue_cond:
+                self._stopping = True
+                self._queue_cond.notify_all()
+            self._writer.join()
+
+        if self._timer is not None:
+            self._timer_stop.set()
+            self._timer.join()
+
         self.flush()
+        with self._lock:
+            for atype in list(self._files):
+                self._finalize(atype)
 
         if self.auto_manifest:
             self._generate_manifest()
@@ -250,14 +809,48 @@ class StructuredLogger:
         Generate daily manifest with statistics.
 
         CRITICAL: Merges with existing manifest instead of overwriting.
-        This allows multiple processes per day to accumulate stats correctly.
+        This allows multiple processes per day to accumulate stats correctly:
+        - The read-merge-write runs under an exclusive fcntl lock on
+          manifests/{date}.json.lock, so concurrent closers never lose
+          increments (without fcntl the merge is unlocked, as before)
+        - Only counts not yet reported by this logger are added, so calling
+          close() more than once (explicitly and via atexit) never double counts
+        - The tmp file name is unique per process and thread
         """
+        with self._lock:
+            deltas = {}
+            for artifact, stats in self._stats.items():
+                reported = self._manifest_reported.get(artifact, {"rows": 0, "writes": 0})
+                delta = {key: int(stats[key]) - reported[key] for key in ("rows", "writes")}
+                if delta["rows"] or delta["writes"]:
+                    deltas[artifact] = delta
+        if not deltas:
+            return
+
         today = datetime.utcnow().strftime("%Y-%m-%d")
         manifest_dir = self.base_dir / "manifests"
         manifest_dir.mkdir(parents=True, exist_ok=True)
 
         manifest_path = manifest_dir / f"{today}.json"
+        lock_path = manifest_dir / f"{today}.json.lock"
+
+        with open(lock_path, "a") as lock_file:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                self._merge_manifest(manifest_path, today, deltas)
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
+        with self._lock:
+            for artifact, delta in deltas.items():
+                reported = self._manifest_reported.setdefault(artifact, {"rows": 0, "writes": 0})
+                reported["rows"] += delta["rows"]
+                reported["writes"] += delta["writes"]
+
+    def _merge_manifest(self, manifest_path: Path, today: str, deltas: Dict[str, Dict[str, int]]) -> None:
+        """Add count deltas to the manifest file (caller holds the manifest lock)."""
         # Load existing manifest if present (merge instead of overwrite)
         existing = {
             "date": today,
@@ -274,8 +867,8 @@ class StructuredLogger:
                 import logging
                 logging.warning(f"Could not load existing manifest {manifest_path}, starting fresh")
 
-        # Merge: add this process's stats to existing counts
-        for artifact, stats in self._stats.items():
+        # Merge: add this process's new counts to existing counts
+        for artifact, delta in deltas.items():
             if artifact not in existing["artifacts"]:
                 existing["artifacts"][artifact] = {
                     "rows": 0,
@@ -283,31 +876,63 @@ class StructuredLogger:
                     "schema_version": "v1.0"
                 }
 
-            # Accumulate counts from this process
             prev = existing["artifacts"][artifact]
-            prev["rows"] = int(prev.get("rows", 0)) + int(stats["rows"])
-            prev["writes"] = int(prev.get("writes", 0)) + int(stats["writes"])
+            prev["rows"] = int(prev.get("rows", 0)) + delta["rows"]
+            prev["writes"] = int(prev.get("writes", 0)) + delta["writes"]
             prev["schema_version"] = "v1.0"
 
         # Update timestamp
         existing["generated_at"] = datetime.utcnow().isoformat() + "Z"
         existing["rkl_version"] = self.rkl_version
 
-        # Atomic write: tmp file + rename (prevents corruption from interrupted writes)
-        tmp_path = manifest_path.with_suffix(".json.tmp")
+        # Atomic write: unique tmp file + rename (prevents corruption from interrupted writes)
+        tmp_path = manifest_path.with_name(
+            f"{manifest_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         with open(tmp_path, "w") as f:
             f.write(json.dumps(existing, indent=2))
 
         # Atomic rename (OS-level atomic operation)
-        import os
         os.replace(tmp_path, manifest_path)
 
     def get_stats(self) -> Dict[str, Dict[str, int]]:
-        """Get logging statistics."""
-        return dict(self._stats)
+        """
+        Get logging statistics.
 
+        Returns:
+            Per artifact: rows buffered, batch writes, values written as null
+            because they could not be converted to the registry type
+            (coerced_nulls), records dropped by async backpressure, and
+            estimated bytes currently buffered in memory
+        """
+        with self._queue_cond:
+            dropped = dict(self._dropped)
+        with self._lock:
+            buffered = dict(self._buffer_bytes)
+            stats = {}
+            for artifact in set(self._stats) | set(dropped):
+                stats[artifact] = dict(self._stats.get(artifact, {"rows": 0, "writes": 0, "coerced_nulls": 0}))
+                stats[artifact]["dropped"] = dropped.get(artifact, 0)
+                stats[artifact]["buffered_bytes"] = buffered.get(artifact, 0)
+        return stats
+
+    def get_latency_stats(self) -> Dict[str, float]:
+        """
+        Get log() call latency over the most recent calls (up to 10,000).
 
-# Convenience function
-def sha256_text(text: str) -> str:
-    """Generate SHA-256 hash of text for privacy-preserving content fingerprinting."""
-    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+        Returns:
+            Dict with count, p50_us, p99_us and max_us (microseconds)
+        """
+        samples = sorted(self._latencies)
+        if not samples:
+            return {"count": 0, "p50_us": 0.0, "p99_us": 0.0, "max_us": 0.0}
+
+        def percentile(q: float) -> float:
+            return samples[min(int(q * len(samples)), len(samples) - 1)] * 1e6
+
+        return {
+            "count": len(samples),
+            "p50_us": percentile(0.50),
+            "p99_us": percentile(0.99),
+            "max_us": samples[-1] * 1e6
+        }
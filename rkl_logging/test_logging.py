@@ -23,12 +23,25 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 # Now we can import as a package
-from rkl_logging.structured_logger import StructuredLogger
+from rkl_logging.structured_logger import StructuredLogger, set_telemetry_enabled, PARQUET_AVAILABLE
 from rkl_logging.utils.hashing import sha256_text, sha256_dict
 from rkl_logging.schemas import SCHEMAS, validate_record
 from rkl_logging.utils.privacy import sanitize_for_research, anonymize_for_public
 
 
+def read_rows(base_dir, artifact_type):
+    """Read back every finalized row of an artifact (Parquet or NDJSON), oldest file first."""
+    rows = []
+    for path in sorted((Path(base_dir) / artifact_type).rglob("*")):
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+            rows.extend(pq.read_table(path).to_pylist())
+        elif path.suffix == ".ndjson":
+            with open(path) as f:
+                rows.extend(json.loads(line) for line in f if line.strip())
+    return rows
+
+
 def test_schema_registry():
     """Test that all Phase 0 schemas are registered."""
     required_schemas = [
@@ -181,6 +194,54 @@ def test_basic_logging():
         print(f"✓ Basic logging: {len(files)} file(s) written to {date_path}")
 
 
+def test_write_time_enrichment():
+    """Test the RKL metadata attached at write time, on the Parquet and NDJSON paths."""
+    import time
+    from datetime import datetime, timedelta, timezone
+    import rkl_logging.structured_logger as structured_logger
+
+    def parse(ts):
+        return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
+
+    paths = [True, False] if PARQUET_AVAILABLE else [False]
+    columns = {}
+    for parquet in paths:
+        structured_logger.PARQUET_AVAILABLE = parquet
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                logger = StructuredLogger(base_dir=tmpdir, rkl_version="9.9", batch_size=100,
+                                          auto_manifest=False, validate_schema=False)
+                before = datetime.now(timezone.utc)
+                logger.log("execution_context", {"session_id": "test", "turn_id": 1})
+                after = datetime.now(timezone.utc)
+                logger.log("execution_context", {"session_id": "test", "turn_id": 2,
+                                                 "timestamp": "2025-01-01T00:00:00Z",
+                                                 "type3_compliant": False})
+                time.sleep(0.2)  # Write happens well after log time
+                logger.close()
+
+                rows = read_rows(tmpdir, "execution_context")
+        finally:
+            structured_logger.PARQUET_AVAILABLE = PARQUET_AVAILABLE
+
+        label = "Parquet" if parquet else "NDJSON"
+        assert len(rows) == 2, f"{label}: expected 2 rows, got {len(rows)}"
+        first, second = sorted(rows, key=lambda r: r["turn_id"])
+        assert first["rkl_version"] == "9.9" and second["rkl_version"] == "9.9"
+        assert first["type3_compliant"] is True
+        assert second["type3_compliant"] is False, f"{label}: record's own type3_compliant overwritten"
+        stamped = parse(first["timestamp"])
+        slack = timedelta(milliseconds=1)  # Clock rounding; the write is 200 ms later
+        assert before - slack <= stamped <= after + slack, \
+            f"{label}: timestamp {first['timestamp']} not taken at log time"
+        assert second["timestamp"] == "2025-01-01T00:00:00Z", f"{label}: record's own timestamp overwritten"
+        columns[label] = set(first)
+
+    if len(columns) == 2:
+        assert columns["Parquet"] == columns["NDJSON"], f"Paths differ: {columns}"
+    print(f"✓ Write-time enrichment: metadata and log-time timestamps on {', '.join(columns)}")
+
+
 def test_sampling():
     """Test sampling behavior."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -229,6 +290,76 @@ def test_sampling():
         print("✓ Sampling: 0% drops all, 100% keeps all")
 
 
+def test_session_sampling():
+    """Test that sampling keeps whole sessions across artifacts."""
+    rates = {"execution_context": 0.5, "reasoning_graph_edge": 0.5, "boundary_event": 0.2}
+    kept = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            sampling=rates,
+            batch_size=10000,
+            auto_manifest=False,
+            validate_schema=False
+        )
+        for artifact_type in rates:
+            for i in range(400):
+                logger.log(artifact_type, {"session_id": f"s{i}", "turn_id": 1})
+                logger.log(artifact_type, {"session_id": f"s{i}", "turn_id": 2})
+            kept[artifact_type] = [r["session_id"] for r in logger._buffers[artifact_type]]
+        logger.close()
+
+    sessions = {artifact_type: set(ids) for artifact_type, ids in kept.items()}
+    for artifact_type, ids in kept.items():
+        assert len(ids) == 2 * len(sessions[artifact_type]), \
+            f"{artifact_type}: a session kept only some of its records"
+    assert sessions["execution_context"] == sessions["reasoning_graph_edge"], \
+        "Equal rates must keep the same sessions"
+    assert sessions["boundary_event"] <= sessions["execution_context"], \
+        "Lower rates must keep a subset of the sessions"
+    assert 120 <= len(sessions["execution_context"]) <= 280
+    print(f"✓ Session sampling: {len(sessions['execution_context'])}/400 sessions kept whole, joins intact")
+
+
+def test_lazy_records():
+    """Test record factories and the process-wide telemetry switch."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return {"session_id": "test", "turn_id": len(calls)}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            sampling={"execution_context": 0.0},
+            auto_manifest=False
+        )
+
+        assert not logger.enabled("execution_context")
+        assert logger.enabled("agent_graph")
+        logger.log("execution_context", factory)
+        assert not calls, "Factory called for a sampled-out artifact"
+
+        logger.log("agent_graph", factory)
+        logger.log("agent_graph", lambda: None)  # Factory opts out
+        assert len(calls) == 1
+        print("✓ Factories run only for sampled-in records")
+
+        set_telemetry_enabled(False)
+        try:
+            assert not logger.enabled("agent_graph")
+            logger.log("agent_graph", factory)
+            logger.log("agent_graph", {"session_id": "test"})
+        finally:
+            set_telemetry_enabled(True)
+        assert len(calls) == 1
+        print("✓ Telemetry switch: off skips all records")
+
+        logger.close()
+        assert logger.get_stats()["agent_graph"]["rows"] == 1
+
+
 def test_manifest_generation():
     """Test that manifests track statistics correctly."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -257,6 +388,329 @@ def test_manifest_generation():
         print(f"✓ Manifest: {stats['rows']} rows, {stats['writes']} writes")
 
 
+def read_manifest_rows(base_dir, artifact_type):
+    """Rows for an artifact summed over the daily manifests."""
+    total = 0
+    for path in (Path(base_dir) / "manifests").glob("*.json"):
+        with open(path) as f:
+            total += json.load(f)["artifacts"].get(artifact_type, {}).get("rows", 0)
+    return total
+
+
+def test_manifest_exact_counts():
+    """Test that repeated close() calls and several closers give exact manifest counts."""
+    import threading
+
+    # close() explicitly, then again as atexit would
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=5, validate_schema=False)
+        for i in range(12):
+            logger.log("execution_context", {"session_id": "test", "turn_id": i})
+        logger.close()
+        logger.close()
+        assert read_manifest_rows(tmpdir, "execution_context") == 12, "Second close() double counted"
+
+        # Records logged after close() are added once by the next close()
+        for i in range(3):
+            logger.log("execution_context", {"session_id": "test", "turn_id": 12 + i})
+        logger.close()
+        logger.close()
+        assert read_manifest_rows(tmpdir, "execution_context") == 15
+        print("✓ Manifest: repeated close() counts each row once")
+
+    # Several loggers closing against the same date at the same time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        counts = [7, 11, 13, 17]
+        loggers = [StructuredLogger(base_dir=tmpdir, batch_size=5, validate_schema=False) for _ in counts]
+        for logger, count in zip(loggers, counts):
+            for i in range(count):
+                logger.log("execution_context", {"session_id": "test", "turn_id": i})
+                logger.log("boundary_event", {"session_id": "test", "turn_id": i})
+
+        start = threading.Barrier(len(loggers))
+
+        def close(logger):
+            start.wait()
+            logger.close()
+
+        threads = [threading.Thread(target=close, args=(logger,)) for logger in loggers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for artifact_type in ("execution_context", "boundary_event"):
+            assert read_manifest_rows(tmpdir, artifact_type) == sum(counts), \
+                f"{artifact_type}: manifest lost or repeated increments"
+        assert not list((Path(tmpdir) / "manifests").glob("*.tmp")), "Manifest tmp files left behind"
+        print(f"✓ Manifest: {len(loggers)} concurrent closers sum to {sum(counts)} rows")
+
+
+def test_async_logging():
+    """Test that async mode writes every record and reports latency."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=10,
+            async_mode=True,
+            queue_size=100
+        )
+
+        for i in range(25):
+            logger.log("execution_context", {
+                "session_id": "test",
+                "turn_id": i,
+                "agent_id": "test",
+                "model_id": "test"
+            })
+
+        logger.close()
+
+        stats = logger.get_stats()["execution_context"]
+        assert stats["rows"] == 25, f"Wrong row count after close: {stats['rows']}"
+        assert stats["dropped"] == 0, f"Block policy dropped records: {stats['dropped']}"
+        assert stats["writes"] == 3, f"Expected 3 writes (10 + 10 + flush): {stats['writes']}"
+
+        latency = logger.get_latency_stats()
+        assert latency["count"] == 25, f"Wrong latency sample count: {latency['count']}"
+        assert latency["p99_us"] >= latency["p50_us"] > 0
+
+        print(f"✓ Async logging: 25 rows, p99 log() {latency['p99_us']:.1f}us")
+
+
+def test_async_backpressure():
+    """Test that drop policies bound the queue and count what they drop."""
+    for policy in ("drop_new", "drop_oldest"):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = StructuredLogger(
+                base_dir=tmpdir,
+                batch_size=100,
+                async_mode=True,
+                queue_size=5,
+                backpressure=policy
+            )
+
+            # Holding the buffer lock stalls the writer thread, so the queue fills
+            with logger._lock:
+                for i in range(20):
+                    logger.log("execution_context", {"session_id": "test", "turn_id": i})
+
+            logger.close()
+
+            stats = logger.get_stats()["execution_context"]
+            assert stats["dropped"] >= 10, f"{policy}: expected drops, got {stats['dropped']}"
+            assert stats["rows"] + stats["dropped"] == 20, f"{policy}: records lost: {stats}"
+
+            print(f"✓ Backpressure {policy}: {stats['rows']} kept, {stats['dropped']} dropped")
+
+
+def test_async_close_race():
+    """Test that records logged while close() runs are written, not stranded in the queue."""
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=50, async_mode=True, auto_manifest=False)
+        logger.log("execution_context", {"session_id": "test", "turn_id": 0})
+        logger.close()
+
+        # A producer that passed log()'s unlocked check after close() stopped the writer
+        assert not logger._enqueue("execution_context", {"session_id": "test"}, 0, False), \
+            "Writer is stopped; _enqueue must refuse the record"
+        assert not logger._queue
+
+        # Producers racing close()
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=50, async_mode=True, auto_manifest=False)
+        start = threading.Barrier(5)
+
+        def produce(worker):
+            start.wait()
+            for i in range(500):
+                logger.log("boundary_event", {"session_id": f"w{worker}", "turn_id": i})
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        start.wait()
+        logger.close()
+        for t in threads:
+            t.join()
+        logger.close()  # Writes what arrived after the first close()
+
+        assert not logger._queue, f"{len(logger._queue)} record(s) stranded in the queue"
+        assert logger.get_stats()["boundary_event"]["rows"] == 2000
+        assert len(read_rows(tmpdir, "boundary_event")) == 2000
+        print("✓ Async close race: records logged during close() are written")
+
+
+def test_flush_policies():
+    """Test size- and time-based flush triggers."""
+    import time
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=1000,
+            flush_interval_s={"governance_ledger": 0.2},
+            max_buffer_bytes=1000
+        )
+
+        # Quiet artifact: flushed by the timer, not by batch_size
+        logger.log("governance_ledger", {"session_id": "test", "event": "publish"})
+        assert logger.get_stats()["governance_ledger"]["buffered_bytes"] > 0
+
+        # Large records: flushed by max_buffer_bytes
+        for i in range(20):
+            logger.log("execution_context", {"session_id": "test", "prompt_preview": "x" * 200})
+        assert logger.get_stats()["execution_context"]["writes"] >= 3, "max_buffer_bytes did not trigger"
+
+        deadline = time.time() + 5
+        while logger.get_stats()["governance_ledger"]["writes"] == 0 and time.time() < deadline:
+            time.sleep(0.05)
+        stats = logger.get_stats()["governance_ledger"]
+        assert stats["writes"] == 1, "flush_interval_s did not trigger"
+        assert stats["buffered_bytes"] == 0
+
+        logger.close()
+
+        print("✓ Flush policies: size and interval triggers fire before close()")
+
+
+def test_rolling_files():
+    """Test unique file names, .open renaming and rotation by size and age."""
+    import time
+
+    def finalized(base_dir, artifact_type):
+        return [p for p in (Path(base_dir) / artifact_type).rglob("*")
+                if p.suffix in (".parquet", ".ndjson")]
+
+    def still_open(base_dir):
+        return list(Path(base_dir).rglob("*.open"))
+
+    # Two loggers in the same second on the same base_dir
+    with tempfile.TemporaryDirectory() as tmpdir:
+        loggers = [StructuredLogger(base_dir=tmpdir, batch_size=10, auto_manifest=False, validate_schema=False)
+                   for _ in range(2)]
+        for n, logger in enumerate(loggers):
+            for i in range(25):
+                logger.log("execution_context", {"session_id": f"logger{n}", "turn_id": i})
+        assert still_open(tmpdir), "Files being written should carry the .open suffix"
+        for logger in loggers:
+            logger.close()
+
+        assert not still_open(tmpdir), ".open files left after close()"
+        files = finalized(tmpdir, "execution_context")
+        assert len(files) == 2, f"Expected one file per logger, got {[f.name for f in files]}"
+        rows = read_rows(tmpdir, "execution_context")
+        assert len(rows) == 50, f"Rows lost: {len(rows)}/50"
+        assert {r["session_id"] for r in rows} == {"logger0", "logger1"}
+        print("✓ Same-second loggers: both files kept, all rows present")
+
+    # Size rotation: every batch reaches rotate_bytes
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=5, rotate_bytes=1, auto_manifest=False,
+                                  validate_schema=False)
+        for i in range(20):
+            logger.log("execution_context", {"session_id": "test", "turn_id": i})
+        assert len(finalized(tmpdir, "execution_context")) == 4, "Size rotation did not finalize each batch"
+        logger.close()
+        assert len(read_rows(tmpdir, "execution_context")) == 20
+        print("✓ Size rotation: one finalized file per full batch")
+
+    # Age rotation: a file older than rotate_interval_s is finalized
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=5, rotate_interval_s=0.2, auto_manifest=False,
+                                  validate_schema=False)
+        for i in range(5):
+            logger.log("execution_context", {"session_id": "test", "turn_id": i})
+        time.sleep(0.4)
+        assert len(finalized(tmpdir, "execution_context")) == 1, "Age rotation did not finalize the file"
+        for i in range(5, 10):
+            logger.log("execution_context", {"session_id": "test", "turn_id": i})
+        logger.close()
+        assert len(finalized(tmpdir, "execution_context")) == 2
+        assert not still_open(tmpdir)
+        assert sorted(r["turn_id"] for r in read_rows(tmpdir, "execution_context")) == list(range(10))
+        print("✓ Age rotation: separate finalized files")
+
+
+def test_schema_widening():
+    """Test that later batches widen column types instead of being cast into the first."""
+    if not PARQUET_AVAILABLE:
+        print("⊘ Skipped (pyarrow not installed)")
+        return
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=1, auto_manifest=False)
+        logger.log("custom_metrics", {"session_id": "test", "metrics": {"x": 1}, "score": None})
+        logger.log("custom_metrics", {"session_id": "test", "metrics": {"x": 2, "y": 3}, "score": 0.5})
+        logger.log("custom_metrics", {"session_id": "test", "metrics": {"x": 4}, "score": 0.7})
+        logger.close()
+
+        rows = read_rows(tmpdir, "custom_metrics")
+        assert [r["metrics"] for r in rows] == [{"x": 1}, {"x": 2, "y": 3}, {"x": 4, "y": None}], \
+            f"Nested field lost: {rows}"
+        assert [r["score"] for r in rows] == [None, 0.5, 0.7], f"Floats not kept as floats: {rows}"
+        print("✓ Schema widening: new struct fields and null-then-float columns survive")
+
+
+def test_type_mismatch_reported():
+    """Test that registry type mismatches are reported before conforming and nulls are counted."""
+    if not PARQUET_AVAILABLE:
+        print("⊘ Skipped (pyarrow not installed)")
+        return
+
+    import contextlib
+    import io
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=2, auto_manifest=False)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for turn_id in (1, "seven"):
+                logger.log("execution_context", {
+                    "session_id": "test", "turn_id": turn_id, "agent_id": "a",
+                    "model_id": "m", "temp": 1  # int is a valid float
+                })
+        warnings = output.getvalue()
+        assert "turn_id: expected" in warnings, f"Mismatch not reported: {warnings!r}"
+        assert "temp" not in warnings, f"int flagged for a float field: {warnings!r}"
+        assert logger.get_stats()["execution_context"]["coerced_nulls"] == 1
+        logger.close()
+
+        assert [r["turn_id"] for r in read_rows(tmpdir, "execution_context")] == [1, None]
+        print("✓ Type mismatch: reported as logged, unconvertible value counted in coerced_nulls")
+
+
+def test_timed_flush_survives_crash():
+    """Test that timed flushes are readable after the process dies without close()."""
+    import subprocess
+
+    child = """
+import os, sys, time
+sys.path.insert(0, sys.argv[2])
+from rkl_logging.structured_logger import StructuredLogger
+logger = StructuredLogger(base_dir=sys.argv[1], batch_size=10, flush_interval_s=0.2,
+                          auto_manifest=False, validate_schema=False)
+for i in range(3):
+    logger.log("governance_ledger", {"session_id": "test", "turn_id": i})
+for i in range(25):
+    logger.log("execution_context", {"session_id": "test", "turn_id": i})
+time.sleep(1.0)
+os._exit(0)  # Killed: no close(), no atexit
+"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = subprocess.run(
+            [sys.executable, "-c", child, tmpdir, str(Path(__file__).parent.parent)],
+            capture_output=True, text=True, timeout=30
+        )
+        assert result.returncode == 0, result.stderr
+
+        assert not list(Path(tmpdir).rglob("*.open")), "Timed flush left unreadable .open files"
+        assert len(read_rows(tmpdir, "governance_ledger")) == 3, "Quiet artifact lost in crash"
+        assert len(read_rows(tmpdir, "execution_context")) == 25, "Idle file lost in crash"
+        print("✓ Timed flush: quiet and idle artifacts readable after os._exit")
+
+
 def test_schema_drift_detection():
     """Test that schema changes are detected."""
     # Get current schema
@@ -298,8 +752,20 @@ def run_all_tests():
         ("Hashing Utilities", test_hashing_utilities),
         ("Privacy Helpers", test_privacy_helpers),
         ("Basic Logging", test_basic_logging),
+        ("Write-Time Enrichment", test_write_time_enrichment),
         ("Sampling", test_sampling),
+        ("Session Sampling", test_session_sampling),
+        ("Lazy Records", test_lazy_records),
         ("Manifest Generation", test_manifest_generation),
+        ("Manifest Exact Counts", test_manifest_exact_counts),
+        ("Async Logging", test_async_logging),
+        ("Async Backpressure", test_async_backpressure),
+        ("Async Close Race", test_async_close_race),
+        ("Rolling Files", test_rolling_files),
+        ("Schema Widening", test_schema_widening),
+        ("Type Mismatch Reported", test_type_mismatch_reported),
+        ("Flush Policies", test_flush_policies),
+        ("Timed Flush Survives Crash", test_timed_flush_survives_crash),
         ("Schema Drift Detection", test_schema_drift_detection)
     ]
 
@@ -0,0 +1,17 @@
+"""
+Helper utilities for rkl_logging.
+
+- hashing: Prefixed SHA-256 fingerprints for cross-referencing without content
+- privacy: Research sanitization and public anonymization of records
+"""
+
+from .hashing import sha256_text, sha256_dict, sha256_file
+from .privacy import sanitize_for_research, anonymize_for_public
+
+__all__ = [
+    "sha256_text",
+    "sha256_dict",
+    "sha256_file",
+    "sanitize_for_research",
+    "anonymize_for_public"
+]
@@ -0,0 +1,34 @@
+"""
+SHA-256 helpers for privacy-preserving content fingerprints.
+
+Hashes are returned as "sha256:<64 hex chars>" so the algorithm is explicit
+in published data. Older telemetry stored bare hex digests; readers should
+compare hashes through a normalizer that strips the prefix.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Union
+
+PREFIX = "sha256:"
+
+
+def sha256_text(text: str) -> str:
+    """Fingerprint text (UTF-8) without storing it."""
+    return PREFIX + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sha256_dict(data: Dict[str, Any]) -> str:
+    """Fingerprint a JSON-serializable dict; key order does not matter."""
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return sha256_text(payload)
+
+
+def sha256_file(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """Fingerprint a file's bytes, reading it in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return PREFIX + digest.hexdigest()
@@ -0,0 +1,70 @@
+"""
+Privacy helpers for telemetry records.
+
+Two release levels:
+- Research: text fields are replaced by "<field>_hash" fingerprints, so
+  records stay joinable without carrying the text
+- Public: text fields and their fingerprints are removed; only structural
+  fields (ids, model settings, counts, timings, verdicts) remain
+
+Type III Note: Raw text never leaves the machine; these helpers decide what
+derived form of a record may be shared.
+"""
+
+from typing import Any, Dict, Iterable
+
+from .hashing import sha256_text
+
+# Fields that may carry raw or near-raw text
+SENSITIVE_TEXT_FIELDS = (
+    "prompt_text",
+    "input_text",
+    "output_text",
+    "response_text",
+    "system_prompt",
+    "prompt_preview",
+    "response_preview",
+    "payload_summary",
+    "decision_rationale",
+    "failed_titles",
+)
+
+
+def sanitize_for_research(record: Dict[str, Any],
+                          sensitive_fields: Iterable[str] = SENSITIVE_TEXT_FIELDS) -> Dict[str, Any]:
+    """
+    Replace text fields with SHA-256 fingerprints.
+
+    Args:
+        record: Telemetry record (not modified)
+        sensitive_fields: Field names to replace
+
+    Returns:
+        Copy of the record where each present text field `f` is replaced by
+        `f_hash` (empty or missing fields are dropped)
+    """
+    sanitized = dict(record)
+    for field in sensitive_fields:
+        if field not in sanitized:
+            continue
+        value = sanitized.pop(field)
+        if value:
+            sanitized[f"{field}_hash"] = sha256_text(value if isinstance(value, str) else repr(value))
+    return sanitized
+
+
+def anonymize_for_public(record: Dict[str, Any],
+                         sensitive_fields: Iterable[str] = SENSITIVE_TEXT_FIELDS) -> Dict[str, Any]:
+    """
+    Keep only structural fields.
+
+    Args:
+        record: Telemetry record (raw or research-sanitized; not modified)
+        sensitive_fields: Field names to remove
+
+    Returns:
+        Copy of the record without text fields or their `_hash` fingerprints
+    """
+    removed = set(sensitive_fields)
+    removed.update(f"{field}_hash" for field in sensitive_fields)
+    return {key: value for key, value in record.items() if key not in removed}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Expected-value article prioritization (Discovery Agent Group).
+
+Ranks candidate articles by predicted secure reasoning relevance *before* any
+LLM time is spent, so the most valuable articles are summarized first and a
+time-budgeted run drops the least valuable ones instead of the oldest ones.
+
+Score components (all in [0, 1]):
+- Source prior: mean Gemini `theme_score` of past articles from the same feed,
+  learned from `hallucination_matrix` joined to `retrieval_provenance`
+  (artifact_id == sha256(link) appears in the feed's selected_hashes), shrunk
+  toward the global mean (or the feed's configured `credibility`) when the
+  feed has few scored articles.
+- Keyword evidence: saturating count of configured keyword hits, title hits
+  weighted double.
+- Recency: mild tie-breaker so equal-value articles still prefer fresh news.
+
+Type III Note: Scoring uses only titles, RSS summaries and structural
+telemetry already stored locally; nothing is sent to external APIs.
+"""
+
+import logging
+import math
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from telemetry_history import load_artifact_records, normalize_hash
+
+logger = logging.getLogger(__name__)
+
+
+class ArticlePrioritizer:
+    """
+    Cheap pre-summarization scorer for candidate articles.
+
+    Attributes:
+        keywords (List[str]): Lower-cased relevance keywords
+        feed_credibility (Dict[str, float]): Optional configured prior per feed name
+        source_priors (Dict[str, float]): Learned, shrunk mean theme_score per feed
+        global_prior (float): Mean theme_score across all history (0.5 if none)
+
+    Example:
+        >>> prioritizer = ArticlePrioritizer(["alignment", "interpretability"])
+        >>> prioritizer.learn_from_history(Path("data/research"))
+        >>> ranked = prioritizer.rank(articles)
+    """
+
+    # Weights of the expected-value blend; the learned source prior dominates
+    # once history exists, keyword evidence separates articles within a feed.
+    SOURCE_WEIGHT = 0.5
+    KEYWORD_WEIGHT = 0.35
+    RECENCY_WEIGHT = 0.15
+
+    # Pseudo-count for shrinking per-feed means toward the prior
+    PRIOR_STRENGTH = 5.0
+
+    def __init__(self, keywords: List[str], feed_credibility: Optional[Dict[str, float]] = None):
+        self.keywords = [kw.lower() for kw in keywords]
+        self.feed_credibility = feed_credibility or {}
+        self.source_priors: Dict[str, float] = {}
+        self.global_prior = 0.5
+
+    def learn_from_history(self, history_dir: Path, history_days: int = 60) -> None:
+        """
+        Learn per-feed source priors from past QA outcomes.
+
+        Args:
+            history_dir: Research telemetry directory (data/research)
+            history_days: Lookback window in days
+        """
+        provenance = load_artifact_records(
+            history_dir, "retrieval_provenance", days_back=history_days,
+            columns=["feed_name", "selected_hashes"]
+        )
+        feed_by_artifact: Dict[str, str] = {}
+        for record in provenance:
+            for h in record.get("selected_hashes") or []:
+                if h:
+                    feed_by_artifact[normalize_hash(h)] = record.get("feed_name", "")
+
+        verdicts = load_artifact_records(
+            history_dir, "hallucination_matrix", days_back=history_days,
+            columns=["artifact_id", "theme_score"]
+        )
+        scores_by_feed: Dict[str, List[float]] = {}
+        all_scores: List[float] = []
+        for record in verdicts:
+            score = record.get("theme_score")
+            if score is None:
+                continue
+            try:
+                score = float(score)
+            except (TypeError, ValueError):
+                continue
+            all_scores.append(score)
+            feed = feed_by_artifact.get(normalize_hash(record.get("artifact_id")))
+            if feed:
+                scores_by_feed.setdefault(feed, []).append(score)
+
+        if all_scores:
+            self.global_prior = sum(all_scores) / len(all_scores)
+
+        for feed, scores in scores_by_feed.items():
+            prior = self.feed_credibility.get(feed, self.global_prior)
+            self.source_priors[feed] = (
+                (sum(scores) + self.PRIOR_STRENGTH * prior) / (len(scores) + self.PRIOR_STRENGTH)
+            )
+
+        logger.info(
+            f"Prioritizer learned source priors for {len(self.source_priors)} feeds "
+            f"from {len(all_scores)} scored articles (global mean {self.global_prior:.2f})"
+        )
+
+    def _keyword_score(self, article: Dict) -> float:
+        """Saturating keyword evidence: 1 - exp(-hits / 2), title hits count double."""
+        if not self.keywords:
+            return 0.5
+        title = article.get("title", "").lower()
+        summary = article.get("summary", "").lower()
+        hits = sum(2 if kw in title else 1 for kw in self.keywords if kw in title or kw in summary)
+        return 1.0 - math.exp(-hits / 2.0)
+
+    def score(self, article: Dict, now: Optional[datetime] = None) -> float:
+        """
+        Predict the value of summarizing an article.
+
+        Args:
+            article: Candidate article from FeedFetcher (title, summary, source, date)
+            now: Reference time for recency (defaults to now)
+
+        Returns:
+            Expected value in [0, 1]
+        """
+        source = article.get("source", "")
+        source_prior = self.source_priors.get(
+            source, self.feed_credibility.get(source, self.global_prior)
+        )
+
+        recency = 0.5
+        pub_date = article.get("date")
+        if isinstance(pub_date, datetime):
+            age_days = max(((now or datetime.now()) - pub_date).total_seconds() / 86400.0, 0.0)
+            recency = math.exp(-age_days / 7.0)
+
+        return (
+            self.SOURCE_WEIGHT * source_prior
+            + self.KEYWORD_WEIGHT * self._keyword_score(article)
+            + self.RECENCY_WEIGHT * recency
+        )
+
+    def rank(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Sort articles by expected value, highest first.
+
+        Each article gets a `priority_score` field so the ranking is auditable
+        in the saved brief JSON. Ties fall back to recency.
+        """
+        now = datetime.now()
+        for article in articles:
+            article["priority_score"] = round(self.score(article, now), 4)
+        return sorted(
+            articles,
+            key=lambda a: (a["priority_score"], a.get("date") or datetime.min),
+            reverse=True
+        )
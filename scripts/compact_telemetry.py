@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Telemetry Compactor - Merge small telemetry files into one Parquet file per partition
+
+Each artifact's date partition (data/research/<artifact>/YYYY/MM/DD/) collects
+many small Parquet and NDJSON files. This tool merges the finalized files of a
+day (or of one hour of a day) into a single zstd-compressed Parquet file:
+
+- Parquet and NDJSON inputs are unified into one schema (columns missing from
+  a file become null; conflicting column types are widened to float64 or, if
+  still incompatible, stored as text)
+- Rows are sorted by session_id, then t (then timestamp as a tie-breaker)
+- The output row count is verified against the inputs, and in day mode the
+  day's total is compared with manifests/{date}.json
+- The output is written under a temporary name and renamed into place, then
+  the inputs are removed (readers may briefly see both while inputs are
+  deleted, never a partial file)
+
+Safe to run while the logger is writing: files still being written carry a
+".open" suffix and are never touched, and finalized files are never appended to.
+
+Usage:
+    python scripts/compact_telemetry.py [--date YYYY-MM-DD] [--hour HH]
+                                        [--artifact NAME ...] [--base-dir PATH]
+                                        [--dry-run] [--strict]
+
+Options:
+    --date YYYY-MM-DD  Day to compact (default: yesterday, UTC)
+    --hour HH          Only compact files opened during this UTC hour
+    --artifact NAME    Artifact(s) to compact (default: all found)
+    --base-dir PATH    Research data directory (default: ./data/research)
+    --min-files N      Skip partitions with fewer input files (default: 2)
+    --dry-run          Show what would be compacted without writing
+    --strict           Skip a day whose row total disagrees with the manifest
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    print("❌ pyarrow required for compaction")
+    print("   Install: pip install pyarrow")
+    sys.exit(1)
+
+OPEN_SUFFIX = ".open"
+SORT_KEYS = ("session_id", "t", "timestamp")
+
+
+def file_hour(path: Path, artifact: str) -> Optional[str]:
+    """Return the HH of a telemetry file name ({artifact}_{HHMMSS}...), if present."""
+    rest = path.name[len(artifact) + 1:]
+    return rest[:2] if rest[:6].isdigit() else None
+
+
+def list_inputs(day_dir: Path, artifact: str, hour: Optional[str]) -> List[Path]:
+    """Finalized Parquet/NDJSON files in a partition (files still being written are skipped)."""
+    inputs = []
+    for path in sorted(day_dir.iterdir()):
+        if path.suffix not in (".parquet", ".ndjson") or not path.is_file():
+            continue
+        if hour is not None and file_hour(path, artifact) != hour:
+            continue
+        inputs.append(path)
+    return inputs
+
+
+def column_array(values: list) -> pa.Array:
+    """Build an Arrow array from Python values, storing mixed types as text."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([v if v is None or isinstance(v, str) else json.dumps(v) for v in values])
+
+
+def read_ndjson(path: Path) -> pa.Table:
+    rows = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rows.append(json.loads(line))
+
+    names: List[str] = []
+    for row in rows:
+        for name in row:
+            if name not in names:
+                names.append(name)
+    return pa.table({name: column_array([r.get(name) for r in rows]) for name in names})
+
+
+def read_input(path: Path) -> pa.Table:
+    if path.suffix == ".parquet":
+        table = pq.read_table(path)
+    else:
+        table = read_ndjson(path)
+    return table.replace_schema_metadata(None)
+
+
+def unified_type(types: List[pa.DataType]) -> pa.DataType:
+    """Common type for one column across files."""
+    distinct = []
+    for t in types:
+        if not pa.types.is_null(t) and t not in distinct:
+            distinct.append(t)
+    if not distinct:
+        return pa.string()
+    if len(distinct) == 1:
+        return distinct[0]
+    if all(pa.types.is_integer(t) for t in distinct):
+        return pa.int64()
+    if all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in distinct):
+        return pa.float64()
+    # Structs that gained fields, lists of widened items (as the logger writes them)
+    try:
+        return pa.unify_schemas(
+            [pa.schema([("c", t)]) for t in distinct], promote_options="permissive"
+        ).field("c").type
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.string()
+
+
+def conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder, null-fill and cast a table's columns to the unified schema."""
+    columns = []
+    for field in schema:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, type=field.type))
+            continue
+        column = table.column(field.name)
+        if column.type.equals(field.type):
+            columns.append(column)
+            continue
+        try:
+            columns.append(column.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # Nested or unparseable values: keep them as JSON text
+            columns.append(pa.array(
+                [v if v is None or isinstance(v, str) else json.dumps(v, default=str)
+                 for v in column.to_pylist()],
+                type=pa.string()
+            ))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def merge_tables(tables: List[pa.Table]) -> pa.Table:
+    """Concatenate tables under one schema and sort by session_id / t."""
+    names: List[str] = []
+    types: Dict[str, List[pa.DataType]] = {}
+    for table in tables:
+        for field in table.schema:
+            if field.name not in types:
+                names.append(field.name)
+                types[field.name] = []
+            types[field.name].append(field.type)
+
+    schema = pa.schema([pa.field(name, unified_type(types[name])) for name in names])
+    merged = pa.concat_tables([conform(t, schema) for t in tables])
+
+    sort_keys = [(key, "ascending") for key in SORT_KEYS if key in merged.column_names]
+    if sort_keys:
+        merged = merged.take(pc.sort_indices(merged, sort_keys=sort_keys))  # nulls last
+    return merged
+
+
+def manifest_rows(base_dir: Path, date_str: str, artifact: str) -> Optional[int]:
+    manifest_path = base_dir / "manifests" / f"{date_str}.json"
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    stats = manifest.get("artifacts", {}).get(artifact)
+    return int(stats.get("rows", 0)) if stats else None
+
+
+def compact_partition(base_dir: Path, artifact: str, date_str: str, hour: Optional[str],
+                      min_files: int, dry_run: bool, strict: bool) -> bool:
+    """
+    Compact one artifact's day (or hour) partition.
+
+    Returns:
+        False if verification failed, True otherwise (including skips)
+    """
+    year, month, day = date_str.split("-")
+    day_dir = base_dir / artifact / year / month / day
+    if not day_dir.is_dir():
+        return True
+
+    inputs = list_inputs(day_dir, artifact, hour)
+    still_open = list(day_dir.glob(f"*{OPEN_SUFFIX}"))
+    if len(inputs) < min_files:
+        print(f"   ⏭️  {artifact}: {len(inputs)} file(s), nothing to compact")
+        return True
+
+    tables = []
+    for path in inputs:
+        try:
+            tables.append(read_input(path))
+        except Exception as e:
+            print(f"   ❌ {artifact}: cannot read {path.name} ({e}); partition left unchanged")
+            return False
+    input_rows = sum(t.num_rows for t in tables)
+
+    # Day mode: the finalized files should hold every row the manifest counted
+    if hour is None:
+        expected = manifest_rows(base_dir, date_str, artifact)
+        if expected is not None and input_rows != expected:
+            note = f" ({len(still_open)} file(s) still open)" if still_open else ""
+            print(f"   ⚠️  {artifact}: {input_rows} rows on disk, manifest says {expected}{note}")
+            if strict:
+                print(f"   ⏭️  {artifact}: skipped (--strict)")
+                return False
+
+    label = f"{hour}0000" if hour is not None else (file_hour(inputs[0], artifact) or "00") + "0000"
+    output_path = day_dir / f"{artifact}_{label}_compacted.parquet"
+
+    if dry_run:
+        print(f"   🔍 {artifact}: would merge {len(inputs)} file(s), {input_rows} rows -> {output_path.name}")
+        return True
+
+    merged = merge_tables(tables)
+    tmp_path = day_dir / f"{output_path.name}.{os.getpid()}.compacting"
+    try:
+        pq.write_table(merged, tmp_path, compression="zstd")
+        written_rows = pq.read_metadata(tmp_path).num_rows
+        if written_rows != input_rows:
+            raise ValueError(f"wrote {written_rows} rows, expected {input_rows}")
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        print(f"   ❌ {artifact}: compaction failed ({e}); partition left unchanged")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+
+    for path in inputs:
+        if path != output_path:
+            path.unlink()
+
+    size_kb = output_path.stat().st_size / 1024
+    print(f"   ✅ {artifact}: {len(inputs)} file(s) -> {output_path.name} ({input_rows} rows, {size_kb:.1f} KB)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge small telemetry files into one zstd Parquet file per day or hour"
+    )
+    parser.add_argument(
+        "--date",
+        type=str,
+        default=(datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d"),
+        help="Date to compact (YYYY-MM-DD, default: yesterday UTC)"
+    )
+    parser.add_argument(
+        "--hour",
+        type=int,
+        choices=range(24),
+        metavar="HH",
+        help="Only compact files opened during this UTC hour (0-23)"
+    )
+    parser.add_argument(
+        "--artifact",
+        action="append",
+        help="Artifact to compact (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path("./data/research"),
+        help="Research data directory (default: ./data/research)"
+    )
+    parser.add_argument(
+        "--min-files",
+        type=int,
+        default=2,
+        help="Skip partitions with fewer input files (default: 2)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without writing")
+    parser.add_argument("--strict", action="store_true",
+                        help="Skip a day whose row total disagrees with the manifest")
+
+    args = parser.parse_args()
+
+    if not args.base_dir.exists():
+        print(f"❌ Base directory not found: {args.base_dir}")
+        print("   Check that you're running from the project root")
+        sys.exit(1)
+
+    hour = f"{args.hour:02d}" if args.hour is not None else None
+    artifacts = args.artifact or sorted(
+        p.name for p in args.base_dir.iterdir() if p.is_dir() and p.name != "manifests"
+    )
+
+    scope = f"{args.date} {hour}:00 UTC" if hour is not None else args.date
+    print(f"🗜️  Compacting telemetry for {scope} in {args.base_dir}")
+
+    ok = True
+    for artifact in artifacts:
+        ok = compact_partition(
+            args.base_dir, artifact, args.date, hour,
+            args.min_files, args.dry_run, args.strict
+        ) and ok
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
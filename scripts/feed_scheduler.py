@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-feed polling schedule (Discovery Agent Group).
+
+Learns how often each RSS feed publishes from past `retrieval_provenance`
+telemetry and decides which feeds are worth polling on this run. A feed that
+updates weekly does not need to be fetched and parsed twice a day; arXiv does.
+
+Model:
+- Each past poll of a feed is an interval (time since the previous poll) with
+  a binary outcome: did the candidate list contain entries not seen before?
+- Updates are treated as a Poisson process with rate λ per hour, so the chance
+  of at least one new entry after Δ hours is 1 - exp(-λΔ).
+- λ is the maximum-likelihood fit over the observed intervals, with one
+  pseudo-positive and one pseudo-negative interval as a weak prior so feeds
+  with little history are neither always nor never polled.
+
+A feed is polled when the probability of new entries since its last poll
+reaches `min_probability`, when it has not been polled for `max_skip_hours`,
+when it has too little history, or when a full sweep is forced.
+
+Environment Variables:
+    BRIEF_ADAPTIVE_POLLING: Enable adaptive polling (default: false)
+    BRIEF_FULL_SWEEP: Force polling every enabled feed (default: false)
+    BRIEF_POLL_MIN_PROBABILITY: Poll threshold on P(new entries) (default: 0.5)
+    BRIEF_POLL_MAX_SKIP_HOURS: Always poll after this many hours (default: 72)
+    BRIEF_POLL_HISTORY_DAYS: Telemetry lookback for cadence learning (default: 30)
+"""
+
+import logging
+import math
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from telemetry_history import load_artifact_records, normalize_hash, parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+class FeedScheduler:
+    """
+    Decides which feeds to poll based on their learned update cadence.
+
+    Attributes:
+        history_dir (Path): Research telemetry directory (data/research)
+        min_probability (float): Poll when P(new entries) >= this value
+        max_skip_hours (float): Upper bound on time between polls of a feed
+        full_sweep (bool): Poll every feed regardless of history
+        min_polls (int): Polls of history required before a feed may be skipped
+
+    Example:
+        >>> scheduler = FeedScheduler(Path("data/research"))
+        >>> poll, reason = scheduler.should_poll({"name": "ArXiv AI", "url": "..."})
+    """
+
+    def __init__(self, history_dir: Path, history_days: int = 30,
+                 min_probability: float = 0.5, max_skip_hours: float = 72.0,
+                 full_sweep: bool = False, min_polls: int = 4):
+        self.history_dir = Path(history_dir)
+        self.history_days = history_days
+        self.min_probability = min_probability
+        self.max_skip_hours = max_skip_hours
+        self.full_sweep = full_sweep
+        self.min_polls = min_polls
+        self._polls: Optional[Dict[str, List[Tuple[datetime, set, int]]]] = None
+
+    @classmethod
+    def from_env(cls, history_dir: Path, days_back: int = 7) -> "FeedScheduler":
+        """
+        Build a scheduler from BRIEF_POLL_* environment variables.
+
+        max_skip_hours is capped at the fetch window (days_back) so a skipped
+        feed is always polled again before its articles age out of the window.
+        """
+        max_skip = float(os.getenv("BRIEF_POLL_MAX_SKIP_HOURS", "72"))
+        return cls(
+            history_dir,
+            history_days=int(os.getenv("BRIEF_POLL_HISTORY_DAYS", "30")),
+            min_probability=float(os.getenv("BRIEF_POLL_MIN_PROBABILITY", "0.5")),
+            max_skip_hours=min(max_skip, days_back * 24.0),
+            full_sweep=os.getenv("BRIEF_FULL_SWEEP", "false").lower() in ("1", "true", "yes"),
+        )
+
+    def _load_polls(self) -> Dict[str, List[Tuple[datetime, set, int]]]:
+        """Group past retrieval_provenance records into per-feed poll histories."""
+        if self._polls is not None:
+            return self._polls
+
+        records = load_artifact_records(
+            self.history_dir, "retrieval_provenance", days_back=self.history_days,
+            columns=["feed_name", "timestamp", "candidate_hashes", "candidate_count"]
+        )
+        polls: Dict[str, List[Tuple[datetime, set, int]]] = {}
+        for record in records:
+            ts = parse_timestamp(record.get("timestamp"))
+            name = record.get("feed_name")
+            if not ts or not name:
+                continue
+            hashes = {normalize_hash(h) for h in (record.get("candidate_hashes") or []) if h}
+            polls.setdefault(name, []).append((ts, hashes, int(record.get("candidate_count") or 0)))
+
+        for history in polls.values():
+            history.sort(key=lambda poll: poll[0])
+
+        self._polls = polls
+        logger.info(f"Feed scheduler loaded poll history for {len(polls)} feeds")
+        return polls
+
+    @staticmethod
+    def _intervals(history: List[Tuple[datetime, set, int]]) -> List[Tuple[float, bool]]:
+        """Turn consecutive polls into (hours elapsed, had new entries) observations."""
+        observations = []
+        for (prev_t, prev_hashes, prev_count), (t, hashes, count) in zip(history, history[1:]):
+            hours = (t - prev_t).total_seconds() / 3600.0
+            if hours <= 0.05:
+                continue  # Same run logged twice (retries); not an independent poll
+            if hashes and prev_hashes:
+                had_new = bool(hashes - prev_hashes)
+            else:
+                had_new = count != prev_count
+            observations.append((hours, had_new))
+        return observations
+
+    @staticmethod
+    def _fit_rate(observations: List[Tuple[float, bool]]) -> float:
+        """
+        Maximum-likelihood Poisson update rate (per hour) for interval outcomes.
+
+        Solves d/dλ Σ log P(y_i | λ, Δ_i) = 0 by bisection in log-space; the
+        derivative is monotone decreasing in λ so the root is unique.
+        """
+        median = sorted(h for h, _ in observations)[len(observations) // 2]
+        # Weak prior: one positive and one negative pseudo-interval at the median
+        obs = observations + [(median, True), (median, False)]
+        negative_hours = sum(h for h, had_new in obs if not had_new)
+
+        def score(rate: float) -> float:
+            positive = sum(h / math.expm1(rate * h) for h, had_new in obs if had_new)
+            return positive - negative_hours
+
+        lo, hi = math.log(1e-5), math.log(10.0)
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            if score(math.exp(mid)) > 0:
+                lo = mid
+            else:
+                hi = mid
+        return math.exp((lo + hi) / 2)
+
+    def should_poll(self, feed: Dict, now: Optional[datetime] = None) -> Tuple[bool, str]:
+        """
+        Decide whether to poll a feed on this run.
+
+        Args:
+            feed: Feed configuration (name, url, optional always_poll)
+            now: Current UTC time (defaults to utcnow, injectable for replay)
+
+        Returns:
+            (poll, reason) where reason is a short human-readable explanation
+        """
+        if self.full_sweep:
+            return True, "full sweep"
+        if feed.get("always_poll"):
+            return True, "always_poll"
+
+        history = self._load_polls().get(feed.get("name", ""), [])
+        if len(history) < self.min_polls:
+            return True, f"insufficient history ({len(history)} polls)"
+
+        now = now or datetime.utcnow()
+        elapsed = (now - history[-1][0]).total_seconds() / 3600.0
+        if elapsed >= self.max_skip_hours:
+            return True, f"not polled for {elapsed:.0f}h"
+
+        observations = self._intervals(history)
+        if not observations:
+            return True, "no usable intervals"
+
+        rate = self._fit_rate(observations)
+        probability = 1.0 - math.exp(-rate * elapsed)
+        reason = f"P(new)={probability:.2f} after {elapsed:.1f}h (mean update interval {1.0 / rate:.1f}h)"
+        return probability >= self.min_probability, reason
@@ -41,6 +41,11 @@ import requests
 import feedparser
 import time
 import uuid
+import random
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -48,6 +53,10 @@ from dotenv import load_dotenv
 import subprocess
 import platform
 
+from feed_scheduler import FeedScheduler
+from article_prioritizer import ArticlePrioritizer
+from result_cache import ResultCache
+
 # CRITICAL: Load .env BEFORE importing GeminiClient (which checks USE_VERTEX_AI)
 script_dir = Path(__file__).parent.parent
 load_dotenv(dotenv_path=script_dir / ".env")
@@ -60,12 +69,20 @@ except ImportError:
 
 # Optional Gemini QA
 try:
-    from gemini_client import GeminiClient  # type: ignore
+    from gemini_client import GeminiClient, get_parse_stats  # type: ignore
     GEMINI_CLIENT_AVAILABLE = True
 except Exception as e:
     GEMINI_CLIENT_AVAILABLE = False
     logging.warning(f"GeminiClient import failed: {e}")
 
+# Optional local relevance model (needs NumPy)
+try:
+    from relevance_model import RelevanceModel, relevance_text, outcome_label
+    RELEVANCE_MODEL_AVAILABLE = True
+except ImportError as e:
+    RELEVANCE_MODEL_AVAILABLE = False
+    logging.warning(f"Relevance model unavailable: {e}")
+
 # Import RKL logging for research telemetry
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -123,7 +140,8 @@ class OllamaClient:
 
     def generate(self, prompt: str, system_prompt: Optional[str] = None,
                  agent_id: str = "unknown", session_id: Optional[str] = None,
-                 turn_id: Optional[int] = None, artifact_id: Optional[str] = None) -> str:
+                 turn_id: Optional[int] = None, artifact_id: Optional[str] = None,
+                 format: Optional[object] = None) -> str:
         """
         Send a prompt to Ollama and return the response.
 
@@ -138,6 +156,7 @@ class OllamaClient:
             agent_id: Agent identifier for telemetry
             session_id: Session identifier for telemetry
             turn_id: Turn number for telemetry
+            format: Optional output constraint: "json" or a JSON schema dict
 
         Returns:
             str: Model's generated response, or empty string on error
@@ -155,6 +174,8 @@ class OllamaClient:
 
         if system_prompt:
             payload["system"] = system_prompt
+        if format:
+            payload["format"] = format
 
         try:
             response = requests.post(self.endpoint, json=payload, timeout=120)
@@ -170,34 +191,38 @@ class OllamaClient:
 
             # Log execution context for research
             if self.research_logger and RKL_LOGGING_AVAILABLE:
-                quant = os.getenv("OLLAMA_QUANT", "")
-                seed_env = os.getenv("OLLAMA_SEED")
-                seed_val = int(seed_env) if seed_env and seed_env.isdigit() else None
-                exec_record = {
-                    "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "session_id": session_id or "unknown",
-                    "turn_id": turn_id or 0,
-                    "agent_id": agent_id,
-                    "model_id": self.model,
-                    "model_rev": self.model.split(":")[-1] if ":" in self.model else "latest",
-                    "quant": quant or "unknown",
-                    "temp": payload.get("temperature", 0.7),  # Default from Ollama
-                    "top_p": payload.get("top_p", 1.0),  # Default from Ollama
-                    "ctx_tokens_used": prompt_tokens,
-                    "gen_tokens": gen_tokens,
-                    "tool_lat_ms": latency_ms,
-                    "prompt_id_hash": sha256_text(prompt) if RKL_LOGGING_AVAILABLE else "",
-                    "system_prompt_hash": sha256_text(system_prompt) if system_prompt and RKL_LOGGING_AVAILABLE else "",
-                    "token_estimation": "api" if prompt_tokens and gen_tokens else "word_count",
-                    # Phase 1 Enhancement: Capture full prompts and responses for deeper analysis
-                    "prompt_preview": prompt[:1000] if prompt else "",
-                    "response_preview": generated_text[:1000] if generated_text else "",
-                    # Phase 2 Enhancement: Link to artifact for end-to-end tracing
-                    "artifact_id": artifact_id or ""
-                }
-                if seed_val is not None:
-                    exec_record["seed"] = seed_val
-                self.research_logger.log("execution_context", exec_record)
+                def exec_record():
+                    # Built only if the record is sampled in (hashes the prompts)
+                    quant = os.getenv("OLLAMA_QUANT", "")
+                    seed_env = os.getenv("OLLAMA_SEED")
+                    seed_val = int(seed_env) if seed_env and seed_env.isdigit() else None
+                    record = {
+                        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "session_id": session_id or "unknown",
+                        "turn_id": turn_id or 0,
+                        "agent_id": agent_id,
+                        "model_id": self.model,
+                        "model_rev": self.model.split(":")[-1] if ":" in self.model else "latest",
+                        "quant": quant or "unknown",
+                        "temp": payload.get("temperature", 0.7),  # Default from Ollama
+                        "top_p": payload.get("top_p", 1.0),  # Default from Ollama
+                        "ctx_tokens_used": prompt_tokens,
+                        "gen_tokens": gen_tokens,
+                        "tool_lat_ms": latency_ms,
+                        "prompt_id_hash": sha256_text(prompt) if RKL_LOGGING_AVAILABLE else "",
+                        "system_prompt_hash": sha256_text(system_prompt) if system_prompt and RKL_LOGGING_AVAILABLE else "",
+                        "token_estimation": "api" if prompt_tokens and gen_tokens else "word_count",
+                        # Phase 1 Enhancement: Capture full prompts and responses for deeper analysis
+                        "prompt_preview": prompt[:1000] if prompt else "",
+                        "response_preview": generated_text[:1000] if generated_text else "",
+                        # Phase 2 Enhancement: Link to artifact for end-to-end tracing
+                        "artifact_id": artifact_id or ""
+                    }
+                    if seed_val is not None:
+                        record["seed"] = seed_val
+                    return record
+
+                self.research_logger.log("execution_context", exec_record, sample_key=session_id or "unknown")
 
                 # Log boundary event (Type III compliance)
                 self.research_logger.log("boundary_event", {
@@ -311,7 +336,7 @@ Reasoning:"""
 
         # Log reasoning graph edge: feed_monitor → summarizer
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
-            self.client.research_logger.log("reasoning_graph_edge", {
+            self.client.research_logger.log("reasoning_graph_edge", lambda: {
                 "edge_id": str(uuid.uuid4()),
                 "session_id": session_id or "unknown",
                 "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -326,7 +351,7 @@ Reasoning:"""
                 "payload_summary": f"Title: {title[:80]}... ({len(content_for_llm)} chars content)",
                 # Phase 2 Enhancement: Link to artifact for end-to-end tracing
                 "artifact_id": artifact_id
-            })
+            }, sample_key=session_id or "unknown")
 
         # PROCESSING: Local Ollama generates summary (Type III: raw data processed locally)
         step_start = int(time.time() * 1000)
@@ -357,7 +382,7 @@ Provide only the explanation, no preamble."""
 
         # Log reasoning graph edge: summarizer → lay_translator
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
-            self.client.research_logger.log("reasoning_graph_edge", {
+            self.client.research_logger.log("reasoning_graph_edge", lambda: {
                 "edge_id": str(uuid.uuid4()),
                 "session_id": session_id or "unknown",
                 "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -372,7 +397,7 @@ Provide only the explanation, no preamble."""
                 "payload_summary": f"Summary: {technical_summary[:100]}...",
                 # Phase 2 Enhancement: Link to artifact for end-to-end tracing
                 "artifact_id": artifact_id
-            })
+            }, sample_key=session_id or "unknown")
 
         step_start = int(time.time() * 1000)
         lay_explanation = self.client.generate(
@@ -404,7 +429,7 @@ Return only comma-separated tags, no explanation."""
 
         # Log reasoning graph edge: lay_translator → metadata_extractor
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
-            self.client.research_logger.log("reasoning_graph_edge", {
+            self.client.research_logger.log("reasoning_graph_edge", lambda: {
                 "edge_id": str(uuid.uuid4()),
                 "session_id": session_id or "unknown",
                 "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -419,7 +444,7 @@ Return only comma-separated tags, no explanation."""
                 "payload_summary": f"Lay text: {lay_explanation[:100]}...",
                 # Phase 2 Enhancement: Link to artifact for end-to-end tracing
                 "artifact_id": artifact_id
-            })
+            }, sample_key=session_id or "unknown")
 
         step_start = int(time.time() * 1000)
         tags_raw = self.client.generate(
@@ -482,7 +507,8 @@ class FeedFetcher:
 
     def __init__(self, feeds_config: Dict, keywords: List[str], days_back: int = 7,
                  research_logger: Optional['StructuredLogger'] = None,
-                 session_id: str = "unknown"):
+                 session_id: str = "unknown",
+                 scheduler: Optional[FeedScheduler] = None):
         self.feeds_config = feeds_config
         ignore_kw = os.getenv("BRIEF_IGNORE_KEYWORDS", "false").lower() in ("1", "true", "yes")
         self.keywords = [] if ignore_kw else [kw.lower() for kw in keywords]
@@ -492,13 +518,15 @@ class FeedFetcher:
         self.session_id = session_id
         self.remote_fetch_host = os.getenv("REMOTE_FETCH_HOST", "").strip()
         self.remote_fetch_user = os.getenv("REMOTE_FETCH_USER", "").strip()
+        self.scheduler = scheduler
 
     def fetch_feeds(self) -> List[Dict]:
         """
         Fetch all enabled feeds and return filtered articles.
 
         Orchestrates the Discovery agent workflow:
-        1. Feed Monitor: Fetches each enabled RSS feed
+        1. Feed Monitor: Fetches each enabled RSS feed (skipping feeds the
+           adaptive scheduler predicts have no new entries, if enabled)
         2. Content Filter: Applies keyword and date filtering
         3. Deduplication: Removes duplicate articles by URL
 
@@ -525,6 +553,13 @@ class FeedFetcher:
                 logger.info(f"Skipping disabled feed: {feed['name']}")
                 continue
 
+            if self.scheduler:
+                poll, reason = self.scheduler.should_poll(feed)
+                if not poll:
+                    logger.info(f"Skipping feed {feed['name']} this run: {reason}")
+                    continue
+                logger.info(f"Polling feed {feed['name']}: {reason}")
+
             logger.info(f"Fetching feed: {feed['name']}")
             articles = self._fetch_single_feed(feed)
             all_articles.extend(articles)
@@ -596,24 +631,28 @@ class FeedFetcher:
 
             logger.info(f"Found {len(articles)} relevant articles in {feed['name']}")
 
-            # Telemetry: retrieval provenance (structural only)
+            # Telemetry: retrieval provenance (structural only). Only the
+            # stored 50 hashes per list are computed, and only if sampled in.
             if self.research_logger and RKL_LOGGING_AVAILABLE:
-                candidate_hashes = [
-                    sha256_text(entry.get("link", "") or entry.get("id", ""))
-                    for entry in parsed.entries
-                ]
-                selected_hashes = [sha256_text(a["link"]) for a in articles]
-                self.research_logger.log("retrieval_provenance", {
-                    "session_id": self.session_id,
-                    "feed_name": feed.get("name", "unknown"),
-                    "feed_url_hash": sha256_text(feed.get("url", "")),
-                    "candidate_count": len(candidate_hashes),
-                    "selected_count": len(selected_hashes),
-                    "candidate_hashes": candidate_hashes[:50],
-                    "selected_hashes": selected_hashes[:50],
-                    "cutoff_date": self.cutoff_date.strftime("%Y-%m-%d"),
-                    "category": feed.get("category", "general")
-                })
+                def provenance_record():
+                    candidate_hashes = [
+                        sha256_text(entry.get("link", "") or entry.get("id", ""))
+                        for entry in parsed.entries[:50]
+                    ]
+                    selected_hashes = [sha256_text(a["link"]) for a in articles[:50]]
+                    return {
+                        "session_id": self.session_id,
+                        "feed_name": feed.get("name", "unknown"),
+                        "feed_url_hash": sha256_text(feed.get("url", "")),
+                        "candidate_count": len(parsed.entries),
+                        "selected_count": len(articles),
+                        "candidate_hashes": candidate_hashes,
+                        "selected_hashes": selected_hashes,
+                        "cutoff_date": self.cutoff_date.strftime("%Y-%m-%d"),
+                        "category": feed.get("category", "general")
+                    }
+
+                self.research_logger.log("retrieval_provenance", provenance_record, sample_key=self.session_id)
 
         except Exception as e:
             logger.error(f"Error fetching feed {feed['name']}: {e}")
@@ -649,6 +688,608 @@ class FeedFetcher:
         return feedparser.parse(url)
 
 
+QA_SYSTEM_PROMPT = (
+    "You are a senior AI safety researcher specializing in secure reasoning, AI alignment, "
+    "and governance. You provide expert analysis of research relevance to building "
+    "trustworthy, auditable AI systems."
+)
+
+QA_CONTEXT_NOTE = (
+    "IMPORTANT CONTEXT: These summaries are based on article ABSTRACTS (ArXiv) or partial "
+    "content (first 1500 chars), not full papers."
+)
+
+QA_TASK_INSTRUCTIONS = """Your task has TWO parts:
+
+PART A: QUALITY VALIDATION
+1. Do summaries accurately reflect the abstract/excerpt?
+2. Any hallucinations or misrepresentations?
+
+PART B: ORIGINAL SECURE REASONING ANALYSIS
+Secure reasoning encompasses: reasoning provenance, auditability, interpretability, alignment, verification, governance.
+
+Analyze:
+1. Which secure reasoning aspects does this address?
+2. What specific problem does it tackle?
+3. What capability does it enable for practitioners?
+4. How does it connect to secure reasoning challenges?
+5. WHY does this matter (2-3 sentences)?"""
+
+# JSON fields shared by single and batched answers
+QA_JSON_FIELDS = """  "quality_verdict": "pass|fail|uncertain",
+  "quality_confidence": 0.0-1.0,
+  "error_type": "none|hallucination|omission|misrepresentation",
+  "confidence_factors": {
+    "summary_completeness": 0.0-1.0,
+    "technical_accuracy": 0.0-1.0,
+    "clarity": 0.0-1.0,
+    "source_alignment": 0.0-1.0
+  },
+  "confidence_reasoning": "Explanation of confidence factors",
+
+  "relevance_score": 0.0-1.0,
+  "relevance_rationale": "Which secure reasoning aspects this addresses",
+  "key_insight": "2-3 sentences on why this matters to secure reasoning",
+  "practical_value": "What this enables for practitioners",
+  "significance": "breakthrough|important|useful|incremental|tangential",
+  "recommendation": "must-include|include|consider|exclude\""""
+
+QA_ARTICLE_BLOCK = """Article: {title}
+Source: {source}
+Technical Summary: {technical_summary}
+Lay Explanation: {lay_explanation}"""
+
+# Static instruction prefixes: identical for every article, so they are sent as
+# the system instruction (or a provider-side context cache) rather than being
+# repeated inside each per-article prompt
+QA_INSTRUCTIONS = (
+    QA_SYSTEM_PROMPT + "\n\n" + QA_CONTEXT_NOTE + "\n\n" + QA_TASK_INSTRUCTIONS
+    + "\n\nReturn JSON only:\n{\n" + QA_JSON_FIELDS + "\n}"
+)
+
+QA_BATCH_INSTRUCTIONS = (
+    QA_SYSTEM_PROMPT + "\n\n" + QA_CONTEXT_NOTE
+    + "\n\nYou will review several articles, each headed by its article_index. Review each one independently.\n\n"
+    + QA_TASK_INSTRUCTIONS.replace("Your task has", "For EACH article, your task has")
+    + "\n\nReturn JSON only: an array with exactly one object per article, each carrying the"
+    " article_index shown in its header:\n[\n{\n  \"article_index\": N,\n" + QA_JSON_FIELDS + "\n}\n]"
+)
+
+# Per-call prompts carry only the article fields
+QA_BATCH_PROMPT_TEMPLATE = "Review these {count} articles:\n\n{articles}"
+
+QA_VERDICTS = ("pass", "fail", "uncertain")
+QA_SIGNIFICANCE = ("breakthrough", "important", "useful", "incremental", "tangential")
+QA_RECOMMENDATIONS = ("must-include", "include", "consider", "exclude")
+QA_ERROR_TYPES = ("none", "hallucination", "omission", "misrepresentation")
+
+# Structured-output schema (OpenAPI subset accepted by AI Studio and Vertex AI)
+QA_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "quality_verdict": {"type": "string", "enum": list(QA_VERDICTS)},
+        "quality_confidence": {"type": "number"},
+        "error_type": {"type": "string", "enum": list(QA_ERROR_TYPES)},
+        "confidence_factors": {
+            "type": "object",
+            "properties": {
+                "summary_completeness": {"type": "number"},
+                "technical_accuracy": {"type": "number"},
+                "clarity": {"type": "number"},
+                "source_alignment": {"type": "number"}
+            }
+        },
+        "confidence_reasoning": {"type": "string"},
+        "relevance_score": {"type": "number"},
+        "relevance_rationale": {"type": "string"},
+        "key_insight": {"type": "string"},
+        "practical_value": {"type": "string"},
+        "significance": {"type": "string", "enum": list(QA_SIGNIFICANCE)},
+        "recommendation": {"type": "string", "enum": list(QA_RECOMMENDATIONS)}
+    },
+    "required": [
+        "quality_verdict", "quality_confidence", "error_type", "relevance_score",
+        "key_insight", "significance", "recommendation"
+    ]
+}
+
+QA_BATCH_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"article_index": {"type": "integer"}, **QA_RESPONSE_SCHEMA["properties"]},
+        "required": ["article_index"] + QA_RESPONSE_SCHEMA["required"]
+    }
+}
+
+# Cached QA answers are invalidated whenever any QA prompt text or schema changes
+QA_PROMPT_VERSION = hashlib.sha256(
+    (QA_INSTRUCTIONS + QA_BATCH_INSTRUCTIONS + QA_ARTICLE_BLOCK + QA_BATCH_PROMPT_TEMPLATE
+     + json.dumps(QA_RESPONSE_SCHEMA, sort_keys=True)).encode("utf-8")
+).hexdigest()[:16]
+
+
+@dataclass
+class QAAnalysis:
+    """
+    One validated Gemini QA answer.
+
+    Built with from_dict(), which rejects answers outside the schema's enums
+    or ranges, so downstream code never re-checks fields.
+    """
+    quality_verdict: str
+    quality_confidence: float
+    relevance_score: float
+    significance: str
+    recommendation: str
+    error_type: str = "none"
+    confidence_factors: Dict[str, float] = field(default_factory=dict)
+    confidence_reasoning: str = ""
+    relevance_rationale: str = ""
+    key_insight: str = ""
+    practical_value: str = ""
+
+    @classmethod
+    def from_dict(cls, data) -> "QAAnalysis":
+        """
+        Build a typed answer from decoded JSON.
+
+        Raises:
+            ValueError: If a required field is missing or out of range
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        try:
+            analysis = cls(
+                quality_verdict=str(data["quality_verdict"]).lower(),
+                quality_confidence=float(data["quality_confidence"]),
+                relevance_score=float(data["relevance_score"]),
+                significance=data["significance"],
+                recommendation=data["recommendation"],
+                error_type=data.get("error_type") or "none",
+                confidence_factors=data.get("confidence_factors") or {},
+                confidence_reasoning=data.get("confidence_reasoning") or "",
+                relevance_rationale=data.get("relevance_rationale") or "",
+                key_insight=data.get("key_insight") or "",
+                practical_value=data.get("practical_value") or ""
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"missing or malformed field: {e}") from e
+        if analysis.quality_verdict not in QA_VERDICTS:
+            raise ValueError(f"invalid quality_verdict {analysis.quality_verdict!r}")
+        if analysis.significance not in QA_SIGNIFICANCE:
+            raise ValueError(f"invalid significance {analysis.significance!r}")
+        if analysis.recommendation not in QA_RECOMMENDATIONS:
+            raise ValueError(f"invalid recommendation {analysis.recommendation!r}")
+        if not (0.0 <= analysis.quality_confidence <= 1.0 and 0.0 <= analysis.relevance_score <= 1.0):
+            raise ValueError("quality_confidence and relevance_score must be in [0, 1]")
+        if not isinstance(analysis.key_insight, str):
+            raise ValueError("key_insight must be a string")
+        return analysis
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class GeminiQAReviewer:
+    """
+    External QA review of derived summaries using Gemini (Governance Agent Group).
+
+    Agent Role in 18-Agent System:
+    - Agent J: QA Reviewer - validates summary quality and scores secure
+      reasoning relevance (theme gate)
+
+    Type III Implementation:
+    - Input: Derived insights only (title, technical summary, lay explanation)
+    - Processing: External Gemini API (boundary crossing logged by GeminiClient)
+    - Output: gemini_analysis on each article, hallucination_matrix telemetry,
+      and a `_drop` flag for articles below the theme threshold
+
+    Pipelining:
+    - submit() hands each article to a QA worker thread as soon as its
+      summary is ready, so the rate-limited Gemini queue drains while Ollama
+      summarizes the next article instead of idling after the loop.
+    - Without pipelining, reviews are queued and run after the loop (finish()).
+
+    Concurrency:
+    - Workers are bounded by client.max_in_flight: one on the free tier, which
+      keeps calls in submission order behind the rate limiter; several on the
+      Vertex AI paid tier, so QA time tracks the slowest calls, not their sum.
+    - Results are written onto each article in place, so the brief keeps
+      article order; hallucination_matrix rows are logged as reviews complete.
+
+    Batching:
+    - With batch_size k > 1, k articles share one request (one copy of the
+      instruction block) and Gemini returns a JSON array keyed by article_index.
+    - Every element is validated strictly; articles whose element is missing
+      or invalid are retried in smaller batches (halving on a total failure)
+      down to the single-article prompt, so each article still gets its own
+      hallucination_matrix row.
+
+    Prompting:
+    - The static instructions (QA_INSTRUCTIONS / QA_BATCH_INSTRUCTIONS) are the
+      system prompt, which GeminiClient reuses as a system_instruction or a
+      context cache; each request's prompt holds only the article fields.
+
+    Structured output:
+    - Requests carry QA_RESPONSE_SCHEMA (or the array form for batches), so
+      Gemini returns bare JSON that is decoded once (GeminiClient.generate_json)
+      and validated into a QAAnalysis; no fence stripping or re-parsing.
+    - Parse outcomes are counted per model and logged as parse_ok in
+      hallucination_matrix.
+
+    Two-tier review (optional):
+    - With a local_client, each article is first screened by the local Ollama
+      model using the same prompt and schema (run in submit(), so it shares
+      the Ollama queue with summarization instead of competing with it).
+    - Only articles the screen is unsure about are escalated to Gemini:
+      quality_confidence below escalation_confidence, relevance_score within
+      escalation_margin of theme_threshold, or an unusable local answer.
+    - Each hallucination_matrix row records the deciding tier (qa_tier) and
+      the screen's scores, so escalation rates and agreement can be audited.
+    - gemini_analysis also carries qa_tier and qa_model; the brief and blog
+      writers label locally decided answers as a local screen, not Gemini review.
+
+    Caching:
+    - With a ResultCache, answers are stored under a hash of the model name and
+      the filled per-article prompt (title, source, summaries). A hit skips the
+      API call (and its rate-limit wait) and is logged with cache_hit=True.
+
+    Attributes:
+        client (GeminiClient): Configured Gemini client
+        session_id (str): Session identifier for telemetry
+        theme_threshold (float): Minimum relevance_score to keep an article
+        research_logger (StructuredLogger): Optional telemetry logger
+        relevance_model (RelevanceModel): Optional local model trained on verdicts
+        local_client (OllamaClient): Optional local pre-screen model (two-tier mode)
+        escalation_confidence (float): Escalate screens below this quality_confidence
+        escalation_margin (float): Escalate screens this close to theme_threshold
+    """
+
+    def __init__(self, client: 'GeminiClient', session_id: str, theme_threshold: float,
+                 research_logger: Optional['StructuredLogger'] = None,
+                 relevance_model: Optional['RelevanceModel'] = None,
+                 relevance_texts: Optional[Dict[str, str]] = None,
+                 pipelined: bool = True,
+                 batch_size: int = 1,
+                 cache: Optional[ResultCache] = None,
+                 local_client: Optional[OllamaClient] = None,
+                 escalation_confidence: float = 0.7,
+                 escalation_margin: float = 0.15):
+        self.client = client
+        self.session_id = session_id
+        self.theme_threshold = theme_threshold
+        self.research_logger = research_logger
+        self.relevance_model = relevance_model
+        self.relevance_texts = relevance_texts or {}
+        self.batch_size = max(1, batch_size)
+        self.cache = cache
+        self.local_client = local_client
+        self.escalation_confidence = escalation_confidence
+        self.escalation_margin = escalation_margin
+        self.tier_counts = {"local": 0, "gemini": 0}
+        self._screens: Dict[int, QAAnalysis] = {}
+        self._pending: List[tuple] = []
+        self._model_lock = threading.Lock()
+        self.pipelined = pipelined
+        self._deferred: List[List[tuple]] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, getattr(client, "max_in_flight", 1)),
+            thread_name_prefix="gemini_qa"
+        )
+        self._futures: List[Future] = []
+
+    def submit(self, idx: int, article: Dict) -> None:
+        """Queue an article for QA; a full batch is dispatched (deferred when not pipelined)."""
+        if self.cache:
+            cached = self.cache.get(self._cache_key(article))
+            if cached is not None:
+                outcome = self._new_outcome()
+                try:
+                    self._apply_analysis(article, QAAnalysis.from_dict(cached), outcome,
+                                         model=self.client.model_name)
+                    self._record(idx, article, outcome, cache_hit=True)
+                    return
+                except Exception as e:
+                    logger.warning(f"Ignoring unusable cached QA answer for article {idx}: {e}")
+        if self.local_client is not None:
+            screen = self.prescreen(idx, article)
+            if screen is not None and not self._should_escalate(screen):
+                outcome = self._new_outcome()
+                self._apply_analysis(article, screen, outcome,
+                                     tier="local", model=self.local_client.model)
+                self._record(idx, article, outcome, tier="local", screen=screen)
+                return
+            if screen is not None:
+                self._screens[idx] = screen
+        self._pending.append((idx, article))
+        if len(self._pending) >= self.batch_size:
+            self._dispatch()
+
+    def prescreen(self, idx: int, article: Dict) -> Optional[QAAnalysis]:
+        """Quick local QA verdict (None if the local model gave no usable answer)."""
+        resp = self.local_client.generate(
+            self.build_prompt(article),
+            QA_INSTRUCTIONS,
+            agent_id="local_qa",
+            session_id=self.session_id,
+            turn_id=idx,
+            artifact_id=sha256_text(article.get("link", "")) if RKL_LOGGING_AVAILABLE else None,
+            format=QA_RESPONSE_SCHEMA
+        )
+        if not resp:
+            return None
+        try:
+            return QAAnalysis.from_dict(json.loads(resp))
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.info(f"Local QA screen unusable for article {idx}, escalating: {e}")
+            return None
+
+    def _should_escalate(self, screen: QAAnalysis) -> bool:
+        """Escalate low-confidence or borderline-relevance screens to Gemini."""
+        return (
+            screen.quality_confidence < self.escalation_confidence
+            or abs(screen.relevance_score - self.theme_threshold) < self.escalation_margin
+        )
+
+    def _dispatch(self) -> None:
+        """Send pending articles to the workers (or hold them until finish())."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self.pipelined:
+            self._futures.append(self._executor.submit(self._review_group, batch))
+        else:
+            self._deferred.append(batch)
+
+    def _review_group(self, batch: List[tuple]) -> None:
+        if len(batch) == 1:
+            self.review(*batch[0])
+        else:
+            self.review_batch(batch)
+
+    def finish(self) -> None:
+        """Dispatch any partial batch, wait for all reviews and stop the workers."""
+        self._dispatch()
+        for batch in self._deferred:
+            self._futures.append(self._executor.submit(self._review_group, batch))
+        self._deferred = []
+        for future in self._futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Gemini QA worker failed: {e}")
+        self._futures = []
+        self._executor.shutdown(wait=True)
+
+    def _cache_key(self, article: Dict) -> str:
+        # Key on the filled article block, so every interpolated field (source included) counts
+        return ResultCache.key(self.client.model_name, self.build_prompt(article))
+
+    def _store(self, article: Dict, analysis: QAAnalysis) -> None:
+        if self.cache:
+            self.cache.put(self._cache_key(article), analysis.to_dict())
+
+    @staticmethod
+    def _new_outcome() -> Dict:
+        """Telemetry defaults used when QA returns nothing usable."""
+        return {
+            "verdict": "uncertain",
+            "confidence": 0.0,
+            "error_type": "none",
+            "notes": "",
+            "theme_score": None,
+            "theme_verdict": "keep",
+            "recommendation": None,
+            "parse_ok": False
+        }
+
+    @staticmethod
+    def build_prompt(article: Dict) -> str:
+        """Fill the per-article QA prompt (instructions travel as QA_INSTRUCTIONS)."""
+        return QA_ARTICLE_BLOCK.format(
+            title=article.get('title', 'Unknown'),
+            source=article.get('source', 'Unknown'),
+            technical_summary=article.get('technical_summary', ''),
+            lay_explanation=article.get('lay_explanation', '')
+        )
+
+    @staticmethod
+    def build_batch_prompt(batch: List[tuple]) -> str:
+        """Fill the batched QA prompt; each article is headed by its article_index."""
+        blocks = []
+        for idx, article in batch:
+            blocks.append(f"### ARTICLE article_index={idx}\n" + QA_ARTICLE_BLOCK.format(
+                title=article.get('title', 'Unknown'),
+                source=article.get('source', 'Unknown'),
+                technical_summary=article.get('technical_summary', ''),
+                lay_explanation=article.get('lay_explanation', '')
+            ))
+        return QA_BATCH_PROMPT_TEMPLATE.format(count=len(batch), articles="\n\n".join(blocks))
+
+    @staticmethod
+    def _apply_analysis(article: Dict, analysis: QAAnalysis, outcome: Dict,
+                        tier: str = "gemini", model: Optional[str] = None) -> None:
+        """Copy a validated QA answer onto the article and the telemetry outcome.
+
+        tier/model record who produced the answer ("gemini", or "local" for a
+        two-tier screen that was not escalated), so readers never present a
+        local answer as Gemini review.
+        """
+        # PART A: Quality validation
+        outcome["verdict"] = analysis.quality_verdict
+        outcome["confidence"] = analysis.quality_confidence
+        outcome["error_type"] = analysis.error_type
+
+        # PART B: Original analysis
+        outcome["theme_score"] = analysis.relevance_score
+        outcome["recommendation"] = analysis.recommendation
+        outcome["parse_ok"] = True
+
+        # Add Gemini analysis to article
+        article["gemini_analysis"] = {
+            "relevance_score": analysis.relevance_score,
+            "relevance_rationale": analysis.relevance_rationale,
+            "key_insight": analysis.key_insight,
+            "practical_value": analysis.practical_value,
+            "significance": analysis.significance,
+            "recommendation": analysis.recommendation,
+            "quality_verdict": analysis.quality_verdict,
+            "quality_confidence": analysis.quality_confidence,
+            # Phase 1+: Enhanced confidence metrics
+            "confidence_factors": analysis.confidence_factors,
+            "confidence_reasoning": analysis.confidence_reasoning,
+            # Which QA tier and model produced this answer
+            "qa_tier": tier,
+            "qa_model": model
+        }
+
+        # Legacy fields for filtering
+        outcome["theme_verdict"] = "keep" if analysis.recommendation in ["must-include", "include"] else "consider"
+        outcome["notes"] = analysis.key_insight[:200] if analysis.key_insight else ""
+
+    def review(self, idx: int, article: Dict) -> None:
+        """
+        Run Gemini QA on one article, apply the theme gate and log telemetry.
+
+        Args:
+            idx: 1-based article position (used as turn_id)
+            article: Summarized article (mutated in place)
+        """
+        outcome = self._new_outcome()
+        try:
+            parsed = self.client.generate_json(
+                self.build_prompt(article),
+                QA_RESPONSE_SCHEMA,
+                system_prompt=QA_INSTRUCTIONS,
+                temperature=0.2,
+                max_tokens=512,
+                agent_id="gemini_qa",
+                session_id=self.session_id,
+                turn_id=idx,
+                task_type="secure_reasoning_analysis"
+            )
+            if parsed is not None:
+                analysis = QAAnalysis.from_dict(parsed)
+                self._apply_analysis(article, analysis, outcome, model=self.client.model_name)
+                self._store(article, analysis)
+        except Exception as e:
+            logger.warning(f"Gemini QA parse failure on article {idx}: {e}")
+
+        self._record(idx, article, outcome)
+
+    def review_batch(self, batch: List[tuple]) -> None:
+        """
+        Run Gemini QA on several articles in one request, with split-and-retry.
+
+        Args:
+            batch: List of (idx, article) pairs
+        """
+        first_idx = batch[0][0]
+        results: Dict[int, QAAnalysis] = {}
+        try:
+            parsed = self.client.generate_json(
+                self.build_batch_prompt(batch),
+                QA_BATCH_RESPONSE_SCHEMA,
+                system_prompt=QA_BATCH_INSTRUCTIONS,
+                temperature=0.2,
+                max_tokens=min(512 * len(batch), 8192),
+                agent_id="gemini_qa",
+                session_id=self.session_id,
+                turn_id=first_idx,
+                task_type="secure_reasoning_analysis_batch"
+            )
+            if isinstance(parsed, list):
+                wanted = {idx for idx, _ in batch}
+                for element in parsed:
+                    try:
+                        key = int(element["article_index"])
+                        analysis = QAAnalysis.from_dict(element)
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if key in wanted and key not in results:
+                        results[key] = analysis
+        except Exception as e:
+            logger.warning(f"Gemini QA batch starting at article {first_idx} failed: {e}")
+
+        for idx, article in batch:
+            if idx in results:
+                outcome = self._new_outcome()
+                self._apply_analysis(article, results[idx], outcome, model=self.client.model_name)
+                self._store(article, results[idx])
+                self._record(idx, article, outcome, batch_size=len(batch))
+
+        failed = [(idx, article) for idx, article in batch if idx not in results]
+        if not failed:
+            return
+        logger.info(f"Gemini QA batch at article {first_idx}: retrying {len(failed)}/{len(batch)} articles")
+        if len(failed) == len(batch):
+            # Nothing usable came back: split in half so one bad article can't sink the rest
+            mid = len(failed) // 2
+            self._review_group(failed[:mid])
+            self._review_group(failed[mid:])
+        else:
+            self._review_group(failed)
+
+    def _record(self, idx: int, article: Dict, outcome: Dict, batch_size: int = 1,
+                cache_hit: bool = False, tier: str = "gemini",
+                screen: Optional[QAAnalysis] = None) -> None:
+        """Apply the theme gate, log hallucination_matrix and train the relevance model."""
+        theme_score = outcome["theme_score"]
+        if screen is None:
+            screen = self._screens.pop(idx, None)
+        with self._model_lock:
+            self.tier_counts[tier] += 1
+
+        # Apply theme gate if score present
+        keep_article = True
+        if theme_score is not None:
+            try:
+                keep_article = float(theme_score) >= self.theme_threshold
+            except Exception:
+                keep_article = True
+
+        if self.research_logger and RKL_LOGGING_AVAILABLE:
+            self.research_logger.log("hallucination_matrix", {
+                "session_id": self.session_id,
+                "artifact_id": sha256_text(article.get("link", "")),
+                "verdict": outcome["verdict"],
+                "method": "gemini_qa" if tier == "gemini" else "local_qa",
+                "confidence": outcome["confidence"],
+                "error_type": outcome["error_type"],
+                "notes": outcome["notes"],
+                "theme_score": theme_score,
+                "theme_verdict": outcome["theme_verdict"],
+                "theme_threshold": self.theme_threshold,
+                # Local relevance model prediction, for gate precision/recall
+                "relevance_pred": article.get("relevance_pred"),
+                "relevance_gate": article.get("relevance_gate"),
+                "qa_batch_size": batch_size,
+                "cache_hit": cache_hit,
+                "qa_model": self.client.model_name if tier == "gemini" else self.local_client.model,
+                "parse_ok": outcome["parse_ok"],
+                # Two-tier review: which tier decided, and what the local screen said
+                "qa_tier": tier,
+                "prescreen_confidence": screen.quality_confidence if screen else None,
+                "prescreen_relevance": screen.relevance_score if screen else None
+            })
+
+        # Online update of the local relevance model, from fresh Gemini verdicts
+        # only: local screens would train the gate on its own judgments, and
+        # cache hits would repeat the same label on every rerun
+        if self.relevance_model is not None and tier == "gemini" and not cache_hit:
+            label = outcome_label(theme_score, outcome["recommendation"], self.theme_threshold)
+            text = self.relevance_texts.get(article.get("link", ""))
+            if label is not None and text:
+                with self._model_lock:
+                    self.relevance_model.update(text, label)
+
+        # Drop articles that fail the secure reasoning theme gate
+        if not keep_article:
+            logger.info(f"Dropping article {idx} for secure reasoning theme score {theme_score}")
+            article["_drop"] = True
+
+
 def generate_readable_markdown(articles, session_id, output_path):
     """Generate human-readable markdown from articles JSON."""
     with open(output_path, "w") as f:
@@ -682,8 +1323,13 @@ def generate_readable_markdown(articles, session_id, output_path):
             # Gemini Analysis
             gemini = article.get('gemini_analysis', {})
             if gemini:
-                f.write("### 🔍 Expert Secure Reasoning Analysis\n\n")
-                f.write(f"*Generated by Gemini (2.0-flash)*\n\n")
+                if gemini.get('qa_tier') == 'local':
+                    # Two-tier QA: decided by the local screen, never seen by Gemini
+                    f.write("### 🔍 Local Secure Reasoning Screen\n\n")
+                    f.write(f"*Generated by local model ({gemini.get('qa_model') or 'Ollama'}); not reviewed by Gemini*\n\n")
+                else:
+                    f.write("### 🔍 Expert Secure Reasoning Analysis\n\n")
+                    f.write(f"*Generated by Gemini ({gemini.get('qa_model') or '2.0-flash'})*\n\n")
 
                 # Quality check
                 f.write(f"**Quality Verdict:** {gemini.get('quality_verdict', 'N/A').upper()} ")
@@ -729,6 +1375,11 @@ def generate_gemini_blog(brief_json_path, output_path, session_id):
     articles_summary = []
     for idx, article in enumerate(articles, 1):
         gemini_analysis = article.get('gemini_analysis', {})
+        # Two-tier QA: answers decided by the local screen are not Gemini's own
+        if gemini_analysis.get('qa_tier') == 'local':
+            analysis_label = f"Local Model Screen ({gemini_analysis.get('qa_model') or 'Ollama'}, not your review)"
+        else:
+            analysis_label = "Your Prior Analysis"
 
         article_text = f"""
 Article {idx}: {article.get('title', 'Untitled')}
@@ -742,7 +1393,7 @@ Technical Summary (Ollama):
 Lay Explanation (Ollama):
 {article.get('lay_explanation', 'N/A')}
 
-Your Prior Analysis:
+{analysis_label}:
 - Relevance Score: {gemini_analysis.get('relevance_score', 0):.2f} / 1.0
 - Significance: {gemini_analysis.get('significance', 'N/A')}
 - Recommendation: {gemini_analysis.get('recommendation', 'N/A')}
@@ -833,6 +1484,18 @@ Include at the end:
         f.write(blog_content)
 
 
+def budget_exhausted(budget_s: float, elapsed_s: float, durations: List[float]) -> bool:
+    """
+    Whether one more article would overrun a summarization time budget.
+
+    The next article is assumed to take the mean duration so far; a budget of
+    0 (or no finished article yet) never stops the loop.
+    """
+    if budget_s <= 0 or not durations:
+        return False
+    return elapsed_s + sum(durations) / len(durations) > budget_s
+
+
 def main():
     """
     Main entry point for RSS feed processing and article summarization.
@@ -852,13 +1515,16 @@ def main():
     3. **Discovery Phase** (lines 331-341):
        - Agent #1: Feed Monitor fetches RSS feeds
        - Agent #2: Content Filter applies keyword/date filters
-       - Selects top N most recent articles (BRIEF_MAX_ARTICLES)
+       - Ranks candidates by expected value (ArticlePrioritizer) and keeps
+         the top N (BRIEF_MAX_ARTICLES); BRIEF_TIME_BUDGET_S stops early
 
     4. **Processing Phase** (lines 344-362):
        - Agent #3: Summarizer generates technical summaries
        - Agent #4: Metadata Extractor extracts tags
        - Agent #5: Lay Translator creates accessible explanations
        - All processing uses LOCAL Ollama (Type III requirement)
+       - Each finished summary is queued to GeminiQAReviewer (if enabled) so
+         rate-limited QA overlaps with the next summarization
 
     5. **Output Generation** (lines 364-381):
        - Saves JSON with summaries and metadata
@@ -875,6 +1541,21 @@ def main():
         OLLAMA_MODEL: Model to use (default: llama3.2)
         BRIEF_MAX_ARTICLES: Max articles to process (default: 20)
         BRIEF_SUMMARY_MAX_WORDS: Max words per summary (default: 80)
+        GEMINI_QA_PIPELINED: Overlap Gemini QA with summarization (default: true)
+        GEMINI_QA_BATCH_SIZE: Articles reviewed per Gemini request (default: 1)
+        GEMINI_QA_CACHE: Reuse cached QA answers for identical summaries (default: true)
+        GEMINI_QA_CACHE_TTL_DAYS: Lifetime of cached QA answers (default: 30)
+        QA_TWO_TIER: Screen with local Ollama QA first, escalate uncertain articles to Gemini (default: false)
+        QA_ESCALATION_CONFIDENCE: Escalate local screens below this quality_confidence (default: 0.7)
+        QA_ESCALATION_MARGIN: Escalate local screens this close to the theme threshold (default: 0.15)
+        GEMINI_MAX_IN_FLIGHT: Concurrent Gemini requests (default: 8 on Vertex AI, 1 on AI Studio)
+        GEMINI_REQUEST_DEADLINE_S: Per-request Gemini deadline in seconds (default: 120)
+        BRIEF_RANKING: Candidate order, "relevance" (expected value) or "recency" (default: relevance)
+        BRIEF_TIME_BUDGET_S: Stop summarizing when this many seconds are spent (default: 0 = unlimited)
+        BRIEF_RELEVANCE_GATE: Reject candidates the local relevance model predicts Gemini will drop (default: false)
+        BRIEF_RELEVANCE_GATE_THRESHOLD: Minimum predicted keep probability (default: 0.15)
+        BRIEF_ADAPTIVE_POLLING: Only poll feeds likely to have new entries (default: false)
+        BRIEF_FULL_SWEEP: With adaptive polling, force polling every feed (default: false)
 
     Outputs:
         content/briefs/{YYYY-MM-DD}_articles.json containing:
@@ -900,7 +1581,10 @@ def main():
         research_logger = StructuredLogger(
             base_dir=str(research_data_dir),
             rkl_version="1.0",
-            batch_size=50  # Write after 50 records
+            batch_size=50,  # Write after 50 records
+            flush_interval_s=60.0,  # Quiet artifacts (governance_ledger) still reach disk
+            max_buffer_bytes=4 * 1024 * 1024,  # Cap memory for large prompt_preview batches
+            rotate_interval_s=600.0  # Finalize (make readable) at least every 10 min
         )
         logger.info(f"Research telemetry enabled: {research_data_dir}")
     else:
@@ -933,7 +1617,16 @@ def main():
     summarizer = ArticleSummarizer(ollama_client, max_words)
 
     keywords = feeds_config.get("keywords", [])
-    fetcher = FeedFetcher(feeds_config, keywords, research_logger=research_logger, session_id=session_id)
+
+    # Adaptive polling: learn each feed's cadence from retrieval_provenance history
+    scheduler = None
+    if os.getenv("BRIEF_ADAPTIVE_POLLING", "false").lower() in ("1", "true", "yes"):
+        days_back = int(os.getenv("BRIEF_DAYS_BACK", "7"))
+        scheduler = FeedScheduler.from_env(script_dir / "data" / "research", days_back=days_back)
+        logger.info("Adaptive feed polling enabled%s", " (full sweep forced)" if scheduler.full_sweep else "")
+
+    fetcher = FeedFetcher(feeds_config, keywords, research_logger=research_logger,
+                          session_id=session_id, scheduler=scheduler)
 
     def log_human_intervention(intervention_type: str, human_role: str = "operator", target_turn_id: int = 0, rationale_tag: str = "") -> None:
         """Manually log a human intervention event (use during reruns/approvals)."""
@@ -1076,15 +1769,125 @@ def main():
             research_logger.close()
         return
 
-    # Limit number of articles
+    # Local relevance model: score every candidate, optionally gate before summarization
+    relevance_model = None
+    relevance_texts: Dict[str, str] = {}
+    if RELEVANCE_MODEL_AVAILABLE:
+        relevance_model = RelevanceModel.load(script_dir / "data" / "models" / "relevance_model.npz")
+        gate_enabled = os.getenv("BRIEF_RELEVANCE_GATE", "false").lower() in ("1", "true", "yes")
+        gate_threshold = float(os.getenv("BRIEF_RELEVANCE_GATE_THRESHOLD", "0.15"))
+        gate_min_updates = int(os.getenv("BRIEF_RELEVANCE_MIN_UPDATES", "200"))
+        gate_explore = float(os.getenv("BRIEF_RELEVANCE_GATE_EXPLORE", "0.1"))
+        gate_active = gate_enabled and relevance_model.n_updates >= gate_min_updates
+        if gate_enabled and not gate_active:
+            logger.info(
+                f"Relevance gate warming up ({relevance_model.n_updates}/{gate_min_updates} updates); "
+                "scoring only"
+            )
+
+        gated_articles = []
+        for article in articles:
+            text = relevance_text(article["title"], article["content"] or article["summary"], article["source"])
+            relevance_texts[article["link"]] = text
+            article["relevance_pred"] = round(relevance_model.predict(text), 4)
+            article["relevance_gate"] = "pass"
+
+            if gate_active and article["relevance_pred"] < gate_threshold:
+                # Let a small random share through so recall stays measurable
+                if random.random() < gate_explore:
+                    article["relevance_gate"] = "explore"
+                else:
+                    if research_logger and RKL_LOGGING_AVAILABLE:
+                        research_logger.log("hallucination_matrix", {
+                            "session_id": session_id,
+                            "artifact_id": sha256_text(article["link"]),
+                            "verdict": "not_reviewed",
+                            "method": "relevance_gate",
+                            "confidence": 0.0,
+                            "error_type": "none",
+                            "notes": "",
+                            "theme_score": None,
+                            "theme_verdict": "gate_rejected",
+                            "theme_threshold": float(os.getenv("GEMINI_THEME_THRESHOLD", "0.6")),
+                            "relevance_pred": article["relevance_pred"],
+                            "relevance_gate": "rejected"
+                        })
+                    continue
+            gated_articles.append(article)
+
+        if gate_active:
+            logger.info(
+                f"Relevance gate kept {len(gated_articles)}/{len(articles)} candidates "
+                f"(threshold {gate_threshold}, explore {gate_explore})"
+            )
+        articles = gated_articles
+
+    # Rank candidates so the most valuable articles get LLM time first
     max_articles = int(os.getenv("BRIEF_MAX_ARTICLES", "20"))
-    articles = sorted(articles, key=lambda x: x["date"], reverse=True)[:max_articles]
+    if os.getenv("BRIEF_RANKING", "relevance").lower() == "recency":
+        articles = sorted(articles, key=lambda x: x["date"], reverse=True)[:max_articles]
+    else:
+        credibility = {
+            feed["name"]: float(feed["credibility"])
+            for feed in feeds_config.get("feeds", []) if "credibility" in feed
+        }
+        prioritizer = ArticlePrioritizer(keywords, feed_credibility=credibility)
+        prioritizer.learn_from_history(script_dir / "data" / "research")
+        articles = prioritizer.rank(articles)[:max_articles]
+
+    # Optional wall-clock budget for summarization (0 = unlimited)
+    time_budget_s = float(os.getenv("BRIEF_TIME_BUDGET_S", "0"))
+    budget_start = time.time()
+    article_durations: List[float] = []
+    skipped_for_budget = 0
+
+    # Optional Gemini QA / hallucination matrix logging, pipelined with summarization
+    qa_reviewer = None
+    if GEMINI_CLIENT_AVAILABLE and os.getenv("ENABLE_GEMINI_QA", "false").lower() in ("1", "true", "yes"):
+        try:
+            gem_qamodel = os.getenv("GEMINI_QA_MODEL", "gemini-2.0-flash")
+            gem_client = GeminiClient(model_name=gem_qamodel, research_logger=research_logger)
+            qa_cache = None
+            if os.getenv("GEMINI_QA_CACHE", "true").lower() in ("1", "true", "yes"):
+                qa_cache = ResultCache(
+                    "gemini_qa",
+                    ttl_s=float(os.getenv("GEMINI_QA_CACHE_TTL_DAYS", "30")) * 86400,
+                    version=QA_PROMPT_VERSION
+                )
+            qa_reviewer = GeminiQAReviewer(
+                gem_client,
+                session_id=session_id,
+                theme_threshold=float(os.getenv("GEMINI_THEME_THRESHOLD", "0.6")),
+                research_logger=research_logger,
+                relevance_model=relevance_model,
+                relevance_texts=relevance_texts,
+                pipelined=os.getenv("GEMINI_QA_PIPELINED", "true").lower() in ("1", "true", "yes"),
+                batch_size=int(os.getenv("GEMINI_QA_BATCH_SIZE", "1")),
+                cache=qa_cache,
+                local_client=ollama_client if os.getenv("QA_TWO_TIER", "false").lower() in ("1", "true", "yes") else None,
+                escalation_confidence=float(os.getenv("QA_ESCALATION_CONFIDENCE", "0.7")),
+                escalation_margin=float(os.getenv("QA_ESCALATION_MARGIN", "0.15"))
+            )
+            logger.info(f"Gemini QA enabled: processing {len(articles)} articles with {gem_qamodel}")
+        except Exception as e:
+            logger.warning(f"Gemini QA unavailable: {e}")
 
     # Summarize articles
     logger.info(f"Summarizing {len(articles)} articles...")
     summarized_articles = []
 
     for i, article in enumerate(articles, 1):
+        elapsed = time.time() - budget_start
+        if budget_exhausted(time_budget_s, elapsed, article_durations):
+            expected = sum(article_durations) / len(article_durations)
+            skipped_for_budget = len(articles) - i + 1
+            logger.info(
+                f"Time budget {time_budget_s:.0f}s reached after {elapsed:.0f}s "
+                f"(~{expected:.0f}s/article); skipping {skipped_for_budget} lower-priority articles"
+            )
+            break
+
+        article_start = time.time()
         logger.info(f"Processing article {i}/{len(articles)}: {article['title'][:60]}...")
 
         summary = summarizer.summarize_article(
@@ -1099,12 +1902,16 @@ def main():
             "date": article["date"].strftime("%Y-%m-%d"),
             "source": article["source"],
             "category": article["category"],
+            "priority_score": article.get("priority_score"),
+            "relevance_pred": article.get("relevance_pred"),
+            "relevance_gate": article.get("relevance_gate"),
             "raw_content_excerpt": article["content"][:8000]  # What Ollama actually saw (up to 8000 chars)
             # NOTE: When memory upgraded, increase this limit to give Ollama more context
             # llama3.2:3b supports 128K context, so could go much higher
         })
 
         summarized_articles.append(summary)
+        article_durations.append(time.time() - article_start)
 
         # Telemetry: secure reasoning trace bundle (structural)
         # Phase 2 Enhancement: Include timing data for each step
@@ -1196,158 +2003,28 @@ def main():
                 }
             })
 
-    # Optional Gemini QA / hallucination matrix logging
-    def run_gemini_qa(summaries: List[Dict]) -> None:
-        if not GEMINI_CLIENT_AVAILABLE:
-            return
-        if os.getenv("ENABLE_GEMINI_QA", "false").lower() not in ("1", "true", "yes"):
-            return
-        try:
-            gem_qamodel = os.getenv("GEMINI_QA_MODEL", "gemini-2.0-flash")
-            gem_client = GeminiClient(model_name=gem_qamodel, research_logger=research_logger)
-            theme_threshold = float(os.getenv("GEMINI_THEME_THRESHOLD", "0.6"))
-            logger.info(f"Gemini QA enabled: processing {len(summaries)} articles with {gem_qamodel}")
-        except Exception as e:
-            logger.warning(f"Gemini QA unavailable: {e}")
-            return
-
-        for idx, article in enumerate(summaries, 1):
-            prompt = f"""IMPORTANT CONTEXT: These summaries are based on article ABSTRACTS (ArXiv) or partial content (first 1500 chars), not full papers.
-
-Article: {article.get('title', 'Unknown')}
-Source: {article.get('source', 'Unknown')}
-Technical Summary: {article.get('technical_summary','')}
-Lay Explanation: {article.get('lay_explanation','')}
-
-Your task has TWO parts:
-
-PART A: QUALITY VALIDATION
-1. Do summaries accurately reflect the abstract/excerpt?
-2. Any hallucinations or misrepresentations?
-
-PART B: ORIGINAL SECURE REASONING ANALYSIS
-Secure reasoning encompasses: reasoning provenance, auditability, interpretability, alignment, verification, governance.
-
-Analyze:
-1. Which secure reasoning aspects does this address?
-2. What specific problem does it tackle?
-3. What capability does it enable for practitioners?
-4. How does it connect to secure reasoning challenges?
-5. WHY does this matter (2-3 sentences)?
-
-Return JSON only:
-{{
-  "quality_verdict": "pass|fail|uncertain",
-  "quality_confidence": 0.0-1.0,
-  "error_type": "none|hallucination|omission|misrepresentation",
-  "confidence_factors": {{
-    "summary_completeness": 0.0-1.0,
-    "technical_accuracy": 0.0-1.0,
-    "clarity": 0.0-1.0,
-    "source_alignment": 0.0-1.0
-  }},
-  "confidence_reasoning": "Explanation of confidence factors",
-
-  "relevance_score": 0.0-1.0,
-  "relevance_rationale": "Which secure reasoning aspects this addresses",
-  "key_insight": "2-3 sentences on why this matters to secure reasoning",
-  "practical_value": "What this enables for practitioners",
-  "significance": "breakthrough|important|useful|incremental|tangential",
-  "recommendation": "must-include|include|consider|exclude"
-}}"""
-            verdict = "uncertain"
-            confidence = 0.0
-            error_type = "none"
-            notes = ""
-            theme_score = None
-            theme_verdict = "keep"
-            try:
-                resp = gem_client.generate(
-                    prompt,
-                    system_prompt="You are a senior AI safety researcher specializing in secure reasoning, AI alignment, and governance. You provide expert analysis of research relevance to building trustworthy, auditable AI systems.",
-                    temperature=0.2,
-                    max_tokens=512,
-                    agent_id="gemini_qa",
-                    session_id=session_id,
-                    turn_id=idx,
-                    task_type="secure_reasoning_analysis"
-                )
-                if resp:
-                    import json as _json
-                    import re
-                    # Strip markdown code fences if present (Gemini often wraps JSON in ```json...```)
-                    cleaned_resp = resp.strip()
-                    if cleaned_resp.startswith("```"):
-                        # Extract content between code fences
-                        match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', cleaned_resp, re.DOTALL)
-                        if match:
-                            cleaned_resp = match.group(1).strip()
-                    parsed = _json.loads(cleaned_resp)
-                    # PART A: Quality validation
-                    verdict = str(parsed.get("quality_verdict", verdict)).lower()
-                    confidence = float(parsed.get("quality_confidence", confidence))
-                    error_type = parsed.get("error_type", error_type)
-                    # Phase 1+: Confidence breakdown
-                    confidence_factors = parsed.get("confidence_factors", {})
-                    confidence_reasoning = parsed.get("confidence_reasoning", "")
-
-                    # PART B: Original analysis
-                    theme_score = parsed.get("relevance_score", theme_score)
-                    relevance_rationale = parsed.get("relevance_rationale", "")
-                    key_insight = parsed.get("key_insight", "")
-                    practical_value = parsed.get("practical_value", "")
-                    significance = parsed.get("significance", "")
-                    recommendation = parsed.get("recommendation", "")
-
-                    # Add Gemini analysis to article
-                    article["gemini_analysis"] = {
-                        "relevance_score": theme_score,
-                        "relevance_rationale": relevance_rationale,
-                        "key_insight": key_insight,
-                        "practical_value": practical_value,
-                        "significance": significance,
-                        "recommendation": recommendation,
-                        "quality_verdict": verdict,
-                        "quality_confidence": confidence,
-                        # Phase 1+: Enhanced confidence metrics
-                        "confidence_factors": confidence_factors,
-                        "confidence_reasoning": confidence_reasoning
-                    }
-
-                    # Legacy fields for filtering
-                    theme_verdict = "keep" if recommendation in ["must-include", "include"] else "consider"
-                    notes = key_insight[:200] if key_insight else ""
-            except Exception as e:
-                logger.warning(f"Gemini QA parse failure on article {idx}: {e}")
-
-            # Apply theme gate if score present
-            keep_article = True
-            if theme_score is not None:
-                try:
-                    keep_article = float(theme_score) >= theme_threshold
-                except Exception:
-                    keep_article = True
-
-            if research_logger and RKL_LOGGING_AVAILABLE:
-                research_logger.log("hallucination_matrix", {
-                    "session_id": session_id,
-                    "artifact_id": sha256_text(article.get("link","")),
-                    "verdict": verdict,
-                    "method": "gemini_qa",
-                    "confidence": confidence,
-                    "error_type": error_type,
-                    "notes": notes,
-                    "theme_score": theme_score,
-                    "theme_verdict": theme_verdict,
-                    "theme_threshold": theme_threshold
-                })
-
-            # Drop articles that fail the secure reasoning theme gate
-            if not keep_article:
-                logger.info(f"Dropping article {idx} for secure reasoning theme score {theme_score}")
-                summaries[idx-1]["_drop"] = True
+        # Hand the finished summary to Gemini QA while Ollama moves on
+        if qa_reviewer:
+            qa_reviewer.submit(i, summary)
+
+    # Drain the pipelined Gemini QA queue before filtering on its verdicts
+    if qa_reviewer:
+        qa_reviewer.finish()
+        if qa_reviewer.cache:
+            logger.info(f"Gemini QA cache: {qa_reviewer.cache.hits} hits, {qa_reviewer.cache.misses} misses")
+        if qa_reviewer.local_client is not None:
+            logger.info(
+                f"Two-tier QA: {qa_reviewer.tier_counts['local']} decided locally, "
+                f"{qa_reviewer.tier_counts['gemini']} escalated to Gemini"
+            )
+        for model, counts in get_parse_stats().items():
+            logger.info(f"Gemini QA structured output ({model}): {counts['ok']} parsed, {counts['failed']} failed")
 
-    run_gemini_qa(summarized_articles)
+    if relevance_model is not None:
+        try:
+            relevance_model.save()
+        except OSError as e:
+            logger.warning(f"Could not save relevance model: {e}")
 
     # Filter out dropped articles if theme gate marked them
     summarized_articles = [a for a in summarized_articles if not a.get("_drop")]
@@ -1418,6 +2095,8 @@ Return JSON only:
             "articles": summarized_articles,
             "metadata": {
                 "num_articles": len(summarized_articles),
+                "time_budget_s": time_budget_s or None,
+                "skipped_for_budget": skipped_for_budget,
                 "date_range": f"{fetcher.cutoff_date.strftime('%Y-%m-%d')} to {datetime.utcnow().strftime('%Y-%m-%d')}"
             }
         }, f, indent=2)
@@ -6,6 +6,10 @@ This utility reads actual Parquet files and regenerates the daily manifest
 with accurate row counts. Use this to fix manifests that were overwritten
 by the last process to close before the merge fix was applied.
 
+StructuredLogger now merges manifests under an exclusive file lock and only
+adds counts it has not reported yet, so manifests written since then stay
+exact under concurrent writers; this tool is for repairing older dates.
+
 Usage:
     python scripts/fix_manifest.py [--date YYYY-MM-DD] [--base-dir PATH]
 
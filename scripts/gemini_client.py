@@ -10,14 +10,21 @@ processing philosophy through intelligent fallback mechanisms.
 
 import os
 import sys
+import json
+import hashlib
 import logging
+import threading
 import time
 import uuid
-from datetime import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
+from rate_limiter import get_shared_limiter
+
 # Import RKL logging for research telemetry
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -57,6 +64,17 @@ else:
     VERTEX_AI_AVAILABLE = False
 
 
+# JSON parse outcomes of generate_json(), per model, across all clients in the process
+_parse_stats: Dict[str, Dict[str, int]] = {}
+_parse_stats_lock = threading.Lock()
+
+
+def get_parse_stats() -> Dict[str, Dict[str, int]]:
+    """Structured-output parse outcomes per model: {model: {"ok": n, "failed": n}}."""
+    with _parse_stats_lock:
+        return {model: dict(counts) for model, counts in _parse_stats.items()}
+
+
 class GeminiClient:
     """
     Client for interacting with Google's Gemini API.
@@ -65,12 +83,24 @@ class GeminiClient:
     - Automatic API key configuration
     - Error handling and fallback support
     - Token usage tracking
+    - Shared token-bucket rate limiting (free tier), common to every client
+      for the same model in this process and across processes
+    - Bounded concurrency (generate_many) with per-request deadlines, so the
+      paid tier is not limited to one call at a time; on Vertex AI a call
+      abandoned at its deadline counts against max_in_flight until it returns
+    - Static instruction reuse: system prompts are sent as the model's
+      system_instruction, and prefixes long enough for provider-side context
+      caching are uploaded once as CachedContent and referenced per call
     - Integration with RKL's audit framework
 
     Attributes:
         model_name (str): Gemini model to use (e.g., 'gemini-2.0-flash')
         api_key (str): Google AI Studio API key
         model: Configured Gemini model instance
+        max_in_flight (int): Concurrent requests allowed (GEMINI_MAX_IN_FLIGHT)
+        request_deadline_s (float): Per-request deadline (GEMINI_REQUEST_DEADLINE_S)
+        context_cache (bool): Use explicit context caching (GEMINI_CONTEXT_CACHE)
+        context_cache_min_tokens (int): Smallest prefix worth caching
     """
 
     def __init__(self, model_name: str = "gemini-2.0-flash", api_key: Optional[str] = None,
@@ -91,9 +121,45 @@ class GeminiClient:
         self.research_logger = research_logger
         self.use_vertex_ai = USE_VERTEX_AI
 
-        # Rate limiting (only for free tier AI Studio)
-        self.last_request_time = 0
-        self.min_request_interval = 0 if USE_VERTEX_AI else 4.5  # No limit for Vertex AI paid tier
+        # Rate limiting: shared token bucket for the free tier (AI Studio).
+        # Vertex AI paid tier is unlimited unless GEMINI_RPM is set explicitly.
+        self.rate_limiter = None
+        if not USE_VERTEX_AI or os.getenv('GEMINI_RPM'):
+            tier = "vertex" if USE_VERTEX_AI else "aistudio"
+            rpm_raw = os.getenv('GEMINI_RPM', '15')
+            try:
+                rpm = float(rpm_raw)
+            except ValueError:
+                rpm = 0.0
+            if not rpm > 0:
+                raise ValueError(f"GEMINI_RPM must be a positive number, got {rpm_raw!r}")
+            self.rate_limiter = get_shared_limiter(
+                f"{tier}_{self.model_name}",
+                requests_per_minute=rpm,
+                tokens_per_minute=float(os.getenv('GEMINI_TPM', '1000000')),  # <= 0: no token limit
+                burst=float(os.getenv('GEMINI_RATE_BURST', '1'))
+            )
+
+        # Concurrency: the free tier gains nothing from parallel calls (the
+        # token bucket serializes them), the paid tier defaults to 8 in flight
+        self.max_in_flight = max(1, int(os.getenv('GEMINI_MAX_IN_FLIGHT', '8' if USE_VERTEX_AI else '1')))
+        self.request_deadline_s = float(os.getenv('GEMINI_REQUEST_DEADLINE_S', '120'))
+        # Vertex AI calls that outlive their deadline keep running (and billing):
+        # they hold a slot until they actually return, and a retry of the same
+        # call waits for the abandoned one instead of sending a duplicate
+        self._vertex_slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._abandoned: Dict[tuple, tuple] = {}
+        self._abandoned_lock = threading.Lock()
+
+        # Context caching: explicit caches are a paid-tier feature with a provider
+        # minimum size; shorter prefixes go in system_instruction instead
+        self.context_cache = os.getenv(
+            'GEMINI_CONTEXT_CACHE', 'true' if USE_VERTEX_AI else 'false'
+        ).lower() in ('1', 'true', 'yes')
+        self.context_cache_min_tokens = int(os.getenv('GEMINI_CONTEXT_CACHE_MIN_TOKENS', '4096'))
+        self.context_cache_ttl_s = float(os.getenv('GEMINI_CONTEXT_CACHE_TTL_S', '3600'))
+        self._prefix_models: Dict[str, tuple] = {}
+        self._prefix_lock = threading.Lock()
 
         if USE_VERTEX_AI and VERTEX_AI_AVAILABLE:
             # Vertex AI paid tier setup
@@ -136,7 +202,12 @@ class GeminiClient:
             self.model = genai.GenerativeModel(self.model_name)
 
             logger.info(f"Initialized AI Studio client (FREE TIER - Rate limited)")
-            logger.info(f"Rate limiting: {self.min_request_interval}s between requests")
+            tpm = self.rate_limiter.tokens_per_minute
+            tpm_label = f"{tpm:g} TPM" if tpm else "unlimited TPM"
+            logger.info(
+                f"Rate limiting: {self.rate_limiter.requests_per_minute:g} RPM, "
+                f"{tpm_label} (shared token bucket)"
+            )
 
     def generate(
         self,
@@ -148,6 +219,8 @@ class GeminiClient:
         session_id: Optional[str] = None,
         turn_id: Optional[int] = None,
         task_type: Optional[str] = None,
+        deadline_s: Optional[float] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> str:
         """
@@ -155,19 +228,25 @@ class GeminiClient:
 
         Args:
             prompt: User prompt to send to model
-            system_prompt: Optional system instructions (prepended to prompt)
+            system_prompt: Optional system instructions (sent as system_instruction,
+                           or served from a context cache when large enough)
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
             agent_id: Agent identifier for telemetry
             session_id: Session identifier for telemetry
             turn_id: Turn number for telemetry
             task_type: Task type (e.g., 'qa_review', 'fact_check')
+            deadline_s: Seconds to wait for the API once the request is sent
+                        (defaults to request_deadline_s; rate-limit waits excluded)
+            response_schema: Optional OpenAPI-style schema; constrains the answer
+                             to JSON matching it (structured output)
             **kwargs: Additional generation parameters
 
         Returns:
             Generated text response
 
         Raises:
+            TimeoutError: If the API does not answer within the deadline
             Exception: If API call fails (should be caught by caller for fallback)
         """
         start_time = time.time()
@@ -187,42 +266,52 @@ class GeminiClient:
             })
 
         try:
-            # Rate limiting: only for free tier AI Studio
-            if self.min_request_interval > 0:
-                time_since_last_request = time.time() - self.last_request_time
-                if time_since_last_request < self.min_request_interval:
-                    sleep_time = self.min_request_interval - time_since_last_request
-                    logger.info(f"Rate limiting: sleeping {sleep_time:.2f}s before API call")
-                    time.sleep(sleep_time)
-
-            # Combine system prompt and user prompt if both provided
+            # Static instructions travel separately from the per-call prompt
+            model, cache_mode = self._model_for(system_prompt)
             full_prompt = prompt
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
 
+            # Rate limiting: wait for the shared RPM/TPM buckets (~4 chars per token)
+            estimated_tokens = len(full_prompt) // 4
+            rate_limit_wait_ms = 0
+            if self.rate_limiter:
+                waited_s = self.rate_limiter.acquire(tokens=estimated_tokens)
+                rate_limit_wait_ms = int(waited_s * 1000)
+                if waited_s > 0.05:
+                    logger.info(f"Rate limiting: waited {waited_s:.2f}s before API call")
+
+            # Structured output: both SDKs accept the same MIME type + schema pair
+            structured = {}
+            if response_schema:
+                structured = {
+                    "response_mime_type": "application/json",
+                    "response_schema": response_schema
+                }
+
             # Configure generation parameters
             if self.use_vertex_ai:
                 # Vertex AI uses different config format
                 from vertexai.generative_models import GenerationConfig
                 generation_config = GenerationConfig(
                     temperature=temperature,
-                    max_output_tokens=max_tokens if max_tokens else 8192
+                    max_output_tokens=max_tokens if max_tokens else 8192,
+                    **structured
                 )
             else:
                 # AI Studio config
                 generation_config = genai.types.GenerationConfig(
                     temperature=temperature,
                     max_output_tokens=max_tokens,
+                    **structured,
                     **kwargs
                 )
 
             # Generate response
             api_type = "Vertex AI" if self.use_vertex_ai else "AI Studio"
             logger.debug(f"Calling {api_type} with prompt length: {len(full_prompt)} chars")
-            self.last_request_time = time.time()  # Update timestamp before call
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=generation_config
+            response = self._generate_content(
+                model, prompt, generation_config, deadline_s or self.request_deadline_s
             )
 
             # Extract text from response
@@ -231,14 +320,19 @@ class GeminiClient:
                 return ""
 
             # Calculate metrics
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = int((time.time() - start_time) * 1000) - rate_limit_wait_ms
 
             # Try to get token counts from usage_metadata
             prompt_tokens = None
             gen_tokens = None
+            cached_tokens = 0
             if hasattr(response, 'usage_metadata') and response.usage_metadata:
                 prompt_tokens = getattr(response.usage_metadata, 'prompt_token_count', None)
                 gen_tokens = getattr(response.usage_metadata, 'candidates_token_count', None)
+                # Explicit or implicit (automatic prefix) cache hits
+                cached_tokens = getattr(response.usage_metadata, 'cached_content_token_count', 0) or 0
+            if self.rate_limiter:
+                self.rate_limiter.reconcile(estimated_tokens, prompt_tokens)
 
             # Log execution context for research
             if self.research_logger and RKL_LOGGING_AVAILABLE:
@@ -256,7 +350,10 @@ class GeminiClient:
                     "tool_lat_ms": latency_ms,
                     "prompt_id_hash": sha256_text(prompt) if RKL_LOGGING_AVAILABLE else "",
                     "system_prompt_hash": sha256_text(system_prompt) if system_prompt and RKL_LOGGING_AVAILABLE else "",
-                    "token_estimation": "api" if prompt_tokens else "word_count"
+                    "token_estimation": "api" if prompt_tokens else "word_count",
+                    "rate_limit_wait_ms": rate_limit_wait_ms,
+                    "prefix_cache_mode": cache_mode,
+                    "prefix_tokens_saved": cached_tokens
                 })
 
             logger.info(f"Gemini generated {len(response.text)} chars in {latency_ms}ms")
@@ -281,6 +378,202 @@ class GeminiClient:
 
             raise  # Re-raise to allow caller to handle fallback
 
+    def _model_for(self, system_prompt: Optional[str]):
+        """
+        Return (model, cache_mode) for a static instruction prefix.
+
+        Models are built once per distinct prefix. A prefix of at least
+        context_cache_min_tokens (~4 chars per token) is uploaded as a
+        CachedContent with a TTL and rebuilt shortly before it expires;
+        smaller prefixes, or any caching failure, fall back to a model
+        carrying the prefix as system_instruction.
+        """
+        if not system_prompt:
+            return self.model, "none"
+
+        key = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+        with self._prefix_lock:
+            entry = self._prefix_models.get(key)
+            if entry and entry[2] > time.time():
+                return entry[0], entry[1]
+
+            expires = float("inf")
+            model, mode = None, "system_instruction"
+            if self.context_cache and len(system_prompt) // 4 >= self.context_cache_min_tokens:
+                try:
+                    model = self._cached_content_model(system_prompt)
+                    mode = "context_cache"
+                    # Rebuild a minute early so no call races the provider-side expiry
+                    expires = time.time() + self.context_cache_ttl_s - 60
+                except Exception as e:
+                    logger.warning(f"Context cache unavailable, using system_instruction: {e}")
+            if model is None:
+                if self.use_vertex_ai:
+                    model = GenerativeModel(self.model_name, system_instruction=system_prompt)
+                else:
+                    model = genai.GenerativeModel(self.model_name, system_instruction=system_prompt)
+
+            self._prefix_models[key] = (model, mode, expires)
+            return model, mode
+
+    def _cached_content_model(self, system_prompt: str):
+        """Upload a static prefix as provider-side CachedContent and bind a model to it."""
+        ttl = timedelta(seconds=self.context_cache_ttl_s)
+        if self.use_vertex_ai:
+            from vertexai.preview import caching
+            from vertexai.preview.generative_models import GenerativeModel as PreviewModel
+            cached = caching.CachedContent.create(
+                model_name=self.model_name, system_instruction=system_prompt, ttl=ttl
+            )
+            return PreviewModel.from_cached_content(cached_content=cached)
+
+        from google.generativeai import caching
+        cached = caching.CachedContent.create(
+            model=self.model_name, system_instruction=system_prompt, ttl=ttl
+        )
+        return genai.GenerativeModel.from_cached_content(cached_content=cached)
+
+    def _generate_content(self, model, prompt: str, generation_config, deadline_s: float):
+        """Call the SDK, giving up after deadline_s seconds."""
+        if not self.use_vertex_ai:
+            # AI Studio supports a per-request timeout natively
+            return model.generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options={"timeout": deadline_s}
+            )
+
+        # Vertex AI SDK has no per-call timeout: run the call on a daemon thread
+        # and stop waiting when the deadline passes. The abandoned call still
+        # runs to completion, so it keeps its max_in_flight slot until then, and
+        # an identical retry attaches to it rather than paying for a second call.
+        key = (id(model), hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+        with self._abandoned_lock:
+            pending = self._abandoned.get(key)
+        if pending is not None:
+            worker, result = pending
+        else:
+            if not self._vertex_slots.acquire(timeout=deadline_s):
+                raise TimeoutError(
+                    f"No Gemini slot free within {deadline_s:g}s "
+                    f"({self.max_in_flight} call(s) still running)"
+                )
+            result: Dict[str, Any] = {}
+
+            def call():
+                try:
+                    result["response"] = model.generate_content(
+                        prompt,
+                        generation_config=generation_config
+                    )
+                except Exception as e:
+                    result["error"] = e
+                finally:
+                    self._vertex_slots.release()
+
+            worker = threading.Thread(target=call, name="gemini_call", daemon=True)
+            worker.start()
+
+        worker.join(deadline_s)
+        with self._abandoned_lock:
+            if worker.is_alive():
+                # Forget abandoned calls that finished without being retried
+                for stale in [k for k, (t, _) in self._abandoned.items() if not t.is_alive()]:
+                    del self._abandoned[stale]
+                self._abandoned[key] = (worker, result)
+                raise TimeoutError(f"Gemini request exceeded {deadline_s:g}s deadline")
+            if self._abandoned.get(key, (None,))[0] is worker:
+                del self._abandoned[key]
+        if "error" in result:
+            raise result["error"]
+        return result["response"]
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens for this model with the provider tokenizer.
+
+        Falls back to ~4 characters per token if the count request fails.
+        """
+        try:
+            return int(self.model.count_tokens(text).total_tokens)
+        except Exception as e:
+            logger.warning(f"count_tokens failed, estimating: {e}")
+            return len(text) // 4
+
+    def generate_json(self, prompt: str, response_schema: Dict[str, Any], **kwargs) -> Any:
+        """
+        Generate a schema-constrained JSON answer and parse it in one step.
+
+        Args:
+            prompt: User prompt to send to model
+            response_schema: OpenAPI-style schema the answer must follow
+            **kwargs: Passed to generate() (system_prompt, temperature, telemetry ids, ...)
+
+        Returns:
+            The decoded JSON value (None if the model returned nothing)
+
+        Raises:
+            ValueError: If the answer is not valid JSON (counted in get_parse_stats())
+            Exception: If the API call fails
+        """
+        text = self.generate(prompt, response_schema=response_schema, **kwargs)
+        if not text:
+            return None
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as e:
+            self._count_parse(False)
+            raise ValueError(f"{self.model_name} returned invalid JSON: {e}") from e
+        self._count_parse(True)
+        return value
+
+    def _count_parse(self, ok: bool) -> None:
+        with _parse_stats_lock:
+            counts = _parse_stats.setdefault(self.model_name, {"ok": 0, "failed": 0})
+            counts["ok" if ok else "failed"] += 1
+
+    def generate_many(
+        self,
+        requests: List[Dict[str, Any]],
+        max_in_flight: Optional[int] = None,
+        deadline_s: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several generate() calls with bounded concurrency.
+
+        Args:
+            requests: Keyword arguments for generate(), one dict per call
+                      (e.g., {"prompt": ..., "turn_id": 3, "task_type": ...})
+            max_in_flight: Concurrent calls (defaults to max_in_flight)
+            deadline_s: Per-request deadline (defaults to request_deadline_s)
+
+        Returns:
+            One dict per request, in request order, with keys:
+                - response: Generated text ('' on failure)
+                - success: bool
+                - error: Error message (only on failure)
+
+        Example:
+            >>> results = client.generate_many([{"prompt": p} for p in prompts])
+            >>> texts = [r["response"] for r in results if r["success"]]
+        """
+        workers = max(1, min(max_in_flight or self.max_in_flight, len(requests) or 1))
+
+        def run(request: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                params = dict(request)
+                params.setdefault("deadline_s", deadline_s)
+                return {"response": self.generate(**params), "success": True}
+            except Exception as e:
+                return {"response": "", "success": False, "error": str(e)}
+
+        if workers == 1:
+            return [run(request) for request in requests]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gemini") as executor:
+            # map() yields in submission order regardless of completion order
+            return list(executor.map(run, requests))
+
     def check_availability(self) -> bool:
         """
         Test if Gemini API is available and working.
@@ -296,6 +589,122 @@ class GeminiClient:
             return False
 
 
+DEFAULT_HEALTH_DIR = Path(__file__).parent.parent / "data" / "cache" / "gemini_health"
+
+
+class GeminiHealthTracker:
+    """
+    Lazy circuit breaker for the Gemini backend.
+
+    Gemini is assumed available until a real call fails; each consecutive
+    failure closes the route for an exponentially growing backoff. Once it
+    expires the breaker is half-open: exactly one caller of acquire() is let
+    through as the re-probe, and everyone else stays on the fallback until
+    that request succeeds (or its backoff passes again). No test generation
+    is ever spent on health checks.
+
+    State is mirrored to a small JSON file, so back-to-back short-lived
+    scripts skip a backend that just failed without each paying for a failed
+    request of their own. A persisted backoff is honoured until retry_at
+    passes, however long that is; ttl_s only limits how long the failure
+    count of an expired backoff is remembered.
+
+    Attributes:
+        name (str): Backend identifier (also the state file name)
+        ttl_s (float): How long an expired backoff's state is still trusted
+        backoff_s (float): Backoff after the first failure
+        max_backoff_s (float): Upper bound on the backoff
+    """
+
+    def __init__(self, name: str, ttl_s: float = 300.0, backoff_s: float = 30.0,
+                 max_backoff_s: float = 900.0, state_dir: Optional[Path] = None):
+        self.name = name
+        self.ttl_s = ttl_s
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.state_path = Path(state_dir or DEFAULT_HEALTH_DIR) / f"{name}.json"
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_error = ""
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        now = time.time()
+        retry_at = float(state.get("retry_at", 0.0))
+        if retry_at <= now and now - float(state.get("updated", 0)) > self.ttl_s:
+            return
+        self.failures = int(state.get("failures", 0))
+        self.retry_at = float(state.get("retry_at", 0.0))
+        self.last_error = state.get("last_error", "")
+
+    def _save(self) -> None:
+        tmp_path = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({
+                    "updated": time.time(),
+                    "failures": self.failures,
+                    "retry_at": self.retry_at,
+                    "last_error": self.last_error
+                }, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.debug(f"Could not persist Gemini health state: {e}")
+
+    def _backoff(self) -> float:
+        return min(self.backoff_s * 2 ** (self.failures - 1), self.max_backoff_s)
+
+    def available(self) -> bool:
+        """True when healthy, or when the backoff has elapsed (does not claim the probe)."""
+        return self.failures == 0 or time.time() >= self.retry_at
+
+    def acquire(self) -> bool:
+        """
+        Whether this caller may send a request now.
+
+        While half-open only the first caller gets True: it claims the
+        re-probe by pushing retry_at out by the current backoff, so a probe
+        that never reports back cannot hold the route closed forever.
+        """
+        if self.failures == 0:
+            return True
+        with self._lock:
+            if self.failures == 0:
+                return True
+            now = time.time()
+            if now < self.retry_at:
+                return False
+            self.retry_at = now + self._backoff()
+            self._save()
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.failures == 0:
+                return
+            logger.info(f"Gemini ({self.name}) healthy again after {self.failures} failure(s)")
+            self.failures = 0
+            self.retry_at = 0.0
+            self.last_error = ""
+            self._save()
+
+    def record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.failures += 1
+            backoff = self._backoff()
+            self.retry_at = time.time() + backoff
+            self.last_error = str(error)[:200]
+            logger.warning(f"Gemini ({self.name}) marked unhealthy; re-probing in {backoff:.0f}s")
+            self._save()
+
+
 class HybridModelClient:
     """
     Hybrid client that uses Gemini for critical tasks with Ollama fallback.
@@ -305,19 +714,47 @@ class HybridModelClient:
     - Ollama (local): For bulk processing, summarization, metadata extraction
 
     Provides automatic fallback if Gemini is unavailable or rate-limited.
+    Availability is tracked lazily (GeminiHealthTracker): construction makes
+    no API calls, and failed calls route traffic to Ollama until a backoff
+    expires.
 
     Attributes:
         gemini_client: GeminiClient instance (or None if unavailable)
         ollama_client: OllamaClient instance for fallback
         use_gemini_for: List of task types to prefer Gemini
+        health: GeminiHealthTracker for the Gemini backend (or None)
+        hedge (bool): Hedge Gemini requests with Ollama by default
+
+    Hedged mode (opt-in):
+    - Gemini is the primary; if it has not answered within the p90 of its
+      recent latencies, the same request is also sent to Ollama and the first
+      non-empty answer wins.
+    - A loser that has not started is cancelled; one already in flight runs
+      to completion and its answer is discarded (neither SDK can abort a
+      request mid-call), so each backend still logs its own boundary_event.
+    - Every hedged request logs a hedge_events record (winner, latencies,
+      estimated savings); win counts are also reported by get_status().
+
+    Environment Variables:
+        GEMINI_HEALTH_TTL_S: How long an expired backoff is remembered (default: 300)
+        GEMINI_HEALTH_BACKOFF_S: Backoff after the first failure (default: 30)
+        GEMINI_HEALTH_MAX_BACKOFF_S: Maximum backoff (default: 900)
+        HYBRID_HEDGE: Enable hedged mode by default (default: false)
+        HYBRID_HEDGE_DELAY_S: Hedge delay until enough latencies are seen (default: 3)
     """
 
+    # Hedge after this quantile of recent primary latencies
+    HEDGE_QUANTILE = 0.9
+    HEDGE_MIN_SAMPLES = 10
+    LATENCY_WINDOW = 50
+
     def __init__(
         self,
         ollama_client,
         gemini_model: str = "gemini-2.0-flash",
         use_gemini_for: Optional[list] = None,
-        research_logger: Optional['StructuredLogger'] = None
+        research_logger: Optional['StructuredLogger'] = None,
+        hedge: Optional[bool] = None
     ):
         """
         Initialize hybrid client with both Gemini and Ollama.
@@ -328,19 +765,34 @@ class HybridModelClient:
             use_gemini_for: List of task types to prefer Gemini for
                            (e.g., ['qa_review', 'fact_check', 'governance'])
             research_logger: Optional StructuredLogger for research telemetry
+            hedge: Hedge Gemini with Ollama by default (defaults to HYBRID_HEDGE)
         """
         self.ollama_client = ollama_client
         self.research_logger = research_logger
-
-        # Try to initialize Gemini (may fail if not available)
+        if hedge is None:
+            hedge = os.getenv('HYBRID_HEDGE', 'false').lower() in ('1', 'true', 'yes')
+        self.hedge = hedge
+        self.default_hedge_delay_s = float(os.getenv('HYBRID_HEDGE_DELAY_S', '3'))
+        self._gemini_latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
+        self.hedge_stats = {'requests': 0, 'hedged': 0, 'gemini_wins': 0, 'ollama_wins': 0}
+
+        # Try to initialize Gemini (may fail if not configured); no API call is made here
+        self.health = None
         try:
             self.gemini_client = GeminiClient(model_name=gemini_model, research_logger=research_logger)
-            self.gemini_available = self.gemini_client.check_availability()
-            logger.info("Gemini client initialized and available")
+            tier = "vertex" if self.gemini_client.use_vertex_ai else "aistudio"
+            self.health = GeminiHealthTracker(
+                f"{tier}_{gemini_model}",
+                ttl_s=float(os.getenv('GEMINI_HEALTH_TTL_S', '300')),
+                backoff_s=float(os.getenv('GEMINI_HEALTH_BACKOFF_S', '30')),
+                max_backoff_s=float(os.getenv('GEMINI_HEALTH_MAX_BACKOFF_S', '900'))
+            )
+            logger.info("Gemini client initialized (availability tracked lazily)")
         except Exception as e:
             logger.warning(f"Gemini initialization failed: {e}. Using Ollama only.")
             self.gemini_client = None
-            self.gemini_available = False
 
         # Default task types for Gemini (critical tasks)
         self.use_gemini_for = use_gemini_for or [
@@ -350,6 +802,11 @@ class HybridModelClient:
             'compliance_check'
         ]
 
+    @property
+    def gemini_available(self) -> bool:
+        """Whether requests may be routed to Gemini right now (status only; routing uses acquire())."""
+        return self.gemini_client is not None and self.health.available()
+
     def generate(
         self,
         prompt: str,
@@ -359,6 +816,7 @@ class HybridModelClient:
         agent_id: str = "hybrid_qa",
         session_id: Optional[str] = None,
         turn_id: Optional[int] = None,
+        hedge: Optional[bool] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -372,6 +830,7 @@ class HybridModelClient:
             agent_id: Agent identifier for telemetry
             session_id: Session identifier for telemetry
             turn_id: Turn number for telemetry
+            hedge: Hedge this request with Ollama (defaults to self.hedge)
             **kwargs: Additional generation parameters
 
         Returns:
@@ -382,10 +841,9 @@ class HybridModelClient:
         """
         # Determine which model to use
         should_use_gemini = (
-            self.gemini_available and (
-                prefer_gemini or
-                task_type in self.use_gemini_for
-            )
+            self.gemini_client is not None and
+            (prefer_gemini or task_type in self.use_gemini_for) and
+            self.health.acquire()
         )
 
         # Log reasoning graph edge: route decision
@@ -402,16 +860,15 @@ class HybridModelClient:
                 "content_hash": sha256_text(task_type or "routing") if RKL_LOGGING_AVAILABLE else ""
             })
 
+        if should_use_gemini and (self.hedge if hedge is None else hedge):
+            return self._generate_hedged(
+                prompt, system_prompt, task_type, agent_id, session_id, turn_id, **kwargs
+            )
+
         if should_use_gemini:
             try:
-                response = self.gemini_client.generate(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    turn_id=turn_id,
-                    task_type=task_type,
-                    **kwargs
+                response = self._call_gemini(
+                    prompt, system_prompt, task_type, agent_id, session_id, turn_id, **kwargs
                 )
                 return {
                     'response': response,
@@ -424,12 +881,7 @@ class HybridModelClient:
 
         # Use Ollama (fallback or default)
         try:
-            response = self.ollama_client.generate(
-                prompt, system_prompt,
-                agent_id=agent_id,
-                session_id=session_id,
-                turn_id=turn_id
-            )
+            response = self._call_ollama(prompt, system_prompt, agent_id, session_id, turn_id)
             return {
                 'response': response,
                 'model_used': f'ollama ({self.ollama_client.model})',
@@ -444,6 +896,142 @@ class HybridModelClient:
                 'error': str(e)
             }
 
+    def _call_gemini(self, prompt, system_prompt, task_type, agent_id, session_id, turn_id, **kwargs) -> str:
+        """Gemini call with health tracking and latency sampling (raises on failure)."""
+        start = time.time()
+        try:
+            response = self.gemini_client.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                agent_id=agent_id,
+                session_id=session_id,
+                turn_id=turn_id,
+                task_type=task_type,
+                **kwargs
+            )
+        except Exception as e:
+            self.health.record_failure(e)
+            raise
+        self.health.record_success()
+        self._gemini_latencies.append(time.time() - start)
+        return response
+
+    def _call_ollama(self, prompt, system_prompt, agent_id, session_id, turn_id) -> str:
+        return self.ollama_client.generate(
+            prompt, system_prompt,
+            agent_id=agent_id,
+            session_id=session_id,
+            turn_id=turn_id
+        )
+
+    def hedge_delay_s(self) -> float:
+        """p90 of recent Gemini latencies, or the default until enough are seen."""
+        samples = sorted(self._gemini_latencies)
+        if len(samples) < self.HEDGE_MIN_SAMPLES:
+            return self.default_hedge_delay_s
+        return samples[min(int(self.HEDGE_QUANTILE * len(samples)), len(samples) - 1)]
+
+    def _generate_hedged(self, prompt, system_prompt, task_type, agent_id, session_id, turn_id,
+                         **kwargs) -> Dict[str, Any]:
+        """Race Gemini against a delayed Ollama request; first non-empty answer wins."""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hedge")
+        executor = self._hedge_executor
+
+        finished_at: Dict[str, float] = {}
+
+        def timed(backend, fn, *args, **kw):
+            try:
+                return fn(*args, **kw)
+            finally:
+                finished_at[backend] = time.time()
+
+        delay_s = self.hedge_delay_s()
+        start = time.time()
+        primary = executor.submit(
+            timed, 'gemini', self._call_gemini,
+            prompt, system_prompt, task_type, agent_id, session_id, turn_id, **kwargs
+        )
+        wait([primary], timeout=delay_s)
+
+        secondary = None
+        secondary_start = None
+        if not (primary.done() and not primary.exception() and primary.result()):
+            secondary_start = time.time()
+            secondary = executor.submit(
+                timed, 'ollama', self._call_ollama,
+                prompt, system_prompt, agent_id, session_id, turn_id
+            )
+
+        winner, response = None, ''
+        pending = {f for f in (primary, secondary) if f is not None}
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary when both finished in the same wakeup
+            for future in sorted(done, key=lambda f: f is not primary):
+                if not future.exception() and future.result():
+                    winner = 'gemini' if future is primary else 'ollama'
+                    response = future.result()
+                    break
+        for future in pending:
+            future.cancel()
+        latency_s = time.time() - start
+
+        with self._hedge_lock:
+            self.hedge_stats['requests'] += 1
+            if secondary is not None:
+                self.hedge_stats['hedged'] += 1
+            if winner:
+                self.hedge_stats[f'{winner}_wins'] += 1
+
+        # Savings are only known once the primary finishes (immediately, unless Ollama won)
+        def log_outcome(_future):
+            primary_ok = not primary.cancelled() and not primary.exception() and bool(primary.result())
+            primary_s = finished_at.get('gemini', time.time()) - start
+            # Unhedged cost: the primary's latency, plus an Ollama fallback if it failed
+            unhedged_s = primary_s
+            if not primary_ok and secondary_start is not None and 'ollama' in finished_at:
+                unhedged_s += finished_at['ollama'] - secondary_start
+            self._log_hedge_event(
+                agent_id, session_id, task_type, delay_s, secondary is not None, winner,
+                latency_s, primary_s, primary_ok, unhedged_s - latency_s
+            )
+
+        primary.add_done_callback(log_outcome)
+
+        if winner is None:
+            logger.error("Both Gemini and Ollama failed (hedged)")
+            error = primary.exception() if not primary.cancelled() else None
+            return {'response': '', 'model_used': 'none', 'success': False,
+                    'error': str(error or 'empty responses')}
+        model = self.gemini_client.model_name if winner == 'gemini' else self.ollama_client.model
+        return {'response': response, 'model_used': f'{winner} ({model})', 'success': True,
+                'hedged': secondary is not None}
+
+    def _log_hedge_event(self, agent_id, session_id, task_type, delay_s, hedged, winner,
+                         latency_s, primary_s, primary_ok, saved_s) -> None:
+        """Record one hedged request's outcome (hedge_events artifact)."""
+        if not (self.research_logger and RKL_LOGGING_AVAILABLE):
+            return
+        self.research_logger.log("hedge_events", {
+            "event_id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "t": int(time.time() * 1000),
+            "session_id": session_id or "unknown",
+            "agent_id": agent_id,
+            "task_type": task_type or "unknown",
+            "primary": "gemini",
+            "secondary": "ollama",
+            "hedge_delay_ms": int(delay_s * 1000),
+            "hedged": hedged,
+            "winner": winner or "none",
+            "latency_ms": int(latency_s * 1000),
+            "primary_latency_ms": int(primary_s * 1000),
+            "primary_ok": primary_ok,
+            "saved_ms": int(saved_s * 1000)
+        })
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get status of both model backends.
@@ -453,6 +1041,9 @@ class HybridModelClient:
         """
         return {
             'gemini_available': self.gemini_available,
+            'gemini_failures': self.health.failures if self.health else None,
+            'hedge': self.hedge,
+            'hedge_stats': dict(self.hedge_stats),
             'gemini_model': self.gemini_client.model_name if self.gemini_client else None,
             'ollama_available': bool(self.ollama_client),
             'ollama_model': self.ollama_client.model if self.ollama_client else None,
@@ -42,6 +42,11 @@ def generate_blog_post(brief_json_path: Path, output_path: Path):
     articles_summary = []
     for idx, article in enumerate(articles, 1):
         gemini_analysis = article.get('gemini_analysis', {})
+        # Two-tier QA: answers decided by the local screen are not Gemini's own
+        if gemini_analysis.get('qa_tier') == 'local':
+            analysis_label = f"Local Model Screen ({gemini_analysis.get('qa_model') or 'Ollama'}, not your review)"
+        else:
+            analysis_label = "Your Prior Analysis"
 
         article_text = f"""
 Article {idx}: {article.get('title', 'Untitled')}
@@ -55,7 +60,7 @@ Technical Summary (Ollama):
 Lay Explanation (Ollama):
 {article.get('lay_explanation', 'N/A')}
 
-Your Prior Analysis:
+{analysis_label}:
 - Relevance Score: {gemini_analysis.get('relevance_score', 0):.2f} / 1.0
 - Significance: {gemini_analysis.get('significance', 'N/A')}
 - Recommendation: {gemini_analysis.get('recommendation', 'N/A')}
@@ -74,7 +74,7 @@ Source: {article.get('source', 'Unknown')}
 Link: {article.get('link', 'N/A')}
 Summary: {tech_summary}
 Tags: {', '.join(article.get('tags', [])[:5])}
-Significance: {gemini.get('significance', 'N/A')} | Relevance: {gemini.get('relevance_score', 0):.2f}
+Significance: {gemini.get('significance', 'N/A')} | Relevance: {gemini.get('relevance_score', 0):.2f}{' (local screen, not Gemini review)' if gemini.get('qa_tier') == 'local' else ''}
 Key Insight: {gemini.get('key_insight', 'N/A')[:150]}
 """
         summaries.append(summary)
@@ -82,33 +82,12 @@ Key Insight: {gemini.get('key_insight', 'N/A')[:150]}
     return '\n'.join(summaries)
 
 
-def build_daily_brief_prompt(articles, breakdown, tags, date):
-    """Build Gemini prompt for daily brief generation."""
-
-    # Get high priority papers (breakthrough or important)
-    high_priority = [a for a in articles if
-                     a.get('gemini_analysis', {}).get('significance') in ['breakthrough', 'important']]
-
-    # Format top tags
-    top_tags_str = ' • '.join([f"#{tag} ({count})" for tag, count in tags])
+# Static style guide, sent as the system prompt so GeminiClient can reuse it
+# across briefs (system_instruction or context cache) instead of resending it
+# inside every prompt
+DAILY_SYSTEM_PROMPT = "You are a senior AI researcher writing concise daily updates for busy practitioners."
 
-    # Prepare article summaries
-    articles_text = prepare_article_summaries(articles)
-
-    prompt = f"""You are writing a DAILY executive brief for the Resonant Knowledge Lab's
-"Secure Reasoning Research Brief."
-
-AUDIENCE: Busy AI practitioners, researchers, and governance professionals who need quick daily updates.
-
-YOUR TASK: Create a scannable 2-3 minute read highlighting today's most important findings.
-
-TODAY'S COLLECTION ({date}):
-- Total papers: {len(articles)}
-- Breakdown: {dict(breakdown)}
-- Top tags: {top_tags_str}
-- High priority: {len(high_priority)} papers
-
-YOUR DAILY BRIEF SHOULD FOLLOW THIS STRUCTURE:
+DAILY_STYLE_GUIDE = """YOUR DAILY BRIEF SHOULD FOLLOW THIS STRUCTURE:
 
 1. **Title** (compelling headline summarizing the day's theme)
    - One concise sentence capturing what matters most today
@@ -147,6 +126,36 @@ DO NOT:
 - List every paper
 - Use academic jargon without context
 - Write more than 800 words total
+"""
+
+
+def build_daily_brief_prompt(articles, breakdown, tags, date):
+    """Build Gemini prompt for daily brief generation."""
+
+    # Get high priority papers (breakthrough or important)
+    high_priority = [a for a in articles if
+                     a.get('gemini_analysis', {}).get('significance') in ['breakthrough', 'important']]
+
+    # Format top tags
+    top_tags_str = ' • '.join([f"#{tag} ({count})" for tag, count in tags])
+
+    # Prepare article summaries
+    articles_text = prepare_article_summaries(articles)
+
+    prompt = f"""You are writing a DAILY executive brief for the Resonant Knowledge Lab's
+"Secure Reasoning Research Brief."
+
+AUDIENCE: Busy AI practitioners, researchers, and governance professionals who need quick daily updates.
+
+YOUR TASK: Create a scannable 2-3 minute read highlighting today's most important findings.
+
+TODAY'S COLLECTION ({date}):
+- Total papers: {len(articles)}
+- Breakdown: {dict(breakdown)}
+- Top tags: {top_tags_str}
+- High priority: {len(high_priority)} papers
+
+Follow the daily brief structure and style requirements in your instructions.
 
 ---
 
@@ -216,7 +225,7 @@ def generate_daily_brief(json_path: Path, output_path: Path = None):
 
     response = gem_client.generate(
         prompt,
-        system_prompt="You are a senior AI researcher writing concise daily updates for busy practitioners.",
+        system_prompt=f"{DAILY_SYSTEM_PROMPT}\n\n{DAILY_STYLE_GUIDE}",
         temperature=0.5,  # Lower for consistency
         max_tokens=1500,  # Shorter output
         agent_id="daily_brief_writer",
@@ -4,12 +4,28 @@ Generate weekly blog post from past week's daily briefs.
 
 Runs Monday 10 AM to synthesize the previous week's research into a cohesive
 weekly digest with trends, highlights, and recommendations.
+
+Large weeks are synthesized map-reduce style: articles are grouped per day
+(split into clusters of at most WEEKLY_MAP_CLUSTER_SIZE), each cluster is
+condensed into citation-preserving notes by parallel Gemini calls (cached by
+input hash in data/cache/weekly_map, so re-runs reuse them), and a final
+reduce pass writes the blog from those notes. Article numbers are global
+(rank order) in both passes, so [N] citations resolve the same way.
+
+Environment Variables:
+    WEEKLY_CONTEXT_BUDGET_TOKENS: Token budget for the article list (default: 32000)
+    WEEKLY_SYNTHESIS_MODE: single, map_reduce, or auto (map-reduce when fewer than
+                           half the articles fit the budget in full; default: auto)
+    WEEKLY_MAP_CLUSTER_SIZE: Max articles per map cluster (default: 40)
 """
 
+import hashlib
 import json
+import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 
 # Add parent directory to path for imports
 script_dir = Path(__file__).parent
@@ -23,6 +39,9 @@ except ImportError as e:
     GEMINI_AVAILABLE = False
     sys.exit(1)
 
+from prompt_packer import PromptPacker, article_priority
+from result_cache import ResultCache
+
 
 def load_past_week_briefs(content_dir: Path, days: int = 7):
     """Load all daily briefs from the past week."""
@@ -67,6 +86,158 @@ def load_past_week_briefs(content_dir: Path, days: int = 7):
     return all_articles, recent_briefs
 
 
+# Static digest structure and style, sent as the system prompt so GeminiClient
+# can reuse it (system_instruction or context cache) across weekly runs
+WEEKLY_SYSTEM_PROMPT = (
+    "You are a senior AI safety researcher and excellent technical writer. You write insightful "
+    "weekly digests synthesizing trends in secure reasoning research for practitioners."
+)
+
+WEEKLY_STYLE_GUIDE = """YOUR WEEKLY DIGEST SHOULD:
+
+1. **Opening Context** (2-3 paragraphs)
+   - What was the big picture this week in secure reasoning research?
+   - What major themes or trends emerged?
+   - How does this week compare to typical weeks?
+
+2. **Top Papers of the Week** (3-5 papers)
+   - Feature the most significant contributions (breakthrough/important papers)
+   - For each: title, why it matters, practical implications
+   - Focus on papers that advance secure reasoning meaningfully
+   - IMPORTANT: Cite papers using [N] format where N is the article number in the article list
+
+3. **Emerging Trends** (2-3 trends)
+   - What patterns do you see across multiple papers?
+   - Are researchers converging on certain approaches?
+   - What aspects of secure reasoning are getting attention?
+   - Examples: "provenance tracking methods", "alignment through diverse feedback", etc.
+   - Cite papers using [N] format when referencing specific work
+
+4. **Notable Mentions** (brief list)
+   - Other papers worth tracking (useful/incremental)
+   - Quick highlights without deep analysis
+   - Cite papers using [N] format
+
+5. **What's Missing** (1 paragraph)
+   - What aspects of secure reasoning are under-researched this week?
+   - What gaps should the community address?
+
+6. **Weekly Recommendations** (3-5 concrete actions)
+   - What should practitioners focus on based on this week's research?
+   - What capabilities are becoming more mature?
+   - What risks need attention?
+
+7. **Looking Ahead** (closing paragraph)
+   - What to watch for in coming weeks
+   - What questions remain open
+
+STYLE:
+- Professional but engaging weekly newsletter tone
+- Synthesize across papers, don't just list them
+- Show connections and patterns
+- Be honest about abstract-only limitations
+- Focus on "what this means" not just "what happened"
+"""
+
+
+WEEKLY_MAP_SYSTEM_PROMPT = (
+    "You are a senior AI safety researcher condensing research articles into accurate, "
+    "citation-preserving notes for a weekly digest."
+)
+
+WEEKLY_MAP_PROMPT = """Read the articles below ({label}) and write 200-350 words of synthesis notes:
+- 2-4 themes these articles share, citing supporting articles as [N]
+- The most significant papers and why they matter, cited as [N]
+- Gaps or open questions they raise
+
+Cite ONLY with the [N] numbers shown below, exactly as given. Do not renumber.
+
+{articles}
+"""
+
+# Cached map notes are invalidated whenever the map prompt changes
+WEEKLY_MAP_VERSION = hashlib.sha256(
+    (WEEKLY_MAP_SYSTEM_PROMPT + WEEKLY_MAP_PROMPT).encode("utf-8")
+).hexdigest()[:16]
+
+
+def build_clusters(numbered, max_size: int):
+    """
+    Group (number, article) pairs per brief date, splitting large days.
+
+    Returns:
+        List of (label, [(number, article), ...]) in date order
+    """
+    by_day = {}
+    for number, article in numbered:
+        by_day.setdefault(article.get('_brief_date', 'Unknown date'), []).append((number, article))
+
+    clusters = []
+    for day in sorted(by_day):
+        members = sorted(by_day[day], key=lambda item: item[0])
+        parts = [members[i:i + max_size] for i in range(0, len(members), max_size)]
+        for part_idx, part in enumerate(parts, 1):
+            label = day if len(parts) == 1 else f"{day}, part {part_idx}/{len(parts)}"
+            clusters.append((label, part))
+    return clusters
+
+
+def run_map_phase(gem_client, clusters, format_full, format_brief, session_id: str,
+                  cache: Optional[ResultCache] = None):
+    """
+    Condense each cluster into notes with parallel, cached Gemini calls.
+
+    Cluster calls go through GeminiClient.generate_many, so they share the
+    client's rate limiter and max_in_flight bound. A failed cluster falls back
+    to its one-line entries so its articles can still be cited.
+
+    Args:
+        cache: Map note cache (defaults to data/cache/weekly_map)
+
+    Returns:
+        List of note strings, one per cluster
+    """
+    cache = cache or ResultCache("weekly_map", version=WEEKLY_MAP_VERSION)
+    notes = [None] * len(clusters)
+    keys, requests, pending = [], [], []
+
+    for i, (label, members) in enumerate(clusters):
+        prompt = WEEKLY_MAP_PROMPT.format(
+            label=label,
+            articles="".join(format_full(number, article) for number, article in members)
+        )
+        key = cache.key(gem_client.model_name, prompt)
+        keys.append(key)
+        cached = cache.get(key)
+        if cached:
+            notes[i] = cached
+            continue
+        pending.append(i)
+        requests.append({
+            "prompt": prompt,
+            "system_prompt": WEEKLY_MAP_SYSTEM_PROMPT,
+            "temperature": 0.3,
+            "max_tokens": 1024,
+            "agent_id": "weekly_map_writer",
+            "session_id": session_id,
+            "turn_id": i + 1,
+            "task_type": "weekly_blog_map"
+        })
+
+    print(f"Map phase: {len(clusters)} clusters ({len(clusters) - len(pending)} cached, {len(pending)} to generate)")
+    results = gem_client.generate_many(requests) if requests else []
+
+    for i, result in zip(pending, results):
+        text = result["response"].strip() if result["success"] else ""
+        if text:
+            cache.put(keys[i], text)
+            notes[i] = text
+        else:
+            print(f"   ⚠️  Map call failed for {clusters[i][0]}: {result.get('error', 'empty response')}")
+            notes[i] = "\n".join(format_brief(number, article) for number, article in clusters[i][1])
+    return notes
+
+
 def generate_weekly_blog(all_articles, output_path: Path):
     """Generate Gemini-written weekly blog synthesizing past week's research."""
 
@@ -74,28 +245,83 @@ def generate_weekly_blog(all_articles, output_path: Path):
         print("ERROR: No articles to synthesize")
         return
 
-    # Prepare condensed article summaries for Gemini
-    articles_summary = []
-    for idx, article in enumerate(all_articles, 1):
+    # Pack condensed article summaries into the token budget, best articles first
+    # NOTE: Only includes Ollama summaries (NOT raw_content_excerpt)
+    def format_full(number, article):
         gemini_analysis = article.get('gemini_analysis', {})
-
-        # Condensed format to fit more articles in context
-        # NOTE: Only includes Ollama summaries (NOT raw_content_excerpt)
         tech_summary = article.get('technical_summary', 'N/A')
         if len(tech_summary) > 300:
             tech_summary = tech_summary[:300] + '...'
 
-        article_text = f"""
-[{idx}] {article.get('title', 'Untitled')} ({article.get('_brief_date', 'Unknown date')})
+        return f"""
+[{number}] {article.get('title', 'Untitled')} ({article.get('_brief_date', 'Unknown date')})
 Source: {article.get('source', 'Unknown')}
 Link: {article.get('link', 'N/A')}
 Summary (by Ollama): {tech_summary}
 Tags: {', '.join(article.get('tags', []))}
 Significance: {gemini_analysis.get('significance', 'N/A')}
-Relevance: {gemini_analysis.get('relevance_score', 0):.2f}
+Relevance: {gemini_analysis.get('relevance_score', 0):.2f}{' (local screen, not Gemini review)' if gemini_analysis.get('qa_tier') == 'local' else ''}
 Key Insight: {gemini_analysis.get('key_insight', 'N/A')[:200]}...
 """
-        articles_summary.append(article_text)
+
+    def format_brief(number, article):
+        significance = article.get('gemini_analysis', {}).get('significance', 'N/A')
+        return f"[{number}] {article.get('title', 'Untitled')} ({article.get('source', 'Unknown')}, {significance})"
+
+    packer = PromptPacker(int(os.getenv("WEEKLY_CONTEXT_BUDGET_TOKENS", "32000")))
+    gem_client = GeminiClient() if GEMINI_AVAILABLE else None
+    if gem_client:
+        # One exact count calibrates the estimate to the target model's tokenizer
+        ranked_sample = sorted(all_articles, key=article_priority, reverse=True)[:20]
+        packer.calibrate(gem_client.count_tokens, "".join(format_full(i, a) for i, a in enumerate(ranked_sample, 1)))
+    packed = packer.pack(all_articles, format_full, format_brief)
+    cited_articles = packed.articles
+
+    print(f"Packed {len(cited_articles)}/{len(all_articles)} articles into ~{packed.tokens} tokens "
+          f"({packed.full_count} full, {packed.brief_count} one-line, {packed.dropped} dropped)")
+
+    # Create prompt for weekly synthesis
+    week_start = (datetime.now() - timedelta(days=7)).strftime("%B %d")
+    week_end = datetime.now().strftime("%B %d, %Y")
+    session_id = f"weekly-{datetime.now().strftime('%Y-%m-%d')}"
+
+    mode = os.getenv("WEEKLY_SYNTHESIS_MODE", "auto").lower()
+    use_map_reduce = gem_client is not None and (
+        mode == "map_reduce" or (mode == "auto" and packed.full_count * 2 < len(all_articles))
+    )
+
+    if use_map_reduce:
+        # Global numbering = rank order (the packer's order), so every article is citable
+        cited_articles = sorted(all_articles, key=article_priority, reverse=True)
+        clusters = build_clusters(
+            list(enumerate(cited_articles, 1)),
+            max(1, int(os.getenv("WEEKLY_MAP_CLUSTER_SIZE", "40")))
+        )
+        notes = run_map_phase(gem_client, clusters, format_full, format_brief, session_id)
+        notes_text = "\n\n".join(f"### {label}\n{note}" for (label, _), note in zip(clusters, notes))
+
+        # Title index for the reduce pass, in whatever budget the notes leave
+        index_packer = PromptPacker(
+            max(packer.budget_tokens - packer.count(notes_text), 0), packer.chars_per_token
+        )
+        index = index_packer.pack(cited_articles, format_brief, format_brief)
+
+        list_note = (
+            f"They were first condensed into {len(clusters)} intermediate syntheses (one per day or "
+            f"cluster), followed by an index of the top {len(index.articles)} article titles. "
+            "Cite articles with the [N] numbers used there."
+        )
+        articles_section = (
+            f"INTERMEDIATE SYNTHESES ({week_start} - {week_end}):\n\n{notes_text}"
+            f"\n\n---\n\nARTICLE INDEX:\n\n{index.text}"
+        )
+    else:
+        omitted_note = f", and {packed.dropped} lower-ranked articles were omitted" if packed.dropped else ""
+        list_note = (
+            f"The list below is ranked by significance and relevance: the top {packed.full_count} include "
+            f"full detail, the next {packed.brief_count} are one-line entries{omitted_note}."
+        )
+        articles_section = f"ARTICLES FROM PAST WEEK ({week_start} - {week_end}):\n\n{packed.text}"
 
     # Group articles by significance for context
     by_significance = {}
@@ -110,10 +336,6 @@ Key Insight: {gemini_analysis.get('key_insight', 'N/A')[:200]}...
         for sig, articles in sorted(by_significance.items())
     ])
 
-    # Create prompt for weekly synthesis
-    week_start = (datetime.now() - timedelta(days=7)).strftime("%B %d")
-    week_end = datetime.now().strftime("%B %d, %Y")
-
     weekly_prompt = f"""You are writing a WEEKLY digest for the Resonant Knowledge Lab's "Secure Reasoning Research Brief."
 
 AUDIENCE: AI practitioners, researchers, and governance professionals tracking trustworthy AI developments.
@@ -121,60 +343,16 @@ AUDIENCE: AI practitioners, researchers, and governance professionals tracking t
 YOUR TASK: Synthesize the past week's research into a cohesive weekly digest.
 
 You have {len(all_articles)} articles from the past 7 days with your prior expert analysis.
+{list_note}
 
 Article distribution:
 {significance_summary}
 
-YOUR WEEKLY DIGEST SHOULD:
-
-1. **Opening Context** (2-3 paragraphs)
-   - What was the big picture this week in secure reasoning research?
-   - What major themes or trends emerged?
-   - How does this week compare to typical weeks?
-
-2. **Top Papers of the Week** (3-5 papers)
-   - Feature the most significant contributions (breakthrough/important papers)
-   - For each: title, why it matters, practical implications
-   - Focus on papers that advance secure reasoning meaningfully
-   - IMPORTANT: Cite papers using [N] format where N is the article number from the list above
-
-3. **Emerging Trends** (2-3 trends)
-   - What patterns do you see across multiple papers?
-   - Are researchers converging on certain approaches?
-   - What aspects of secure reasoning are getting attention?
-   - Examples: "provenance tracking methods", "alignment through diverse feedback", etc.
-   - Cite papers using [N] format when referencing specific work
-
-4. **Notable Mentions** (brief list)
-   - Other papers worth tracking (useful/incremental)
-   - Quick highlights without deep analysis
-   - Cite papers using [N] format
-
-5. **What's Missing** (1 paragraph)
-   - What aspects of secure reasoning are under-researched this week?
-   - What gaps should the community address?
-
-6. **Weekly Recommendations** (3-5 concrete actions)
-   - What should practitioners focus on based on this week's research?
-   - What capabilities are becoming more mature?
-   - What risks need attention?
-
-7. **Looking Ahead** (closing paragraph)
-   - What to watch for in coming weeks
-   - What questions remain open
-
-STYLE:
-- Professional but engaging weekly newsletter tone
-- Synthesize across papers, don't just list them
-- Show connections and patterns
-- Be honest about abstract-only limitations
-- Focus on "what this means" not just "what happened"
+Follow the weekly digest structure and style in your instructions.
 
 ---
 
-ARTICLES FROM PAST WEEK ({week_start} - {week_end}):
-
-{chr(10).join(articles_summary[:100])}  # Limit to first 100 to fit context
+{articles_section}
 
 ---
 
@@ -192,18 +370,16 @@ Include at end:
     print("Asking Gemini to write weekly blog synthesis...")
 
     # Call Gemini to write the weekly blog
-    if not GEMINI_AVAILABLE:
+    if not gem_client:
         raise RuntimeError("Gemini client not available")
 
-    gem_client = GeminiClient()
-
     response = gem_client.generate(
         weekly_prompt,
-        system_prompt="You are a senior AI safety researcher and excellent technical writer. You write insightful weekly digests synthesizing trends in secure reasoning research for practitioners.",
+        system_prompt=f"{WEEKLY_SYSTEM_PROMPT}\n\n{WEEKLY_STYLE_GUIDE}",
         temperature=0.7,  # Slightly higher for creative synthesis
         max_tokens=6000,  # Need more room for weekly synthesis
         agent_id="weekly_blog_writer",
-        session_id=f"weekly-{datetime.now().strftime('%Y-%m-%d')}",
+        session_id=session_id,
         turn_id=0,
         task_type="weekly_blog_synthesis"
     )
@@ -234,9 +410,9 @@ Include at end:
     if cited_numbers:
         references = "\n\n---\n\n## References\n\n"
         for num in sorted(cited_numbers):
-            # Article numbers are 1-indexed
-            if 1 <= num <= len(all_articles):
-                article = all_articles[num - 1]
+            # Article numbers are 1-indexed positions in the packed list
+            if 1 <= num <= len(cited_articles):
+                article = cited_articles[num - 1]
                 title = article.get('title', 'Untitled')
                 link = article.get('link', '')
                 date = article.get('date', 'n.d.')
@@ -55,7 +55,8 @@ def prepare_dataset(output_dir: str = None):
         src = data_src / artifact_type
         if src.exists():
             dest = data_dest / artifact_type
-            shutil.copytree(src, dest)
+            # Skip files a running logger is still writing (no Parquet footer yet)
+            shutil.copytree(src, dest, ignore=shutil.ignore_patterns("*.open"))
             file_count = len(list(dest.rglob("*.*")))
             print(f"  ✅ {artifact_type}: {file_count} files")
 
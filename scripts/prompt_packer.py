@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Token-budgeted article packing for synthesis prompts (Publishing Agent Group).
+
+The weekly synthesis prompt used to include the first 100 articles in file
+order with no token check. PromptPacker instead:
+
+- Ranks articles by Gemini significance, then relevance_score
+- Counts tokens for the target model (a chars-per-token ratio calibrated
+  once against the model's own tokenizer when a counter is available)
+- Fills a token budget in two greedy passes: first every article gets a
+  one-line entry in rank order until the budget runs out (the remainder is
+  dropped), then the highest-ranked entries are upgraded to full detail
+  while budget remains
+
+Entries are numbered in rank order, and PackedArticles.articles maps each
+citation number back to its article, so [N] references stay correct.
+
+Type III Note: Packs derived fields only (titles, Ollama summaries, Gemini
+analysis); raw article content is never included.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SIGNIFICANCE_RANK = {
+    "breakthrough": 5,
+    "important": 4,
+    "useful": 3,
+    "incremental": 2,
+    "tangential": 1
+}
+
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+
+def article_priority(article: Dict) -> tuple:
+    """Sort key: significance first, then relevance_score (higher is better)."""
+    analysis = article.get("gemini_analysis") or {}
+    try:
+        relevance = float(analysis.get("relevance_score") or 0.0)
+    except (TypeError, ValueError):
+        relevance = 0.0
+    return (SIGNIFICANCE_RANK.get(analysis.get("significance"), 0), relevance)
+
+
+@dataclass
+class PackedArticles:
+    """
+    Result of packing articles into a token budget.
+
+    Attributes:
+        text: Article section for the prompt, entries numbered [1]..[K]
+        articles: Included articles; articles[N - 1] is citation [N]
+        full_count: Entries included with full detail
+        brief_count: Entries degraded to one-liners
+        dropped: Articles that did not fit at all
+        tokens: Estimated tokens used by text
+    """
+    text: str
+    articles: List[Dict] = field(default_factory=list)
+    full_count: int = 0
+    brief_count: int = 0
+    dropped: int = 0
+    tokens: int = 0
+
+
+class PromptPacker:
+    """
+    Greedy two-pass packer over a token budget.
+
+    Attributes:
+        budget_tokens (int): Tokens available for the article section
+        chars_per_token (float): Token estimate ratio for the target model
+
+    Example:
+        >>> packer = PromptPacker(32000)
+        >>> packer.calibrate(gem_client.count_tokens, sample_text)
+        >>> packed = packer.pack(articles, format_full, format_brief)
+        >>> cited = packed.articles[n - 1]
+    """
+
+    def __init__(self, budget_tokens: int, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN):
+        self.budget_tokens = budget_tokens
+        self.chars_per_token = chars_per_token
+
+    def calibrate(self, count_tokens: Callable[[str], Optional[int]], sample: str) -> None:
+        """
+        Fit chars_per_token to the target model with one exact count.
+
+        Args:
+            count_tokens: Model tokenizer (e.g., GeminiClient.count_tokens)
+            sample: Representative text (e.g., the top-ranked full entries)
+        """
+        if not sample:
+            return
+        try:
+            tokens = count_tokens(sample)
+        except Exception as e:
+            logger.warning(f"Token count failed, keeping {self.chars_per_token} chars/token: {e}")
+            return
+        if tokens:
+            self.chars_per_token = len(sample) / tokens
+
+    def count(self, text: str) -> int:
+        return int(len(text) / self.chars_per_token) + 1
+
+    def pack(self, articles: List[Dict],
+             format_full: Callable[[int, Dict], str],
+             format_brief: Callable[[int, Dict], str]) -> PackedArticles:
+        """
+        Rank articles and fit them into the budget.
+
+        Args:
+            articles: Candidate articles (any order)
+            format_full: (number, article) -> detailed entry
+            format_brief: (number, article) -> one-line entry
+
+        Returns:
+            PackedArticles with entries in citation order
+        """
+        ranked = sorted(articles, key=article_priority, reverse=True)
+
+        # Pass 1: one-liners in rank order; whatever does not fit is dropped
+        entries: List[str] = []
+        used = 0
+        for number, article in enumerate(ranked, 1):
+            brief = format_brief(number, article)
+            cost = self.count(brief)
+            if used + cost > self.budget_tokens:
+                break
+            entries.append(brief)
+            used += cost
+        included = ranked[:len(entries)]
+
+        # Pass 2: upgrade the best-ranked entries to full detail while budget remains
+        full_count = 0
+        for i, article in enumerate(included):
+            full = format_full(i + 1, article)
+            extra = self.count(full) - self.count(entries[i])
+            if used + extra > self.budget_tokens:
+                break
+            entries[i] = full
+            used += extra
+            full_count += 1
+
+        return PackedArticles(
+            text="\n".join(entries),
+            articles=included,
+            full_count=full_count,
+            brief_count=len(included) - full_count,
+            dropped=len(ranked) - len(included),
+            tokens=used
+        )
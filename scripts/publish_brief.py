@@ -628,7 +628,10 @@ def main():
         research_logger = StructuredLogger(
             base_dir=str(research_data_dir),
             rkl_version="1.0",
-            batch_size=50
+            batch_size=50,
+            flush_interval_s=60.0,  # Quiet artifacts (governance_ledger) still reach disk
+            max_buffer_bytes=4 * 1024 * 1024,  # Cap memory for large prompt_preview batches
+            rotate_interval_s=600.0  # Finalize (make readable) at least every 10 min
         )
         logger.info(f"Research telemetry enabled: {research_data_dir}")
     else:
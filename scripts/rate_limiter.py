@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Process-wide token-bucket rate limiter for external API quotas.
+
+Every GeminiClient built for the same tier and model shares one limiter, so
+pipelines that construct several clients (QA, daily brief, weekly blog) or run
+back-to-back from cron pace themselves against the real quota together instead
+of each keeping its own "last request" timestamp.
+
+Two buckets are enforced:
+- Requests per minute (RPM), with a configurable burst capacity
+- Tokens per minute (TPM), charged with an estimate before the call and
+  reconciled with the provider's usage metadata afterwards
+
+Sharing:
+- In-process: a threading.Lock plus a registry (get_shared_limiter) returning
+  the same limiter object for the same name
+- Cross-process: bucket state lives in a small JSON file guarded by an
+  exclusive fcntl lock; where fcntl is unavailable the limiter degrades to
+  in-process only
+
+Environment Variables:
+    GEMINI_RATE_STATE_DIR: Directory for shared bucket state (default: data/cache/ratelimit)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = Path(__file__).parent.parent / "data" / "cache" / "ratelimit"
+
+
+class TokenBucketLimiter:
+    """
+    Thread- and process-safe token bucket over RPM and TPM quotas.
+
+    Attributes:
+        name (str): Quota identifier (also the state file name)
+        requests_per_minute (float): Sustained request rate (must be > 0)
+        tokens_per_minute (float): Sustained token rate (None or <= 0 = unlimited)
+        burst (float): Requests that may be issued back-to-back from a full bucket
+
+    Example:
+        >>> limiter = get_shared_limiter("aistudio_gemini-2.0-flash", 15, 1_000_000)
+        >>> waited_s = limiter.acquire(tokens=800)
+    """
+
+    def __init__(self, name: str, requests_per_minute: float,
+                 tokens_per_minute: Optional[float] = None, burst: float = 1.0,
+                 state_dir: Optional[Path] = None):
+        if not float(requests_per_minute) > 0:
+            raise ValueError(f"{name}: requests_per_minute must be > 0, got {requests_per_minute!r}")
+        self.name = name
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = (
+            float(tokens_per_minute) if tokens_per_minute and float(tokens_per_minute) > 0 else None
+        )
+        self.burst = max(float(burst), 1.0)
+        self.state_path = Path(state_dir or DEFAULT_STATE_DIR) / f"{name}.json"
+        self._lock = threading.Lock()
+        self._local_state: Optional[Dict[str, float]] = None
+
+        if FCNTL_AVAILABLE:
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Rate limiter state dir unavailable ({e}); limiting in-process only")
+
+    def _full_state(self, now: float) -> Dict[str, float]:
+        return {
+            "requests": self.burst,
+            "tokens": self.tokens_per_minute or 0.0,
+            "updated": now
+        }
+
+    @contextmanager
+    def _shared_state(self):
+        """Yield the bucket state under an exclusive cross-process lock, then persist it."""
+        now = time.time()
+        if not FCNTL_AVAILABLE or not self.state_path.parent.exists():
+            if self._local_state is None:
+                self._local_state = self._full_state(now)
+            yield self._local_state
+            return
+
+        with open(self.state_path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                try:
+                    state = json.loads(raw) if raw.strip() else self._full_state(now)
+                except json.JSONDecodeError:
+                    state = self._full_state(now)
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _refill(self, state: Dict[str, float], now: float) -> None:
+        elapsed = max(now - float(state.get("updated", now)), 0.0)
+        state["requests"] = min(
+            self.burst, float(state.get("requests", self.burst)) + elapsed * self.requests_per_minute / 60.0
+        )
+        if self.tokens_per_minute:
+            state["tokens"] = min(
+                self.tokens_per_minute,
+                float(state.get("tokens", self.tokens_per_minute)) + elapsed * self.tokens_per_minute / 60.0
+            )
+        state["updated"] = now
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request (and `tokens` tokens) fit the quota, then consume them.
+
+        Args:
+            tokens: Estimated tokens for this request (capped at one minute of TPM)
+
+        Returns:
+            Seconds spent waiting
+        """
+        needed_tokens = min(float(tokens), self.tokens_per_minute) if self.tokens_per_minute else 0.0
+        start = time.time()
+
+        # In-process waiters queue on the thread lock; processes queue on the file lock
+        with self._lock:
+            while True:
+                with self._shared_state() as state:
+                    now = time.time()
+                    self._refill(state, now)
+                    wait = 0.0
+                    if state["requests"] < 1.0:
+                        wait = (1.0 - state["requests"]) * 60.0 / self.requests_per_minute
+                    if self.tokens_per_minute and state["tokens"] < needed_tokens:
+                        wait = max(wait, (needed_tokens - state["tokens"]) * 60.0 / self.tokens_per_minute)
+                    if wait <= 0.0:
+                        state["requests"] -= 1.0
+                        if self.tokens_per_minute:
+                            state["tokens"] -= needed_tokens
+                        return time.time() - start
+                time.sleep(wait)
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct the TPM bucket once the provider reports the real token count."""
+        if not self.tokens_per_minute or actual_tokens is None:
+            return
+        delta = float(actual_tokens) - float(estimated_tokens)
+        if delta == 0:
+            return
+        with self._lock:
+            with self._shared_state() as state:
+                self._refill(state, time.time())
+                state["tokens"] = min(self.tokens_per_minute, state["tokens"] - delta)
+
+
+_registry: Dict[str, TokenBucketLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_shared_limiter(name: str, requests_per_minute: float,
+                       tokens_per_minute: Optional[float] = None,
+                       burst: float = 1.0) -> TokenBucketLimiter:
+    """
+    Return the process-wide limiter for `name`, creating it on first use.
+
+    The first caller's quota settings win; later callers share that bucket.
+    """
+    with _registry_lock:
+        limiter = _registry.get(name)
+        if limiter is None:
+            state_dir = os.getenv("GEMINI_RATE_STATE_DIR")
+            limiter = TokenBucketLimiter(
+                name, requests_per_minute, tokens_per_minute, burst,
+                state_dir=Path(state_dir) if state_dir else None
+            )
+            _registry[name] = limiter
+        return limiter
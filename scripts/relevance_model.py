@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Local relevance model for pre-summarization gating (Processing Agent Group).
+
+Predicts whether Gemini QA will keep an article (theme_score at or above
+GEMINI_THEME_THRESHOLD) from its title and excerpt, before ArticleSummarizer
+spends three Ollama generations on it.
+
+Model:
+- Hashed unigram + bigram features (2^18 buckets, CRC32 so hashes are stable
+  across processes), L2-normalized term frequencies
+- Logistic regression trained online with AdaGrad and light L2 decay
+- Weights persisted to data/models/relevance_model.npz after each run
+
+Training is incremental: every Gemini QA verdict (kept or dropped) becomes
+one update, so the model tracks drift in what the QA reviewer considers
+on-theme. Saved briefs are not replayed because they only contain articles
+that passed the theme gate.
+
+Type III Note: Runs entirely locally on article text that never leaves the
+machine; only the predicted score is logged to telemetry.
+"""
+
+import logging
+import math
+import os
+import re
+import zlib
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+KEEP_RECOMMENDATIONS = ("must-include", "include")
+
+
+def relevance_text(title: str, body: str, source: str = "") -> str:
+    """Build the model input from fields available before summarization."""
+    return f"{title} {title} {body[:1500]} src_{source.lower().replace(' ', '_')}"
+
+
+def outcome_label(theme_score, recommendation: Optional[str], threshold: float) -> Optional[float]:
+    """
+    Convert a Gemini QA outcome into a training target.
+
+    The theme gate decision (theme_score >= threshold) is the ground truth;
+    the recommendation is used only when no score was returned.
+
+    Returns:
+        1.0 (kept), 0.0 (dropped), or None if the outcome is uninformative
+    """
+    if theme_score is not None:
+        try:
+            return 1.0 if float(theme_score) >= threshold else 0.0
+        except (TypeError, ValueError):
+            pass
+    if recommendation in KEEP_RECOMMENDATIONS:
+        return 1.0
+    if recommendation == "exclude":
+        return 0.0
+    return None
+
+
+class RelevanceModel:
+    """
+    Online logistic regression over hashed n-grams.
+
+    Attributes:
+        path (Path): Where weights are loaded from and saved to
+        n_features (int): Number of hash buckets
+        n_updates (int): Training examples seen so far (gate stays off until warm)
+
+    Example:
+        >>> model = RelevanceModel.load(Path("data/models/relevance_model.npz"))
+        >>> p = model.predict(relevance_text(title, excerpt, source))
+        >>> model.update(relevance_text(title, excerpt, source), 1.0)
+        >>> model.save()
+    """
+
+    def __init__(self, path: Path, n_features: int = 2 ** 18,
+                 learning_rate: float = 0.5, l2: float = 1e-6):
+        self.path = Path(path)
+        self.n_features = n_features
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.weights = np.zeros(n_features, dtype=np.float32)
+        self.grad_sq = np.zeros(n_features, dtype=np.float32)
+        self.bias = 0.0
+        self.bias_grad_sq = 0.0
+        self.n_updates = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "RelevanceModel":
+        """Load persisted weights, or start a fresh model if none exist."""
+        model = cls(path)
+        if model.path.exists():
+            try:
+                with np.load(model.path) as data:
+                    if int(data["n_features"]) == model.n_features:
+                        model.weights = data["weights"].astype(np.float32)
+                        model.grad_sq = data["grad_sq"].astype(np.float32)
+                        model.bias = float(data["bias"])
+                        model.bias_grad_sq = float(data["bias_grad_sq"])
+                        model.n_updates = int(data["n_updates"])
+            except Exception as e:
+                logger.warning(f"Could not load relevance model {model.path}, starting fresh: {e}")
+        return model
+
+    def save(self) -> None:
+        """Persist weights atomically (tmp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                weights=self.weights,
+                grad_sq=self.grad_sq,
+                bias=self.bias,
+                bias_grad_sq=self.bias_grad_sq,
+                n_updates=self.n_updates,
+                n_features=self.n_features
+            )
+        os.replace(tmp_path, self.path)
+
+    def _features(self, text: str):
+        """Hash unigrams and bigrams into (indices, L2-normalized values)."""
+        tokens = _TOKEN_RE.findall(text.lower())
+        grams = tokens + [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+        if not grams:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        hashed = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) % self.n_features for g in grams),
+            dtype=np.int64, count=len(grams)
+        )
+        indices, counts = np.unique(hashed, return_counts=True)
+        values = counts.astype(np.float32)
+        values /= np.linalg.norm(values)
+        return indices, values
+
+    def _margin(self, indices, values) -> float:
+        return float(np.dot(self.weights[indices], values)) + self.bias
+
+    def predict(self, text: str) -> float:
+        """Probability that Gemini QA keeps the article."""
+        indices, values = self._features(text)
+        margin = max(min(self._margin(indices, values), 30.0), -30.0)
+        return 1.0 / (1.0 + math.exp(-margin))
+
+    def update(self, text: str, target: float) -> float:
+        """
+        One AdaGrad step on the log-loss for a labelled example.
+
+        Returns:
+            The prediction made before the update (useful for online metrics)
+        """
+        indices, values = self._features(text)
+        margin = max(min(self._margin(indices, values), 30.0), -30.0)
+        prediction = 1.0 / (1.0 + math.exp(-margin))
+        error = prediction - target
+
+        grad = error * values + self.l2 * self.weights[indices]
+        self.grad_sq[indices] += grad * grad
+        self.weights[indices] -= self.learning_rate * grad / (np.sqrt(self.grad_sq[indices]) + 1e-8)
+
+        self.bias_grad_sq += error * error
+        self.bias -= self.learning_rate * error / (math.sqrt(self.bias_grad_sq) + 1e-8)
+
+        self.n_updates += 1
+        return prediction
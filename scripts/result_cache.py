@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Persistent JSON result cache for expensive model calls.
+
+Stores one small JSON file per entry under data/cache/{namespace}/, keyed by a
+SHA-256 of the call's inputs. Entries carry the time they were written and a
+version string (e.g., a hash of the prompt template), so they expire after a
+TTL and are ignored as soon as the template that produced them changes.
+
+One file per entry keeps concurrent writers (two cron jobs, or worker threads)
+from clobbering each other: each write goes to a unique tmp file and is
+renamed into place atomically.
+
+Type III Note: Only derived outputs (model analyses of summaries) are cached;
+raw article content is never written here.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+
+class ResultCache:
+    """
+    File-backed key/value cache with TTL and version invalidation.
+
+    Attributes:
+        namespace (str): Subdirectory name (e.g., "gemini_qa")
+        ttl_s (float): Entry lifetime in seconds (0 = never expires)
+        version (str): Entries written under a different version are misses
+
+    Example:
+        >>> cache = ResultCache("gemini_qa", ttl_s=30 * 86400, version="a1b2c3")
+        >>> key = cache.key("gemini-2.0-flash", title, summary)
+        >>> cache.put(key, {"relevance_score": 0.8})
+        >>> cache.get(key)
+        {'relevance_score': 0.8}
+    """
+
+    def __init__(self, namespace: str, ttl_s: float = 0, version: str = "",
+                 base_dir: Optional[Path] = None):
+        self.namespace = namespace
+        self.ttl_s = ttl_s
+        self.version = version
+        self.dir = Path(base_dir or DEFAULT_CACHE_DIR) / namespace
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Hash call inputs into a cache key (parts are JSON-encoded, order matters)."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or from another version."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._count(False)
+            return None
+
+        expired = self.ttl_s and time.time() - float(entry.get("stored_at", 0)) > self.ttl_s
+        if expired or entry.get("version") != self.version:
+            self._count(False)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        self._count(True)
+        return entry.get("value")
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value (best effort; failures are logged, not raised)."""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"stored_at": time.time(), "version": self.version, "value": value}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write {self.namespace} cache entry: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
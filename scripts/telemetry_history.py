@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Telemetry history reader for adaptive pipeline decisions.
+
+Reads past research telemetry written by StructuredLogger so pipeline agents
+can learn from their own history (feed cadence, QA outcomes) without a
+separate database.
+
+Layout read:
+    data/research/{artifact_type}/YYYY/MM/DD/*.parquet
+    data/research/{artifact_type}/YYYY/MM/DD/*.ndjson
+
+Type III Note: Only structural telemetry (hashes, counts, scores) is read.
+No raw article content is stored in these artifacts.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow.parquet as pq
+    PARQUET_READ_AVAILABLE = True
+except ImportError:
+    PARQUET_READ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_hash(value: Optional[str]) -> str:
+    """Strip an optional 'sha256:' prefix so hashes from any logger version join."""
+    if not value:
+        return ""
+    value = str(value)
+    return value[7:] if value.startswith("sha256:") else value
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """Parse the ISO timestamp StructuredLogger adds to every record (UTC, naive)."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    try:
+        return datetime.fromisoformat(str(value).rstrip("Z")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _day_dirs(artifact_dir: Path, since: Optional[datetime]) -> List[Path]:
+    """List YYYY/MM/DD partition directories on or after `since`."""
+    days = []
+    for day_dir in artifact_dir.glob("*/*/*"):
+        if not day_dir.is_dir():
+            continue
+        try:
+            year, month, day = (int(p) for p in day_dir.parts[-3:])
+            day_date = datetime(year, month, day)
+        except ValueError:
+            continue
+        if since and day_date < since.replace(hour=0, minute=0, second=0, microsecond=0):
+            continue
+        days.append(day_dir)
+    return sorted(days)
+
+
+def load_artifact_records(base_dir: Path, artifact_type: str,
+                          days_back: Optional[int] = None,
+                          columns: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Load telemetry records for one artifact type.
+
+    Args:
+        base_dir: Research data directory (e.g., data/research)
+        artifact_type: Artifact to read (e.g., "retrieval_provenance")
+        days_back: Only read partitions from the last N days (None = all)
+        columns: Optional column subset (Parquet only; NDJSON rows are trimmed)
+
+    Returns:
+        List of record dicts, oldest partition first. Unreadable files are
+        skipped with a warning so a single bad file never blocks a run.
+    """
+    artifact_dir = Path(base_dir) / artifact_type
+    if not artifact_dir.exists():
+        return []
+
+    since = datetime.utcnow() - timedelta(days=days_back) if days_back else None
+    records: List[Dict] = []
+
+    for day_dir in _day_dirs(artifact_dir, since):
+        for path in sorted(day_dir.iterdir()):
+            try:
+                if path.suffix == ".parquet":
+                    if not PARQUET_READ_AVAILABLE:
+                        continue
+                    schema_names = pq.read_schema(path).names
+                    wanted = [c for c in columns if c in schema_names] if columns else None
+                    records.extend(pq.read_table(path, columns=wanted).to_pylist())
+                elif path.suffix == ".ndjson":
+                    with open(path) as f:
+                        for line in f:
+                            line = line.strip()
+                            if not line:
+                                continue
+                            row = json.loads(line)
+                            if columns:
+                                row = {c: row.get(c) for c in columns}
+                            records.append(row)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable telemetry file {path}: {e}")
+
+    return records
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for expected-value article prioritization and the summarization time budget.
+
+Run with:
+    python scripts/test_article_prioritizer.py
+"""
+
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from article_prioritizer import ArticlePrioritizer
+from fetch_and_summarize import budget_exhausted
+
+NOW = datetime.now()
+
+
+def make_article(title: str, source: str = "Feed", summary: str = "", age_days: float = 1.0) -> dict:
+    return {"title": title, "summary": summary, "source": source, "date": NOW - timedelta(days=age_days)}
+
+
+def write_ndjson(base_dir: Path, artifact: str, rows: list) -> None:
+    """Write telemetry rows into today's partition, as the logger's NDJSON fallback does."""
+    day_dir = base_dir / artifact / NOW.strftime("%Y/%m/%d")
+    day_dir.mkdir(parents=True, exist_ok=True)
+    with open(day_dir / f"{artifact}_000000.ndjson", "w") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+
+
+def test_rank_order():
+    """Test that keyword evidence, then recency, decides the order within one feed."""
+    prioritizer = ArticlePrioritizer(["alignment", "interpretability"])
+    articles = [
+        make_article("Quarterly earnings report"),
+        make_article("Notes on model internals", summary="An interpretability study"),
+        make_article("Alignment and interpretability at scale"),
+        make_article("Alignment and interpretability, last month", age_days=30),
+    ]
+    ranked = prioritizer.rank(articles)
+    assert [a["title"] for a in ranked] == [
+        "Alignment and interpretability at scale",
+        "Alignment and interpretability, last month",
+        "Notes on model internals",
+        "Quarterly earnings report",
+    ], [a["title"] for a in ranked]
+    assert all(0.0 <= a["priority_score"] <= 1.0 for a in ranked)
+    print("✓ Title hits > summary hits > no hits; fresher article first among equals")
+
+    tied = [make_article("Same", age_days=3), make_article("Same", age_days=1)]
+    prioritizer.RECENCY_WEIGHT = 0.0  # Equal scores: the date breaks the tie
+    assert prioritizer.rank(tied)[0]["date"] == tied[1]["date"]
+    print("✓ Equal priority_score falls back to the newer article")
+
+
+def test_credibility_priors():
+    """Test configured credibility, learned feed means and shrinkage toward the prior."""
+    prioritizer = ArticlePrioritizer([], feed_credibility={"Trusted": 0.9, "Noisy": 0.1})
+    trusted, noisy, unknown = (make_article("Post", source=s) for s in ("Trusted", "Noisy", "Other"))
+    assert prioritizer.score(trusted, NOW) > prioritizer.score(unknown, NOW) > prioritizer.score(noisy, NOW)
+    print("✓ Configured credibility orders feeds before any history exists")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        # "Noisy" turned out excellent (10 scored articles); "Trusted" had one poor article
+        write_ndjson(base, "retrieval_provenance", [
+            {"feed_name": "Noisy", "selected_hashes": [f"sha256:n{i}" for i in range(10)]},
+            {"feed_name": "Trusted", "selected_hashes": ["sha256:t0"]},
+        ])
+        write_ndjson(base, "hallucination_matrix",
+                     [{"artifact_id": f"sha256:n{i}", "theme_score": 0.9} for i in range(10)]
+                     + [{"artifact_id": "sha256:t0", "theme_score": 0.2}])
+        prioritizer.learn_from_history(base)
+
+    strength = ArticlePrioritizer.PRIOR_STRENGTH
+    expected_noisy = (10 * 0.9 + strength * 0.1) / (10 + strength)
+    expected_trusted = (0.2 + strength * 0.9) / (1 + strength)
+    assert abs(prioritizer.source_priors["Noisy"] - expected_noisy) < 1e-9
+    assert abs(prioritizer.source_priors["Trusted"] - expected_trusted) < 1e-9
+    assert abs(prioritizer.global_prior - (9.0 + 0.2) / 11) < 1e-9
+    print(f"✓ Learned priors shrink toward credibility: Noisy {expected_noisy:.2f}, "
+          f"Trusted {expected_trusted:.2f}")
+
+    # Feeds without history or configured credibility use the global mean
+    assert "Other" not in prioritizer.source_priors
+    baseline = ArticlePrioritizer([])
+    shift = prioritizer.score(unknown, NOW) - baseline.score(unknown, NOW)
+    assert abs(shift - ArticlePrioritizer.SOURCE_WEIGHT * (prioritizer.global_prior - 0.5)) < 1e-9
+    print("✓ Unknown feeds fall back to the global mean")
+
+
+def test_time_budget():
+    """Test the BRIEF_TIME_BUDGET_S cut-off used by the summarization loop."""
+    assert not budget_exhausted(0, 10_000.0, [60.0])
+    print("✓ Budget 0 never stops the loop")
+
+    assert not budget_exhausted(100.0, 95.0, [])
+    print("✓ The first article always runs (no duration estimate yet)")
+
+    durations = [20.0, 40.0]  # Mean 30s per article
+    assert not budget_exhausted(100.0, 70.0, durations)
+    assert budget_exhausted(100.0, 71.0, durations)
+    print("✓ Stops when elapsed + mean article duration would exceed the budget")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Article Prioritizer Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Rank Order", test_rank_order),
+        ("Credibility Priors", test_credibility_priors),
+        ("Time Budget", test_time_budget)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for telemetry compaction.
+
+Run with:
+    python scripts/test_compact_telemetry.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from compact_telemetry import compact_partition, merge_tables, read_input
+
+ARTIFACT = "execution_context"
+DATE = "2025-11-03"
+
+
+def day_dir(base_dir: Path) -> Path:
+    path = base_dir / ARTIFACT / "2025" / "11" / "03"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_parquet(path: Path, rows: list) -> None:
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
+def write_ndjson(path: Path, rows: list) -> None:
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+
+def write_manifest(base_dir: Path, rows: int) -> None:
+    manifest_dir = base_dir / "manifests"
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    (manifest_dir / f"{DATE}.json").write_text(json.dumps({"artifacts": {ARTIFACT: {"rows": rows}}}))
+
+
+def make_partition(base_dir: Path) -> Path:
+    """Two Parquet files, one NDJSON file and one file still being written."""
+    directory = day_dir(base_dir)
+    write_parquet(directory / f"{ARTIFACT}_090000_1_0001.parquet", [
+        {"session_id": "b", "t": 2, "score": 1, "ref": 10},
+        {"session_id": "a", "t": 5, "score": 2, "ref": 11},
+    ])
+    write_parquet(directory / f"{ARTIFACT}_100000_1_0002.parquet", [
+        {"session_id": "a", "t": 1, "score": 3, "ref": 12, "tags": ["x"]},
+    ])
+    write_ndjson(directory / f"{ARTIFACT}_110000_2_0001.ndjson", [
+        {"session_id": "b", "t": 1, "score": 0.5, "ref": "r-13"},
+        {"session_id": "a", "t": 3, "score": None, "ref": None, "note": "ndjson only"},
+    ])
+    (directory / f"{ARTIFACT}_120000_3_0001.parquet.open").write_bytes(b"partial file, no footer")
+    return directory
+
+
+def test_merge_mixed_inputs():
+    """Test that Parquet and NDJSON inputs merge into one sorted table with widened types."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = make_partition(Path(tmpdir))
+        inputs = sorted(p for p in directory.iterdir() if p.suffix in (".parquet", ".ndjson"))
+        merged = merge_tables([read_input(p) for p in inputs])
+
+    assert merged.num_rows == 5
+    types = {field.name: field.type for field in merged.schema}
+    assert types["score"] == pa.float64(), "int + float should widen to float64"
+    assert types["ref"] == pa.string(), "int + string should fall back to text"
+    assert types["tags"] == pa.list_(pa.string()) and types["note"] == pa.string()
+    print("✓ Conflicting types widened: score -> float64, ref -> string")
+
+    rows = merged.to_pylist()
+    assert [(r["session_id"], r["t"]) for r in rows] == [("a", 1), ("a", 3), ("a", 5), ("b", 1), ("b", 2)]
+    assert [r["ref"] for r in rows] == ["12", None, "11", "r-13", "10"]
+    assert rows[0]["tags"] == ["x"] and rows[1]["tags"] is None and rows[1]["note"] == "ndjson only"
+    print("✓ Rows sorted by session_id, t; missing columns null-filled")
+
+
+def test_compact_partition():
+    """Test compaction output, removal of inputs, and that .open files are left untouched."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        directory = make_partition(base)
+        open_file = directory / f"{ARTIFACT}_120000_3_0001.parquet.open"
+        write_manifest(base, 5)
+
+        assert compact_partition(base, ARTIFACT, DATE, None, 2, False, True)
+        remaining = sorted(p.name for p in directory.iterdir())
+        assert remaining == [f"{ARTIFACT}_090000_compacted.parquet", open_file.name], remaining
+        assert open_file.read_bytes() == b"partial file, no footer"
+        assert pq.read_metadata(directory / remaining[0]).num_rows == 5
+        print("✓ 3 inputs -> 1 compacted file (5 rows); .open file untouched")
+
+
+def test_dry_run_and_hour():
+    """Test that --dry-run writes nothing and --hour only compacts that hour's files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        directory = make_partition(base)
+        before = sorted(p.name for p in directory.iterdir())
+
+        assert compact_partition(base, ARTIFACT, DATE, None, 2, True, False)
+        assert sorted(p.name for p in directory.iterdir()) == before
+        print("✓ Dry run leaves the partition unchanged")
+
+        # Only one file opened during 10:00 -> below min_files, nothing to do
+        assert compact_partition(base, ARTIFACT, DATE, "10", 2, False, False)
+        assert sorted(p.name for p in directory.iterdir()) == before
+        assert compact_partition(base, ARTIFACT, DATE, "10", 1, False, False)
+        assert f"{ARTIFACT}_100000_compacted.parquet" in {p.name for p in directory.iterdir()}
+        assert (directory / f"{ARTIFACT}_090000_1_0001.parquet").exists()
+        print("✓ Hour mode only touches files opened in that hour")
+
+
+def test_strict_manifest_mismatch():
+    """Test that --strict skips a day whose rows disagree with the manifest."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        directory = make_partition(base)
+        write_manifest(base, 7)  # e.g. 2 rows still in the .open file
+        before = {p.name: p.read_bytes() for p in directory.iterdir()}
+
+        assert not compact_partition(base, ARTIFACT, DATE, None, 2, False, True)
+        assert {p.name: p.read_bytes() for p in directory.iterdir()} == before
+        print("✓ --strict: 5 rows on disk vs 7 in manifest -> skipped, nothing changed")
+
+        assert compact_partition(base, ARTIFACT, DATE, None, 2, False, False)
+        assert f"{ARTIFACT}_090000_compacted.parquet" in {p.name for p in directory.iterdir()}
+        print("✓ Without --strict the mismatch is only a warning")
+
+
+def test_idempotent_rerun():
+    """Test that a second run leaves an already compacted partition unchanged."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        directory = make_partition(base)
+        write_manifest(base, 5)
+        assert compact_partition(base, ARTIFACT, DATE, None, 2, False, True)
+        after_first = {p.name: p.read_bytes() for p in directory.iterdir()}
+
+        assert compact_partition(base, ARTIFACT, DATE, None, 2, False, True)
+        assert {p.name: p.read_bytes() for p in directory.iterdir()} == after_first
+        print("✓ Second run (default --min-files) skips the compacted partition")
+
+        # Even when forced, re-compacting the single output rewrites it in place
+        assert compact_partition(base, ARTIFACT, DATE, None, 1, False, True)
+        output = directory / f"{ARTIFACT}_090000_compacted.parquet"
+        assert sorted(p.name for p in directory.iterdir()) == sorted(after_first)
+        assert pq.read_table(output).equals(pq.read_table(pa.BufferReader(after_first[output.name])))
+        assert not list(directory.glob("*.compacting"))
+        print("✓ Forced rerun (--min-files 1) keeps the same file and rows")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Telemetry Compaction Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Merge Mixed Inputs", test_merge_mixed_inputs),
+        ("Compact Partition", test_compact_partition),
+        ("Dry Run and Hour", test_dry_run_and_hour),
+        ("Strict Manifest Mismatch", test_strict_manifest_mismatch),
+        ("Idempotent Rerun", test_idempotent_rerun)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
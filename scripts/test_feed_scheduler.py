@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive feed polling schedule.
+
+Run with:
+    python scripts/test_feed_scheduler.py
+"""
+
+import math
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from feed_scheduler import FeedScheduler
+
+START = datetime(2025, 11, 1)
+
+
+def poll_history(outcomes, hours: float = 24.0):
+    """Poll history with one poll every `hours`; each outcome says whether that poll saw a new entry."""
+    history = [(START, {"a0"}, 1)]
+    hashes = {"a0"}
+    for n, had_new in enumerate(outcomes, 1):
+        if had_new:
+            hashes = hashes | {f"a{n}"}
+        history.append((START + timedelta(hours=hours * n), set(hashes), len(hashes)))
+    return history
+
+
+def make_scheduler(histories, **kwargs) -> FeedScheduler:
+    """Scheduler with poll histories preloaded instead of read from telemetry."""
+    scheduler = FeedScheduler(Path(tempfile.gettempdir()) / "no_telemetry", **kwargs)
+    scheduler._polls = histories
+    return scheduler
+
+
+def test_intervals():
+    """Test that polls become (hours, had_new) observations, skipping same-run duplicates."""
+    history = poll_history([True, False, True])
+    assert FeedScheduler._intervals(history) == [(24.0, True), (24.0, False), (24.0, True)]
+    print("✓ Hash sets decide whether a poll saw new entries")
+
+    # Without hashes the candidate count is compared instead
+    counts = [(START + timedelta(hours=h), set(), c) for h, c in ((0, 3), (12, 3), (24, 4))]
+    assert FeedScheduler._intervals(counts) == [(12.0, False), (12.0, True)]
+    print("✓ Candidate counts are the fallback when hashes are missing")
+
+    retried = [(START, {"a"}, 1), (START + timedelta(minutes=1), {"a", "b"}, 2)]
+    assert FeedScheduler._intervals(retried) == []
+    assert FeedScheduler._intervals(poll_history([])) == []
+    print("✓ No observations from a single poll or a retried run")
+
+
+def test_fit_rate():
+    """Test the censored Poisson MLE, including all-hit and all-miss histories."""
+    half = FeedScheduler._fit_rate([(24.0, True), (24.0, False)] * 5)
+    assert math.isclose(half, math.log(2) / 24.0, rel_tol=1e-6), half
+    print(f"✓ Half of daily polls new -> mean interval {1 / half:.1f}h (ln 2 / 24h rate)")
+
+    hits = FeedScheduler._fit_rate([(24.0, True)] * 10)
+    misses = FeedScheduler._fit_rate([(24.0, False)] * 10)
+    # The pseudo-intervals keep both extremes finite and inside the search bracket
+    assert 1e-5 < misses < half < hits < 10.0, (misses, half, hits)
+    print(f"✓ All hits ({hits:.3f}/h) and all misses ({misses:.4f}/h) stay finite")
+
+    more_hits = FeedScheduler._fit_rate([(24.0, True)] * 30)
+    assert more_hits > hits
+    print("✓ More evidence moves the rate further from the prior")
+
+
+def test_should_poll():
+    """Test poll decisions for new, busy, quiet and overdue feeds."""
+    now = START + timedelta(hours=24 * 12 + 12)  # 12h after the last poll
+    histories = {
+        "busy": poll_history([True] * 12),
+        "quiet": poll_history([False] * 12),
+        "short": poll_history([True, False]),
+        "retried": [(START + timedelta(minutes=n), {"a"}, 1) for n in range(5)],
+    }
+    scheduler = make_scheduler(histories)
+
+    poll, reason = scheduler.should_poll({"name": "new feed"}, now=now)
+    assert poll and reason.startswith("insufficient history (0 polls)")
+    poll, reason = scheduler.should_poll({"name": "short"}, now=now)
+    assert poll and "insufficient history" in reason
+    print("✓ New feeds and feeds with little history are polled")
+
+    poll, reason = scheduler.should_poll({"name": "retried"}, now=START + timedelta(hours=1))
+    assert poll and reason == "no usable intervals"
+    print("✓ Feeds without usable intervals are polled")
+
+    assert scheduler.should_poll({"name": "busy"}, now=now)[0]
+    poll, reason = scheduler.should_poll({"name": "quiet"}, now=now)
+    assert not poll and reason.startswith("P(new)="), reason
+    print(f"✓ Quiet feed skipped: {reason}")
+
+    poll, reason = scheduler.should_poll({"name": "quiet"}, now=now + timedelta(hours=72))
+    assert poll and reason.startswith("not polled for")
+    print("✓ Quiet feed polled again after max_skip_hours")
+
+    assert scheduler.should_poll({"name": "quiet", "always_poll": True}, now=now) == (True, "always_poll")
+    full = make_scheduler(histories, full_sweep=True)
+    assert full.should_poll({"name": "quiet"}, now=now) == (True, "full sweep")
+    print("✓ always_poll and full sweeps override the schedule")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Feed Scheduler Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Poll Intervals", test_intervals),
+        ("Rate Fit", test_fit_rate),
+        ("Poll Decisions", test_should_poll)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Gemini client helpers (no API key or network needed).
+
+Run with:
+    python scripts/test_gemini_client.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gemini_client import GeminiClient, GeminiHealthTracker, HybridModelClient
+
+
+def make_client(**env) -> GeminiClient:
+    """AI Studio client built from dummy settings (no request is made at construction)."""
+    return make_client_env(lambda: GeminiClient(api_key="dummy"), **env)
+
+
+def make_client_env(build, **env):
+    """Call build() with a dummy API key and extra environment variables set."""
+    env.setdefault("GOOGLE_API_KEY", "dummy")
+    saved = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    try:
+        return build()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+class SlowModel:
+    """Stands in for a Vertex GenerativeModel whose calls take delay_s."""
+
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, generation_config=None):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay_s)
+        with self._lock:
+            self.running -= 1
+        return f"answer to {prompt}"
+
+
+class StubBackend:
+    """Stands in for GeminiClient.generate / OllamaClient.generate with a fixed delay and answer."""
+
+    def __init__(self, name: str, delay_s: float, answer: str = "", error: Exception = None):
+        self.model_name = self.model = name
+        self.delay_s = delay_s
+        self.answer = answer
+        self.error = error
+        self.calls = 0
+        self.finished = threading.Event()
+
+    def generate(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        try:
+            time.sleep(self.delay_s)
+            if self.error:
+                raise self.error
+            return self.answer
+        finally:
+            self.finished.set()
+
+
+class RecordingLogger:
+    """Collects research_logger.log() calls."""
+
+    def __init__(self):
+        self.records = []
+
+    def log(self, artifact_type, record, **kwargs):
+        self.records.append((artifact_type, record))
+
+    def rows(self, artifact_type):
+        return [r for a, r in self.records if a == artifact_type]
+
+
+def make_hybrid(gemini: StubBackend, ollama: StubBackend, state_dir: Path, delay_s: float):
+    """HybridModelClient in hedged mode with stub backends and a fixed hedge delay."""
+    research_logger = RecordingLogger()
+    hybrid = make_client_env(lambda: HybridModelClient(ollama, research_logger=research_logger, hedge=True))
+    hybrid.gemini_client = gemini
+    hybrid.health = GeminiHealthTracker("hedge_test", state_dir=state_dir)
+    hybrid.default_hedge_delay_s = delay_s
+    return hybrid, research_logger
+
+
+def test_health_persisted_backoff():
+    """Test that a persisted backoff is honoured past ttl_s until retry_at passes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = GeminiHealthTracker("persist", ttl_s=1.0, backoff_s=600.0, state_dir=Path(tmpdir))
+        tracker.record_failure(RuntimeError("quota exhausted"))
+
+        # Age the state file well past the TTL while the backoff is still running
+        state = json.loads(tracker.state_path.read_text())
+        state["updated"] -= 60
+        tracker.state_path.write_text(json.dumps(state))
+
+        reloaded = GeminiHealthTracker("persist", ttl_s=1.0, state_dir=Path(tmpdir))
+        assert reloaded.failures == 1
+        assert not reloaded.available() and not reloaded.acquire()
+        print("✓ Backoff longer than ttl_s survives a reload")
+
+        # Once retry_at has passed, stale state is dropped
+        state["retry_at"] = time.time() - 1
+        tracker.state_path.write_text(json.dumps(state))
+        expired = GeminiHealthTracker("persist", ttl_s=1.0, state_dir=Path(tmpdir))
+        assert expired.failures == 0 and expired.available()
+        print("✓ Expired backoff older than ttl_s is forgotten")
+
+
+def test_health_single_probe():
+    """Test that only one caller re-probes while the breaker is half-open."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = GeminiHealthTracker("probe", backoff_s=0.05, state_dir=Path(tmpdir))
+        tracker.record_failure(RuntimeError("503"))
+        assert not tracker.acquire()
+
+        time.sleep(0.1)
+        assert tracker.available()  # Status checks never claim the probe
+        grants = []
+        start = threading.Barrier(8)
+
+        def worker():
+            start.wait()
+            grants.append(tracker.acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert grants.count(True) == 1, f"{grants.count(True)} concurrent probes"
+        print("✓ 1 of 8 concurrent callers claimed the half-open probe")
+
+        tracker.record_success()
+        assert all(tracker.acquire() for _ in range(3))
+        print("✓ Successful probe reopens the route for everyone")
+
+
+def test_vertex_abandoned_calls():
+    """Test that Vertex calls past their deadline stay within max_in_flight and are not re-sent."""
+    client = make_client(GEMINI_MAX_IN_FLIGHT="2")
+    client.use_vertex_ai = True  # Exercise the thread-based deadline path
+    model = SlowModel(delay_s=0.5)
+
+    timeouts = 0
+    for n in range(4):
+        try:
+            client._generate_content(model, f"p{n}", None, deadline_s=0.05)
+        except TimeoutError:
+            timeouts += 1
+    assert timeouts == 4
+    assert model.calls == 2 and model.peak == 2, f"{model.calls} calls, peak {model.peak}"
+    print("✓ 4 timed-out requests started only max_in_flight=2 SDK calls")
+
+    # Retrying a timed-out call waits for the one still running
+    answer = client._generate_content(model, "p0", None, deadline_s=2.0)
+    assert answer == "answer to p0" and model.calls == 2
+    print("✓ Retry attached to the abandoned call instead of sending a duplicate")
+
+    # Slots come back once the abandoned calls return
+    time.sleep(0.5)
+    assert client._generate_content(model, "p9", None, deadline_s=2.0) == "answer to p9"
+    assert model.calls == 3 and model.peak <= 2
+    print("✓ Slots released when abandoned calls finish")
+
+
+def test_hedge_delay_p90():
+    """Test that the hedge delay is the p90 of recent Gemini latencies once enough are seen."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hybrid, _ = make_hybrid(StubBackend("g", 0), StubBackend("o", 0), Path(tmpdir), delay_s=3.0)
+        hybrid._gemini_latencies.extend([0.1] * 9)
+        assert hybrid.hedge_delay_s() == 3.0
+        print("✓ Default delay until HEDGE_MIN_SAMPLES latencies are seen")
+
+        hybrid._gemini_latencies.clear()
+        hybrid._gemini_latencies.extend(n / 100 for n in range(20, 0, -1))  # 0.01 .. 0.20 s
+        assert hybrid.hedge_delay_s() == 0.19, hybrid.hedge_delay_s()
+        print("✓ p90 of 20 samples (0.01-0.20s) is 0.19s")
+
+
+def test_hedge_fast_primary():
+    """Test that a primary answering before the hedge delay never starts the secondary."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gemini, ollama = StubBackend("g", 0.01, "gemini answer"), StubBackend("o", 0.01, "ollama answer")
+        hybrid, research_logger = make_hybrid(gemini, ollama, Path(tmpdir), delay_s=0.5)
+        result = hybrid.generate("prompt", prefer_gemini=True)
+
+        assert result["success"] and result["response"] == "gemini answer"
+        assert result["hedged"] is False and ollama.calls == 0
+        assert hybrid.hedge_stats == {'requests': 1, 'hedged': 0, 'gemini_wins': 1, 'ollama_wins': 0}
+        event = research_logger.rows("hedge_events")[0]
+        assert event["winner"] == "gemini" and not event["hedged"] and event["primary_ok"]
+        print("✓ Fast primary wins without a hedge")
+
+
+def test_hedge_slow_primary():
+    """Test that a slow primary is hedged, the secondary wins, and the loser is still accounted for."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        gemini, ollama = StubBackend("g", 0.4, "gemini answer"), StubBackend("o", 0.02, "ollama answer")
+        hybrid, research_logger = make_hybrid(gemini, ollama, Path(tmpdir), delay_s=0.05)
+        start = time.time()
+        result = hybrid.generate("prompt", prefer_gemini=True)
+        elapsed = time.time() - start
+
+        assert result["success"] and result["response"] == "ollama answer" and result["hedged"]
+        assert elapsed < 0.3, f"Waited {elapsed:.2f}s for the losing primary"
+        assert research_logger.rows("hedge_events") == [], "Logged before the primary finished"
+        print(f"✓ Ollama won after {elapsed:.2f}s without waiting for Gemini")
+
+        # The losing primary runs to completion; its outcome is logged when it finishes
+        assert gemini.finished.wait(2.0)
+        deadline = time.time() + 2.0
+        while not research_logger.rows("hedge_events") and time.time() < deadline:
+            time.sleep(0.01)
+        event = research_logger.rows("hedge_events")[0]
+        assert event["winner"] == "ollama" and event["hedged"] and event["primary_ok"]
+        assert event["saved_ms"] > 200, event
+        assert len(hybrid._gemini_latencies) == 1 and hybrid.health.failures == 0
+        print(f"✓ Losing primary finished and logged (saved {event['saved_ms']}ms, latency sampled)")
+
+
+def test_hedge_first_non_empty():
+    """Test that empty or failed answers never win the race."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Gemini answers first, but empty: the slower Ollama answer wins
+        gemini, ollama = StubBackend("g", 0.1, ""), StubBackend("o", 0.2, "ollama answer")
+        hybrid, _ = make_hybrid(gemini, ollama, Path(tmpdir), delay_s=0.05)
+        result = hybrid.generate("prompt", prefer_gemini=True)
+        assert result["response"] == "ollama answer" and result["model_used"] == "ollama (o)"
+        print("✓ Empty primary answer does not win")
+
+        # Gemini fails before the delay: Ollama starts immediately
+        gemini = StubBackend("g", 0.0, error=RuntimeError("503"))
+        ollama = StubBackend("o", 0.01, "ollama answer")
+        hybrid, _ = make_hybrid(gemini, ollama, Path(tmpdir), delay_s=5.0)
+        start = time.time()
+        result = hybrid.generate("prompt", prefer_gemini=True)
+        assert result["response"] == "ollama answer" and time.time() - start < 1.0
+        assert hybrid.health.failures == 1
+        print("✓ Failed primary hands over to Ollama without waiting out the delay")
+
+        # Both fail
+        hybrid.health.record_success()
+        hybrid.gemini_client = StubBackend("g", 0.0, error=RuntimeError("503"))
+        hybrid.ollama_client = StubBackend("o", 0.0, "")
+        result = hybrid.generate("prompt", prefer_gemini=True)
+        assert not result["success"] and result["model_used"] == "none" and "503" in result["error"]
+        print("✓ No usable answer from either backend is reported as a failure")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Gemini Client Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Health Persisted Backoff", test_health_persisted_backoff),
+        ("Health Single Probe", test_health_single_probe),
+        ("Vertex Abandoned Calls", test_vertex_abandoned_calls),
+        ("Hedge Delay p90", test_hedge_delay_p90),
+        ("Hedge Fast Primary", test_hedge_fast_primary),
+        ("Hedge Slow Primary", test_hedge_slow_primary),
+        ("Hedge First Non-Empty", test_hedge_first_non_empty)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
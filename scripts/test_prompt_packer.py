@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for token-budgeted prompt packing.
+
+Run with:
+    python scripts/test_prompt_packer.py
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from prompt_packer import DEFAULT_CHARS_PER_TOKEN, PromptPacker
+
+SIGNIFICANCE = ["breakthrough", "important", "useful", "incremental", "tangential"]
+
+
+def make_articles(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    articles = []
+    for i in range(n):
+        articles.append({
+            "title": f"Article {i}",
+            "technical_summary": "details " * rng.randint(20, 80),
+            "gemini_analysis": {
+                "significance": rng.choice(SIGNIFICANCE),
+                "relevance_score": round(rng.random(), 3)
+            }
+        })
+    return articles
+
+
+def format_full(number: int, article: dict) -> str:
+    return f"[{number}] {article['title']}\n{article['technical_summary']}"
+
+
+def format_brief(number: int, article: dict) -> str:
+    return f"[{number}] {article['title']}"
+
+
+def rank_key(article: dict) -> tuple:
+    analysis = article["gemini_analysis"]
+    return (5 - SIGNIFICANCE.index(analysis["significance"]), analysis["relevance_score"])
+
+
+def test_pack_within_budget():
+    """Test that packed text stays under budget_tokens across budgets."""
+    articles = make_articles(60)
+    for budget in (5, 50, 300, 1000, 5000, 100000):
+        packer = PromptPacker(budget)
+        packed = packer.pack(articles, format_full, format_brief)
+        assert packed.tokens <= budget, f"budget {budget}: used {packed.tokens}"
+        assert packer.count(packed.text) <= budget, f"budget {budget}: text counts {packer.count(packed.text)}"
+        assert packed.full_count + packed.brief_count + packed.dropped == len(articles)
+    print("✓ Packed text within budget from 5 to 100k tokens; every article accounted for")
+
+    roomy = PromptPacker(100000).pack(articles, format_full, format_brief)
+    assert roomy.full_count == len(articles) and roomy.dropped == 0
+    assert PromptPacker(0).pack(articles, format_full, format_brief).articles == []
+    print("✓ Large budget keeps everything in full; zero budget packs nothing")
+
+
+def test_priority_order():
+    """Test that entries are numbered in rank order and the lowest-ranked are dropped first."""
+    articles = make_articles(40, seed=1)
+    ranked = sorted(articles, key=rank_key, reverse=True)
+    packer = PromptPacker(120)
+    packed = packer.pack(articles, format_full, format_brief)
+
+    assert 0 < len(packed.articles) < len(articles), "Budget should drop some articles"
+    assert packed.articles == ranked[:len(packed.articles)], "Dropped articles are not the lowest-ranked"
+    lines = [line for line in packed.text.split("\n") if line.startswith("[")]
+    for number, (line, article) in enumerate(zip(lines, packed.articles), 1):
+        assert line == f"[{number}] {article['title']}", f"Citation [{number}] points to the wrong article"
+    print(f"✓ Kept the top {len(packed.articles)}/{len(articles)} by significance, then relevance; "
+          "[N] matches articles[N - 1]")
+
+    upgraded = PromptPacker(1500).pack(articles, format_full, format_brief)
+    assert 0 < upgraded.full_count < len(upgraded.articles)
+    for i, article in enumerate(upgraded.articles):
+        is_full = format_full(i + 1, article) in upgraded.text
+        assert is_full == (i < upgraded.full_count), "Full detail went to a lower-ranked entry"
+    print(f"✓ Full detail goes to the top {upgraded.full_count} entries, the rest stay one-liners")
+
+
+def test_calibrate():
+    """Test calibration from an exact count, and fallback when the counter has no answer."""
+    sample = "x" * 1000
+
+    packer = PromptPacker(100)
+    packer.calibrate(lambda text: 250, sample)
+    assert packer.chars_per_token == 4.0
+    packer.calibrate(lambda text: 500, sample)
+    assert packer.chars_per_token == 2.0
+    print("✓ chars_per_token fitted from one exact count")
+
+    def failing(text):
+        raise RuntimeError("count_tokens unavailable")
+
+    for counter in (lambda text: None, lambda text: 0, failing):
+        packer = PromptPacker(100)
+        packer.calibrate(counter, sample)
+        assert packer.chars_per_token == DEFAULT_CHARS_PER_TOKEN
+    called = []
+    PromptPacker(100).calibrate(lambda text: called.append(text), "")
+    assert not called, "Empty sample should not be counted"
+    print("✓ None, 0, an exception or an empty sample keep the default ratio")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Prompt Packer Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Pack Within Budget", test_pack_within_budget),
+        ("Priority Order", test_priority_order),
+        ("Calibrate", test_calibrate)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
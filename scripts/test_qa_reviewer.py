@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the Gemini QA reviewer (a stub client stands in for Gemini).
+
+Run with:
+    python scripts/test_qa_reviewer.py
+"""
+
+import re
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fetch_and_summarize import GeminiQAReviewer, QAAnalysis
+from result_cache import ResultCache
+
+
+def qa_answer(**overrides) -> dict:
+    """A schema-valid QA answer."""
+    answer = {
+        "quality_verdict": "pass",
+        "quality_confidence": 0.9,
+        "error_type": "none",
+        "relevance_score": 0.8,
+        "key_insight": "insight",
+        "significance": "useful",
+        "recommendation": "include"
+    }
+    answer.update(overrides)
+    return answer
+
+
+def make_article(n: int, source: str = "Test Feed") -> dict:
+    return {
+        "title": f"Article {n}",
+        "source": source,
+        "link": f"https://example.com/{n}",
+        "technical_summary": f"Technical summary {n}",
+        "lay_explanation": f"Lay explanation {n}"
+    }
+
+
+def batch_indices(prompt: str) -> list:
+    """article_index values of a batched QA prompt ([] for a single-article prompt)."""
+    return [int(n) for n in re.findall(r"### ARTICLE article_index=(\d+)", prompt)]
+
+
+class RecordingLogger:
+    """Collects research_logger.log() calls."""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def log(self, artifact_type, record, **kwargs):
+        with self._lock:
+            self.records.append((artifact_type, record))
+
+
+def review_all(client, n_articles: int, batch_size: int):
+    """Run a batched review; return the articles and the hallucination_matrix rows."""
+    research_logger = RecordingLogger()
+    reviewer = GeminiQAReviewer(client, "test", 0.5, research_logger=research_logger,
+                                pipelined=False, batch_size=batch_size)
+    articles = [make_article(n) for n in range(1, n_articles + 1)]
+    for n, article in enumerate(articles, 1):
+        reviewer.submit(n, article)
+    reviewer.finish()
+    rows = [r for artifact, r in research_logger.records if artifact == "hallucination_matrix"]
+    return articles, rows
+
+
+class StubClient:
+    """Stands in for GeminiClient.generate_json; reply(prompt, schema) decides the answer."""
+
+    model_name = "stub-gemini"
+    max_in_flight = 1
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def generate_json(self, prompt, schema, **kwargs):
+        with self._lock:
+            self.prompts.append(prompt)
+        return self.reply(prompt, schema)
+
+
+def test_cache_key_includes_source():
+    """Test that the same article from another source is not served a cached answer."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResultCache("gemini_qa", base_dir=Path(tmpdir))
+        client = StubClient(lambda prompt, schema: qa_answer())
+
+        for source in ("Feed A", "Feed A", "Feed B"):
+            reviewer = GeminiQAReviewer(client, "test", 0.5, pipelined=False, cache=cache)
+            article = make_article(1, source=source)
+            reviewer.submit(1, article)
+            reviewer.finish()
+            assert article["gemini_analysis"]["relevance_score"] == 0.8
+
+        assert len(client.prompts) == 2, f"{len(client.prompts)} Gemini calls, expected 2"
+        print("✓ Cache hit for the same source, miss for a different source")
+
+
+def test_batch_partial_answers():
+    """Test that missing, malformed and misnumbered batch elements are retried per article."""
+    def reply(prompt, schema):
+        indices = batch_indices(prompt)
+        if not indices:
+            return qa_answer(relevance_score=0.7)  # Single-article retry
+        answers = []
+        for idx in indices:
+            if idx == 1:
+                answers.append(dict(qa_answer(), article_index=idx))
+            elif idx == 2:
+                answers.append(dict(qa_answer(recommendation="maybe"), article_index=idx))  # Bad enum
+            elif idx == 3:
+                answers.append(dict(qa_answer(), article_index=99))  # Not in this batch
+            # idx 4: omitted
+        answers.append({"article_index": 1, "quality_verdict": "pass"})  # Malformed duplicate
+        return answers
+
+    client = StubClient(reply)
+    articles, rows = review_all(client, 4, batch_size=4)
+
+    assert all(a.get("gemini_analysis") for a in articles), "An article has no analysis"
+    assert [a["gemini_analysis"]["relevance_score"] for a in articles] == [0.8, 0.7, 0.7, 0.7]
+    assert sorted(r["artifact_id"] for r in rows) == sorted({r["artifact_id"] for r in rows})
+    assert len(rows) == 4, f"{len(rows)} hallucination_matrix rows for 4 articles"
+    assert [r["qa_batch_size"] for r in rows] == [4, 1, 1, 1]
+    # The 3 failed articles are retried as one batch, which fails again and is halved
+    sizes = [len(batch_indices(p)) or 1 for p in client.prompts]
+    assert sizes == [4, 3, 1, 2, 1, 1], sizes
+    print(f"✓ Valid element kept; bad enum, wrong article_index and missing element retried "
+          f"(request sizes {sizes})")
+
+
+def test_batch_total_failure_splits():
+    """Test that a batch with nothing usable is halved down to single-article prompts."""
+    def reply(prompt, schema):
+        if batch_indices(prompt):
+            raise ValueError("stub-gemini returned invalid JSON")
+        return qa_answer()
+
+    client = StubClient(reply)
+    articles, rows = review_all(client, 4, batch_size=4)
+
+    assert all(a.get("gemini_analysis") for a in articles)
+    assert len(rows) == 4 and all(r["parse_ok"] for r in rows)
+    sizes = [len(batch_indices(p)) or 1 for p in client.prompts]
+    assert sizes == [4, 2, 1, 1, 2, 1, 1], sizes
+    print(f"✓ Unparseable batches split 4 -> 2 -> 1 (request sizes {sizes})")
+
+
+def test_unusable_single_answer():
+    """Test that an article whose single-article answer is invalid still gets one row."""
+    client = StubClient(lambda prompt, schema: qa_answer(relevance_score=1.5))
+    articles, rows = review_all(client, 1, batch_size=1)
+
+    assert "gemini_analysis" not in articles[0]
+    assert len(rows) == 1 and rows[0]["parse_ok"] is False and rows[0]["verdict"] == "uncertain"
+    assert not articles[0].get("_drop"), "No score must not trip the theme gate"
+    print("✓ Out-of-range answer logged once as parse_ok=False, article kept")
+
+
+def test_qa_analysis_validation():
+    """Test that QAAnalysis.from_dict rejects answers outside the schema's enums and ranges."""
+    analysis = QAAnalysis.from_dict(qa_answer(quality_verdict="PASS", error_type=None))
+    assert analysis.quality_verdict == "pass" and analysis.error_type == "none"
+    print("✓ Valid answer accepted (verdict lower-cased, defaults filled)")
+
+    invalid = {
+        "verdict": qa_answer(quality_verdict="maybe"),
+        "significance": qa_answer(significance="huge"),
+        "recommendation": qa_answer(recommendation="maybe"),
+        "confidence > 1": qa_answer(quality_confidence=1.2),
+        "relevance < 0": qa_answer(relevance_score=-0.1),
+        "non-numeric score": qa_answer(relevance_score="high"),
+        "missing field": {k: v for k, v in qa_answer().items() if k != "significance"},
+        "key_insight type": qa_answer(key_insight=["a", "b"]),
+        "not an object": [qa_answer()],
+    }
+    for label, data in invalid.items():
+        try:
+            QAAnalysis.from_dict(data)
+        except ValueError:
+            continue
+        raise AssertionError(f"{label}: invalid answer accepted")
+    print(f"✓ {len(invalid)} invalid answers rejected with ValueError")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Gemini QA Reviewer Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Cache Key Includes Source", test_cache_key_includes_source),
+        ("Batch Partial Answers", test_batch_partial_answers),
+        ("Batch Total Failure Splits", test_batch_total_failure_splits),
+        ("Unusable Single Answer", test_unusable_single_answer),
+        ("QAAnalysis Validation", test_qa_analysis_validation)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared token-bucket rate limiter.
+
+Run with:
+    python scripts/test_rate_limiter.py
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rate_limiter import TokenBucketLimiter, FCNTL_AVAILABLE
+
+
+def test_quota_validation():
+    """Test that a non-positive RPM is rejected and a non-positive TPM means no token limit."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for rpm in (0, -5):
+            try:
+                TokenBucketLimiter("bad", rpm, state_dir=Path(tmpdir))
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"requests_per_minute={rpm} accepted")
+        print("✓ RPM <= 0 rejected at construction")
+
+        for tpm in (0, -1, None):
+            limiter = TokenBucketLimiter(f"tpm_{tpm}", 600, tpm, state_dir=Path(tmpdir))
+            assert limiter.tokens_per_minute is None
+            limiter.acquire(tokens=10_000_000)  # No token bucket to wait on
+        print("✓ TPM <= 0 means no token limit")
+
+
+def test_shared_state_file():
+    """Test that two limiters on one state file together respect the RPM."""
+    if not FCNTL_AVAILABLE:
+        print("⊘ Skipped (fcntl not available)")
+        return
+
+    rpm = 600  # One request per 0.1 s
+    per_limiter = 5
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Separate objects share nothing in-process; only the locked state file
+        limiters = [TokenBucketLimiter("shared", rpm, state_dir=Path(tmpdir)) for _ in range(2)]
+        grants = []
+        grants_lock = threading.Lock()
+        start = threading.Barrier(len(limiters))
+
+        def worker(limiter):
+            start.wait()
+            for _ in range(per_limiter):
+                limiter.acquire()
+                with grants_lock:
+                    grants.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker, args=(limiter,)) for limiter in limiters]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        grants.sort()
+        total = len(limiters) * per_limiter
+        interval = 60.0 / rpm
+        span = grants[-1] - grants[0]
+        # A full bucket (burst 1) allows one request immediately, then one per interval
+        assert span >= (total - 1) * interval * 0.9, \
+            f"{total} requests in {span:.2f}s exceeds {rpm} RPM"
+        print(f"✓ Shared state file: {total} requests from 2 limiters took {span:.2f}s at {rpm} RPM")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Rate Limiter Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Quota Validation", test_quota_validation),
+        ("Shared State File", test_shared_state_file)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the local relevance model.
+
+Run with:
+    python scripts/test_relevance_model.py
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from relevance_model import RelevanceModel, outcome_label, relevance_text
+
+ON_THEME = ["alignment", "interpretability", "verification", "provenance", "audit", "oversight"]
+OFF_THEME = ["earnings", "smartphone", "football", "recipe", "fashion", "celebrity"]
+FILLER = ["new", "report", "study", "team", "week", "results", "update", "today"]
+
+
+def toy_examples(n: int, seed: int = 0):
+    """Separable toy set: kept articles use on-theme words, dropped ones off-theme words."""
+    rng = random.Random(seed)
+    examples = []
+    for i in range(n):
+        label = float(i % 2)
+        topic = ON_THEME if label else OFF_THEME
+        words = rng.sample(topic, 3) + rng.sample(FILLER, 4)
+        rng.shuffle(words)
+        examples.append((relevance_text(" ".join(words[:3]), " ".join(words[3:]), "Feed"), label))
+    return examples
+
+
+def test_learns_separable_set():
+    """Test that online updates separate a toy set and generalize to unseen examples."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model = RelevanceModel(Path(tmpdir) / "model.npz")
+        untrained = [model.predict(text) for text, _ in toy_examples(10, seed=1)]
+        assert all(p == 0.5 for p in untrained), "Fresh model should predict 0.5"
+
+        for _ in range(3):
+            for text, label in toy_examples(200):
+                model.update(text, label)
+        assert model.n_updates == 600
+
+        held_out = toy_examples(100, seed=7)
+        correct = sum((model.predict(text) >= 0.5) == bool(label) for text, label in held_out)
+        assert correct == len(held_out), f"{correct}/{len(held_out)} held-out examples correct"
+        print(f"✓ {correct}/{len(held_out)} held-out toy examples classified correctly")
+
+
+def test_save_load_roundtrip():
+    """Test that save() and load() restore identical predictions and training state."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "models" / "relevance_model.npz"
+        model = RelevanceModel(path)
+        for text, label in toy_examples(50):
+            model.update(text, label)
+        model.save()
+        assert path.exists() and not list(path.parent.glob("*.tmp")), "Atomic save left a tmp file"
+
+        loaded = RelevanceModel.load(path)
+        assert loaded.n_updates == model.n_updates == 50
+        assert np.array_equal(loaded.weights, model.weights)
+        assert np.array_equal(loaded.grad_sq, model.grad_sq)
+        assert loaded.bias == model.bias and loaded.bias_grad_sq == model.bias_grad_sq
+        for text, _ in toy_examples(10, seed=3):
+            assert loaded.predict(text) == model.predict(text)
+        print("✓ Weights, AdaGrad state and predictions survive save/load")
+
+        # Training continues identically from the restored state
+        text, label = toy_examples(1, seed=5)[0]
+        assert loaded.update(text, label) == model.update(text, label)
+        assert np.array_equal(loaded.weights, model.weights)
+        print("✓ Training resumes from the restored state")
+
+        missing = RelevanceModel.load(Path(tmpdir) / "absent.npz")
+        assert missing.n_updates == 0
+        path.write_bytes(b"not an npz file")
+        corrupt = RelevanceModel.load(path)
+        assert corrupt.n_updates == 0 and not corrupt.weights.any()
+        print("✓ Missing or unreadable files start a fresh model")
+
+
+def test_outcome_label():
+    """Test the Gemini QA outcome -> training label thresholds."""
+    assert outcome_label(0.6, "exclude", 0.6) == 1.0  # At the threshold is kept; score wins
+    assert outcome_label(0.59, "must-include", 0.6) == 0.0
+    assert outcome_label("0.8", None, 0.6) == 1.0
+    print("✓ theme_score >= threshold decides, regardless of the recommendation")
+
+    assert outcome_label(None, "must-include", 0.6) == 1.0
+    assert outcome_label(None, "include", 0.6) == 1.0
+    assert outcome_label(None, "exclude", 0.6) == 0.0
+    assert outcome_label("n/a", "exclude", 0.6) == 0.0
+    print("✓ Recommendation is the fallback when no usable score was returned")
+
+    assert outcome_label(None, "consider", 0.6) is None
+    assert outcome_label(None, None, 0.6) is None
+    print("✓ Uninformative outcomes produce no label")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Relevance Model Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Learns Separable Set", test_learns_separable_set),
+        ("Save/Load Round-Trip", test_save_load_roundtrip),
+        ("Outcome Label", test_outcome_label)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the weekly blog map phase (a stub client stands in for Gemini).
+
+Run with:
+    python scripts/test_weekly_blog.py
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_weekly_blog import WEEKLY_MAP_VERSION, build_clusters, run_map_phase
+from result_cache import ResultCache
+
+
+def make_articles(days: dict) -> list:
+    """(number, article) pairs numbered globally; days maps brief date -> article count."""
+    numbered = []
+    for day, count in days.items():
+        for _ in range(count):
+            number = len(numbered) + 1
+            numbered.append((number, {"title": f"Article {number}", "_brief_date": day}))
+    return numbered
+
+
+def format_full(number: int, article: dict) -> str:
+    return f"\n[{number}] {article['title']} ({article['_brief_date']})\n"
+
+
+def format_brief(number: int, article: dict) -> str:
+    return f"[{number}] {article['title']}"
+
+
+class StubGeminiClient:
+    """Stands in for GeminiClient.generate_many; failing_labels make those cluster calls fail."""
+
+    model_name = "stub-gemini"
+
+    def __init__(self, failing_labels=()):
+        self.failing_labels = set(failing_labels)
+        self.batches = []
+
+    def generate_many(self, requests):
+        self.batches.append(requests)
+        results = []
+        for request in requests:
+            label = re.search(r"below \((.*?)\)", request["prompt"]).group(1)
+            if label in self.failing_labels:
+                results.append({"response": "", "success": False, "error": "503"})
+            else:
+                cited = re.findall(r"\[\d+\]", request["prompt"])
+                results.append({"response": f"Notes on {label}: {' '.join(cited)}", "success": True})
+        return results
+
+
+def test_build_clusters():
+    """Test per-day grouping, splitting of large days and global [N] numbering."""
+    # Rank order interleaves days; numbers are global ranks
+    numbered = make_articles({"2025-11-04": 2, "2025-11-03": 5, "Unknown date": 1})
+    numbered.append((9, {"title": "Undated"}))
+    clusters = build_clusters(list(reversed(numbered)), max_size=2)
+
+    labels = [label for label, _ in clusters]
+    assert labels == [
+        "2025-11-03, part 1/3", "2025-11-03, part 2/3", "2025-11-03, part 3/3",
+        "2025-11-04", "Unknown date"
+    ], labels
+    print("✓ Days in date order; a 5-article day split into 3 parts of at most 2")
+
+    numbers = [[number for number, _ in members] for _, members in clusters]
+    assert numbers == [[3, 4], [5, 6], [7], [1, 2], [8, 9]], numbers
+    assert sorted(n for part in numbers for n in part) == list(range(1, 10))
+    print("✓ Global numbers kept, ascending within each cluster, each article exactly once")
+
+    assert [label for label, _ in build_clusters(numbered, max_size=40)] == [
+        "2025-11-03", "2025-11-04", "Unknown date"
+    ]
+    print("✓ Days within max_size stay whole")
+
+
+def test_map_cache_reuse():
+    """Test that a rerun with the same inputs is served entirely from the cache."""
+    clusters = build_clusters(make_articles({"2025-11-03": 3, "2025-11-04": 2}), max_size=2)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResultCache("weekly_map", version=WEEKLY_MAP_VERSION, base_dir=Path(tmpdir))
+
+        first = StubGeminiClient()
+        notes = run_map_phase(first, clusters, format_full, format_brief, "test", cache=cache)
+        assert len(first.batches) == 1 and len(first.batches[0]) == len(clusters)
+        assert notes[0] == "Notes on 2025-11-03, part 1/2: [1] [2]", notes[0]
+        print(f"✓ First run: {len(clusters)} cluster calls in one generate_many batch")
+
+        rerun = StubGeminiClient()
+        assert run_map_phase(rerun, clusters, format_full, format_brief, "test", cache=cache) == notes
+        assert rerun.batches == [], "generate_many called on a fully cached rerun"
+        print("✓ Rerun: generate_many called zero times, identical notes")
+
+
+def test_map_failure_fallback():
+    """Test that a failed cluster falls back to its one-line entries and is retried next run."""
+    clusters = build_clusters(make_articles({"2025-11-03": 2, "2025-11-04": 2}), max_size=40)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResultCache("weekly_map", version=WEEKLY_MAP_VERSION, base_dir=Path(tmpdir))
+
+        client = StubGeminiClient(failing_labels={"2025-11-04"})
+        notes = run_map_phase(client, clusters, format_full, format_brief, "test", cache=cache)
+        assert notes[0].startswith("Notes on 2025-11-03")
+        assert notes[1] == "[3] Article 3\n[4] Article 4", notes[1]
+        print("✓ Failed cluster replaced by its brief lines, so [3] and [4] stay citable")
+
+        retry = StubGeminiClient()
+        notes = run_map_phase(retry, clusters, format_full, format_brief, "test", cache=cache)
+        assert [len(batch) for batch in retry.batches] == [1], "Only the failed cluster should be retried"
+        assert notes[1].startswith("Notes on 2025-11-04")
+        print("✓ Fallback notes are not cached; the next run retries only that cluster")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Weekly Blog Map Phase Tests")
+    print("=" * 60)
+    print()
+
+    tests = [
+        ("Build Clusters", test_build_clusters),
+        ("Map Cache Reuse", test_map_cache_reuse),
+        ("Map Failure Fallback", test_map_failure_fallback)
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)